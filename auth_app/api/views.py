@@ -1,3 +1,4 @@
+from django.db import transaction
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
@@ -15,8 +16,10 @@ class RegestrationView(APIView):
 
         try:
             if serializer.is_valid():
-                new_user = serializer.save()
-                token, created = Token.objects.get_or_create(user=new_user)
+                # user, profile (profiles_app.signals) and token are committed together
+                with transaction.atomic():
+                    new_user = serializer.save()
+                    token, created = Token.objects.get_or_create(user=new_user)
                 return Response(
                     {
                         "token": token.key,
@@ -62,4 +65,4 @@ class CustomLoginView(ObtainAuthToken):
             return Response(
                 {"error": "Internal server error."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
\ No newline at end of file
+            )
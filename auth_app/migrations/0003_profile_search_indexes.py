@@ -0,0 +1,39 @@
+# Generated by Django 5.2.4 on 2026-10-18 10:43
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("auth_app", "0002_userprofile_type_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="userprofile",
+            index=models.Index(
+                models.F("type"),
+                django.db.models.functions.text.Lower("username"),
+                name="user_type_username_lower_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="userprofile",
+            index=models.Index(
+                models.F("type"),
+                django.db.models.functions.text.Lower("first_name"),
+                name="user_type_first_name_lower_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="userprofile",
+            index=models.Index(
+                models.F("type"),
+                django.db.models.functions.text.Lower("last_name"),
+                name="user_type_last_name_lower_idx",
+            ),
+        ),
+    ]
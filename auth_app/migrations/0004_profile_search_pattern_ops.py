@@ -0,0 +1,42 @@
+from django.db import migrations
+
+"""
+On PostgreSQL the lower-cased search indexes of migration 0003 are rebuilt with varchar_pattern_ops,
+so the LIKE 'prefix%' matches of profiles_app.search can seek them under any database collation
+(a plain btree index only serves LIKE under the "C" collation).
+Index names and expressions stay the same, other database vendors keep the plain expression indexes.
+"""
+
+SEARCH_INDEXES = {
+    "user_type_username_lower_idx": "username",
+    "user_type_first_name_lower_idx": "first_name",
+    "user_type_last_name_lower_idx": "last_name",
+}
+
+
+def rebuild_search_indexes(schema_editor, opclass):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for name, column in SEARCH_INDEXES.items():
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+        schema_editor.execute(f"CREATE INDEX {name} ON auth_app_userprofile (type, LOWER({column}) {opclass})")
+
+
+def use_pattern_ops(apps, schema_editor):
+    rebuild_search_indexes(schema_editor, "varchar_pattern_ops")
+
+
+def use_default_ops(apps, schema_editor):
+    rebuild_search_indexes(schema_editor, "")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth_app", "0003_profile_search_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(use_pattern_ops, use_default_ops),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser
 
 
@@ -14,5 +16,16 @@ class UserProfile(AbstractUser):
         default=UserType.CUSTOMER,
     )
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # type filters of profile lists, info stats and the admin user filters (covering username lookups)
+            models.Index(fields=["type", "username"], name="user_type_username_idx"),
+            # case-insensitive prefix ?search= of the profile lists (profiles_app.search),
+            # rebuilt with varchar_pattern_ops on PostgreSQL by migration 0004
+            models.Index(F("type"), Lower("username"), name="user_type_username_lower_idx"),
+            models.Index(F("type"), Lower("first_name"), name="user_type_first_name_lower_idx"),
+            models.Index(F("type"), Lower("last_name"), name="user_type_last_name_lower_idx"),
+        ]
+
     def __str__(self):
         return self.username
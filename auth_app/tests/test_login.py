@@ -57,3 +57,11 @@ class loginTest(BaseUserSetup):
         data["password"] = "wrongPassword"
         response = self.client.post(self.url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_login_query_count(self):
+        self.client.post(self.url, self.valid_data_customer, format="json")
+
+        # user lookup, existing token lookup - no user or profile write
+        with self.assertNumQueries(2):
+            response = self.client.post(self.url, self.valid_data_customer, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,28 @@
+from django.contrib.auth import get_user_model
+
+from core.testing import QueryPlanTestCase
+
+User = get_user_model()
+
+
+class UserTypeQueryPlanTestCase(QueryPlanTestCase):
+
+    @classmethod
+    def seed(cls):
+        User.objects.bulk_create(
+            User(username=f"user_{number}", type="business" if number % 10 == 0 else "customer")
+            for number in range(cls.seed_size)
+        )
+
+    def test_count_by_type(self):
+        """
+        Test if counting the business users (info stats) only reads user_type_username_idx.
+        """
+        self.assertIndexScan(User.objects.filter(type="business"))
+
+    def test_usernames_by_type(self):
+        """
+        Test if a page of the admin user type filters reads the usernames from user_type_username_idx in order.
+        """
+        queryset = User.objects.filter(type="business").values_list("username", flat=True).order_by("username")[:100]
+        self.assertIndexScan(queryset, ordered=True)
@@ -1,7 +1,11 @@
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
+from unittest.mock import patch
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError
 
+User = get_user_model()
 
 
 class registrationTest(APITestCase):
@@ -13,14 +17,14 @@ class registrationTest(APITestCase):
             "email": "customer@mail.de",
             "password": "securePassword123",
             "repeated_password": "securePassword123",
-            "type": "customer"
+            "type": "customer",
         }
         self.valid_data_business = {
             "username": "businessUser",
             "email": "business@mail.de",
             "password": "securePassword123",
             "repeated_password": "securePassword123",
-            "type": "business"
+            "type": "business",
         }
 
     def test_registration_customer_success(self):
@@ -32,7 +36,19 @@ class registrationTest(APITestCase):
         response = self.client.post(self.url, self.valid_data_business, format="json")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertIn("token", response.data)
-    
+
+    def test_registration_creates_profile(self):
+        response = self.client.post(self.url, self.valid_data_business, format="json")
+        user = User.objects.select_related("profile").get(pk=response.data["user_id"])
+        self.assertEqual(user.profile.location, "")
+
+    def test_registration_rolls_back_with_profile(self):
+        with patch("profiles_app.signals.Profile.objects.create", side_effect=DatabaseError):
+            response = self.client.post(self.url, self.valid_data_customer, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertFalse(User.objects.filter(username="customerUser").exists())
+
     def test_registration_password_mismatch(self):
         data = self.valid_data_customer.copy()
         data["repeated_password"] = "wrongPassword"
@@ -53,4 +69,4 @@ class registrationTest(APITestCase):
         data["type"] = "invalid_type"
         response = self.client.post(self.url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn("type", response.data)
\ No newline at end of file
+        self.assertIn("type", response.data)
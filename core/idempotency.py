@@ -0,0 +1,93 @@
+import hashlib
+import json
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+"""
+Idempotency-Key support for create endpoints. The first request with a key runs the view under a lock,
+its successful response is stored for IDEMPOTENCY_KEY_TTL seconds and replayed for retries of the same
+key without touching the write path. Keys are scoped to the user and the path, a concurrent duplicate
+gets a 409, reusing a key with another payload a 422. Failed requests are not stored and may be retried.
+"""
+
+CACHE_ALIAS = "idempotency"
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+LOCK_TIMEOUT = 30
+
+
+def get_cache():
+    return caches[CACHE_ALIAS]
+
+
+def idempotency_cache_key(user_id, path, key):
+    digest = hashlib.sha256(f"{user_id}:{path}:{key}".encode()).hexdigest()
+    return f"idempotency:{digest}"
+
+
+def request_fingerprint(request):
+    data = dict(request.data.lists()) if hasattr(request.data, "lists") else request.data
+    payload = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def replay(stored, fingerprint):
+    if stored["fingerprint"] != fingerprint:
+        return Response(
+            {"detail": f"The {IDEMPOTENCY_HEADER} was already used with a different request body."},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    return Response(stored["data"], status=stored["status"], headers={REPLAYED_HEADER: "true"})
+
+
+def idempotent(view_method):
+    """
+    Decorator for view handlers (e.g. create) honouring an Idempotency-Key request header.
+    """
+
+    @wraps(view_method)
+    def wrapper(view, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return view_method(view, request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            raise ValidationError({IDEMPOTENCY_HEADER: f"Must be at most {MAX_KEY_LENGTH} characters."})
+
+        cache_key, fingerprint = idempotency_cache_key(request.user.pk, request.path, key), request_fingerprint(request)
+        stored = get_cache().get(cache_key)
+        if stored is None:
+            return run_locked(view_method, cache_key, fingerprint, view, request, *args, **kwargs)
+        return replay(stored, fingerprint)
+
+    return wrapper
+
+
+def run_locked(view_method, cache_key, fingerprint, view, request, *args, **kwargs):
+    """
+    Runs the view while holding the lock of the key and stores a successful response.
+    """
+    cache = get_cache()
+    if not cache.add(f"{cache_key}:lock", True, timeout=LOCK_TIMEOUT):
+        return Response(
+            {"detail": f"A request with this {IDEMPOTENCY_HEADER} is still in progress."},
+            status=status.HTTP_409_CONFLICT,
+        )
+
+    try:
+        stored = cache.get(cache_key)  # finished while we waited for the lock
+        if stored is not None:
+            return replay(stored, fingerprint)
+
+        response = view_method(view, request, *args, **kwargs)
+        if status.is_success(response.status_code):
+            stored = {"fingerprint": fingerprint, "status": response.status_code, "data": response.data}
+            cache.set(cache_key, stored, timeout=settings.IDEMPOTENCY_KEY_TTL)
+        return response
+    finally:
+        cache.delete(f"{cache_key}:lock")
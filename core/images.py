@@ -0,0 +1,194 @@
+import logging
+import posixpath
+import queue
+import threading
+from functools import partial
+from io import BytesIO
+
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.db import close_old_connections, transaction
+from django.db.models.fields.files import FieldFile
+from django.dispatch import Signal
+from PIL import Image, ImageOps, UnidentifiedImageError
+from rest_framework import serializers
+
+"""
+Background image processing for uploaded ImageFields (Offer.image, Profile.file).
+A model using it has three companion columns per image field: <field>_width, <field>_height
+and <field>_variants, a JSON object {"source": <processed file name>, "<variant>": <path>, ...}.
+Uploads only get a header check in the request, decoding and resizing happens on a local worker thread
+after the transaction commits.
+"""
+
+logger = logging.getLogger(__name__)
+
+# sent with the model class as sender after the variants of an image were recorded
+image_processed = Signal()
+
+VARIANTS = {
+    "thumbnail": (320, 320),
+    "webp": (1600, 1600),
+}
+WEBP_QUALITY = 80
+VARIANT_QUERY_PARAM = "image_variant"
+
+
+def validate_image_header(file):
+    """
+    Cheap upload check: Pillow only reads the header here, the image is decoded by the worker.
+    """
+    try:
+        with Image.open(file):
+            pass
+    except (UnidentifiedImageError, OSError):
+        raise ValidationError("Upload a valid image.")
+    finally:
+        file.seek(0)
+
+
+class ImageWorker:
+    """
+    Single daemon thread draining an in-process queue of image jobs.
+    """
+
+    def __init__(self):
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def submit(self, func, *args):
+        self.ensure_started()
+        self.queue.put((func, args))
+
+    def ensure_started(self):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name="image-worker", daemon=True)
+                self.thread.start()
+
+    def run(self):
+        while True:
+            func, args = self.queue.get()
+            try:
+                func(*args)
+            except Exception:
+                logger.exception("Image job %s%r failed", func.__name__, args)
+            finally:
+                close_old_connections()
+                self.queue.task_done()
+
+
+worker = ImageWorker()
+
+
+def enqueue_image_processing(instance, field_name):
+    """
+    post_save helper: schedules processing when the stored file differs from the processed one,
+    clears the recorded variants when the image was removed.
+    """
+    file = getattr(instance, field_name)
+    variants = getattr(instance, f"{field_name}_variants") or {}
+
+    if not file:
+        if variants:
+            type(instance)._default_manager.filter(pk=instance.pk).update(**image_columns(field_name, None, None, {}))
+        return
+
+    if variants.get("source") != file.name:
+        transaction.on_commit(partial(submit_image_job, instance._meta.label, instance.pk, field_name))
+
+
+def submit_image_job(model_label, pk, field_name):
+    if getattr(settings, "IMAGE_PROCESSING_EAGER", False):
+        process_image(model_label, pk, field_name)
+    else:
+        worker.submit(process_image, model_label, pk, field_name)
+
+
+def image_columns(field_name, width, height, variants):
+    return {f"{field_name}_width": width, f"{field_name}_height": height, f"{field_name}_variants": variants}
+
+
+def process_image(model_label, pk, field_name):
+    """
+    Decodes the current file once, writes all variants and records them,
+    unless the file was replaced in the meantime.
+    """
+    manager = apps.get_model(model_label)._default_manager
+    instance = manager.filter(pk=pk).first()
+    file = getattr(instance, field_name, None)
+    if not file:
+        return
+
+    try:
+        width, height, variants = render_variants(file)
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError) as exc:
+        width, height, variants = None, None, {"source": file.name, "error": str(exc)}
+
+    columns = image_columns(field_name, width, height, variants)
+    if manager.filter(pk=pk, **{field_name: file.name}).update(**columns):
+        delete_variants(file.storage, getattr(instance, f"{field_name}_variants") or {}, keep=variants)
+        image_processed.send(sender=manager.model, pk=pk, field_name=field_name)
+    else:
+        delete_variants(file.storage, variants)
+
+
+def render_variants(file):
+    with file.open("rb"), Image.open(file) as image:
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info or "A" in image.getbands() else "RGB")
+
+        variants = {"source": file.name}
+        for name, size in VARIANTS.items():
+            variants[name] = save_variant(file, image, name, size)
+
+        return image.width, image.height, variants
+
+
+def save_variant(file, image, name, size):
+    """
+    Saves a resized WebP copy, no exif / icc / xmp info is passed on, which strips the metadata.
+    """
+    variant = image.copy()
+    variant.thumbnail(size)
+
+    buffer = BytesIO()
+    variant.save(buffer, "WEBP", quality=WEBP_QUALITY)
+
+    directory, filename = posixpath.split(file.name)
+    stem = posixpath.splitext(filename)[0]
+    path = posixpath.join(directory, "variants", f"{stem}_{name}.webp")
+    return file.storage.save(path, ContentFile(buffer.getvalue()))
+
+
+def delete_variants(storage, variants, keep=None):
+    kept_paths = set((keep or {}).values())
+    for name, path in variants.items():
+        if name in VARIANTS and path not in kept_paths:
+            storage.delete(path)
+
+
+class VariantImageField(serializers.ImageField):
+    """
+    Read side ImageField returning the processed variant named in ?image_variant=
+    (thumbnail / webp) when it exists, the original upload otherwise.
+    """
+
+    @property
+    def extra_sources(self):
+        return [f"{self.source}_variants"]
+
+    def to_representation(self, value):
+        request = self.context.get("request")
+        variant = request.query_params.get(VARIANT_QUERY_PARAM) if request is not None else None
+
+        if value and variant in VARIANTS:
+            variants = getattr(value.instance, f"{value.field.name}_variants", None) or {}
+            if variants.get("source") == value.name and variant in variants:
+                value = FieldFile(value.instance, value.field, variants[variant])
+
+        return super().to_representation(value)
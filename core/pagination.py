@@ -0,0 +1,188 @@
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination seeking on the active ordering field with the primary key as tiebreaker.
+    Never runs a COUNT query and deep pages cost the same as the first one.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = 5
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    default_ordering = "id"
+    tiebreaker = "id"
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.field, self.descending = self.get_ordering(queryset, view)
+        self.model_field = queryset.model._meta.get_field(self.field)
+
+        queryset = queryset.order_by(*self.get_order_by())
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self.seek(*position))
+
+        rows = list(queryset[: self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        return min(page_size, self.max_page_size) if page_size > 0 else self.page_size
+
+    def get_ordering(self, queryset, view):
+        """
+        Returns (field, descending) of the first ordering term applied by the filters,
+        as long as it is one of the view's ordering_fields, otherwise the default ordering.
+        """
+        allowed = set(getattr(view, "ordering_fields", None) or []) | {self.tiebreaker}
+        ordering = queryset.query.order_by
+
+        if ordering and isinstance(ordering[0], str) and ordering[0].lstrip("-") in allowed:
+            term = ordering[0]
+        else:
+            term = self.default_ordering
+
+        return term.lstrip("-"), term.startswith("-")
+
+    def get_order_by(self):
+        if self.field == self.tiebreaker:
+            return [F(self.field).desc() if self.descending else F(self.field).asc()]
+
+        nulls_last = True if self.model_field.null else None
+        direction = "desc" if self.descending else "asc"
+        return [
+            getattr(F(self.field), direction)(nulls_last=nulls_last),
+            getattr(F(self.tiebreaker), direction)(),
+        ]
+
+    def seek(self, value, pk):
+        """
+        Rows strictly after (value, pk) in the current ordering, NULL values sorting last.
+        """
+        lookup = "lt" if self.descending else "gt"
+        after_pk = Q(**{f"{self.tiebreaker}__{lookup}": pk})
+
+        if self.field == self.tiebreaker:
+            return after_pk
+
+        if value is None:
+            return Q(**{f"{self.field}__isnull": True}) & after_pk
+
+        after = Q(**{f"{self.field}__{lookup}": value}) | (Q(**{self.field: value}) & after_pk)
+        if self.model_field.null:
+            after |= Q(**{f"{self.field}__isnull": True})
+        return after
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+
+        last = self.page[-1]
+        value = getattr(last, self.field)
+        position = [None if value is None else self.model_field.value_to_string(last), last.pk]
+        cursor = base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request):
+        """
+        Returns (value, pk) from the cursor parameter, None for the first page.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            value, pk = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            value = None if value is None else self.model_field.to_python(value)
+            return value, int(pk)
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+
+class OptionalPageNumberPagination(PageNumberPagination):
+    """
+    Page number pagination that only applies when the request carries ?page= or ?page_size=,
+    so endpoints that always returned a plain list keep doing so for existing clients.
+    With unpaginated_limit set, that plain list is cut off after unpaginated_limit rows.
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    unpaginated_limit = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        self.unpaginated = self.page_query_param not in params and self.page_size_query_param not in params
+        if self.unpaginated:
+            if self.unpaginated_limit is None:
+                return None
+            return list(queryset[: self.unpaginated_limit])
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.unpaginated:
+            return Response(data)
+        return super().get_paginated_response(data)
+
+
+class TiebreakerOrderingFilter(OrderingFilter):
+    """
+    OrderingFilter appending the primary key in the direction of the last term,
+    so rows with equal values keep one stable order across pages.
+    """
+
+    tiebreaker = "id"
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering or ordering[-1].lstrip("-") == self.tiebreaker:
+            return ordering
+
+        direction = "-" if ordering[-1].startswith("-") else ""
+        return [*ordering, f"{direction}{self.tiebreaker}"]
+
+
+class CursorPaginationMixin:
+    """
+    View mixin switching to cursor_pagination_class when the request carries the cursor parameter,
+    so clients opt into keyset pagination with ?cursor= (empty for the first page).
+    """
+
+    cursor_pagination_class = None
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            cursor_class = self.cursor_pagination_class
+
+            if cursor_class and cursor_class.cursor_query_param in self.request.query_params:
+                self._paginator = cursor_class()
+            else:
+                return super().paginator
+
+        return self._paginator
@@ -118,6 +118,23 @@ else:
     }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# OFFERS_CACHE_URL accepts e.g. locmemcache://offers, filecache:///var/tmp/coderr-offers or redis://host:6379/1
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "offers": env.cache_url("OFFERS_CACHE_URL", default="locmemcache://offers"),
+    "idempotency": env.cache_url("IDEMPOTENCY_CACHE_URL", default="locmemcache://idempotency"),
+}
+
+OFFERS_CACHE_TIMEOUT = env.int("OFFERS_CACHE_TIMEOUT", default=300)
+IDEMPOTENCY_KEY_TTL = env.int("IDEMPOTENCY_KEY_TTL", default=86400)
+PLATFORM_STATS_CACHE_TTL = env.int("PLATFORM_STATS_CACHE_TTL", default=10)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -158,6 +175,10 @@ STATIC_ROOT = BASE_DIR / "static"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Uploaded images are resized / converted by core.images on a background thread,
+# IMAGE_PROCESSING_EAGER runs the jobs inline after commit instead (tests, management shells)
+IMAGE_PROCESSING_EAGER = env.bool("IMAGE_PROCESSING_EAGER", default=False)
+
 STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 
 # Default primary key field type
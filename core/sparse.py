@@ -0,0 +1,121 @@
+from rest_framework.relations import RelatedField
+
+"""
+Sparse fieldsets for list / detail GET endpoints: ?fields=id,title keeps only the named top level fields,
+?omit=description drops them. The serializer mixin trims the serialized fields, the view mixin narrows the
+queryset to what the remaining fields read: unused columns are deferred, unused select_related / prefetch
+relations are dropped.
+"""
+
+FIELDS_QUERY_PARAM = "fields"
+OMIT_QUERY_PARAM = "omit"
+
+
+def split_names(value):
+    return {name.strip() for name in (value or "").split(",") if name.strip()}
+
+
+def is_sparse_request(request):
+    params = request.query_params
+    return request.method == "GET" and (FIELDS_QUERY_PARAM in params or OMIT_QUERY_PARAM in params)
+
+
+def select_fields(request, names):
+    """
+    Returns the field names kept by ?fields= / ?omit=, in serializer order.
+    """
+    requested = split_names(request.query_params.get(FIELDS_QUERY_PARAM))
+    omitted = split_names(request.query_params.get(OMIT_QUERY_PARAM))
+
+    return [name for name in names if (not requested or name in requested) and name not in omitted]
+
+
+def read_attributes(field):
+    """
+    Top level instance attributes a serializer field reads, "*" when it reads the whole instance.
+    """
+    if field.source == "*":
+        return {"*"}
+    if isinstance(field, RelatedField) and field.use_pk_only_optimization():
+        return set()  # reads the always loaded foreign key column
+    return {field.source_attrs[0], *getattr(field, "extra_sources", ())}
+
+
+def narrow_queryset(queryset, fields, keep=()):
+    """
+    Defers concrete columns and drops select_related / prefetch_related lookups
+    that none of the given (bound) serializer fields read. Columns in keep are never deferred.
+    """
+    needed = set(keep).union(*(read_attributes(field) for field in fields))
+    if "*" in needed:
+        return queryset
+
+    deferred = [
+        field.name
+        for field in queryset.model._meta.concrete_fields
+        if not field.is_relation and not field.primary_key and field.name not in needed
+    ]
+    queryset = narrow_relations(queryset, needed)
+    return queryset.defer(*deferred) if deferred else queryset
+
+
+def related_paths(tree, prefix=""):
+    """
+    Flattens a select_related tree ({"user": {"rating_summary": {}}}) into lookups ("user__rating_summary").
+    """
+    paths = []
+    for name, children in tree.items():
+        paths.extend(related_paths(children, f"{prefix}{name}__") if children else [f"{prefix}{name}"])
+    return paths
+
+
+def narrow_relations(queryset, needed):
+    select_related = queryset.query.select_related
+    if isinstance(select_related, dict):
+        related = [path for path in related_paths(select_related) if path.split("__")[0] in needed]
+        queryset = queryset.select_related(None)
+        queryset = queryset.select_related(*related) if related else queryset
+
+    lookups = queryset._prefetch_related_lookups
+    if lookups:
+        kept = [lookup for lookup in lookups if str(getattr(lookup, "prefetch_to", lookup)).split("__")[0] in needed]
+        queryset = queryset.prefetch_related(None).prefetch_related(*kept)
+
+    return queryset
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin trimming the top level fields of GET responses to ?fields= / ?omit=.
+    Nested serializers and write requests always get the full field set.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+
+        if request is None or not is_sparse_request(request) or not self.is_root():
+            return fields
+
+        return {name: fields[name] for name in select_fields(request, fields)}
+
+    def is_root(self):
+        parent = self.parent
+        return parent is None or parent.parent is None and getattr(parent, "child", None) is self
+
+
+class SparseQuerysetMixin:
+    """
+    View mixin narrowing filter_queryset() to the fields a sparse GET request serializes.
+    Fields in sparse_keep_columns (e.g. ordering / cursor fields) are always loaded.
+    """
+
+    sparse_keep_columns = ()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not is_sparse_request(self.request):
+            return queryset
+
+        fields = self.get_serializer().fields.values()
+        return narrow_queryset(queryset, fields, keep=self.sparse_keep_columns)
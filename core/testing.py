@@ -0,0 +1,81 @@
+import re
+from abc import ABCMeta, abstractmethod
+
+from django.db import connection
+from django.test import TestCase
+
+"""
+EXPLAIN based test harness for hot queries.
+QueryPlanTestCase seeds a large dataset once per class, refreshes the planner statistics and fails a test
+when the plan of a hot query reads one of its tables sequentially or sorts rows an index should deliver in order.
+"""
+
+SEQUENTIAL_SCAN_PATTERNS = {
+    "sqlite": re.compile(r"\bSCAN (?P<table>\w+)(?! USING| VIRTUAL)"),
+    "postgresql": re.compile(r"\bSeq Scan on (?P<table>\w+)"),
+}
+SORT_PATTERNS = {
+    "sqlite": re.compile(r"USE TEMP B-TREE FOR ORDER BY"),
+    "postgresql": re.compile(r"^\s*(->\s*)?Sort\b", re.MULTILINE),
+}
+
+
+def explain(queryset):
+    return queryset.explain()
+
+
+def sequential_scans(plan, tables=None):
+    """
+    Returns the tables read by a sequential scan in the plan, limited to the given tables.
+    """
+    pattern = SEQUENTIAL_SCAN_PATTERNS.get(connection.vendor)
+    if pattern is None:
+        return []
+
+    scanned = {match.group("table") for match in pattern.finditer(plan)}
+    return sorted(scanned if tables is None else scanned & set(tables))
+
+
+def sorts_rows(plan):
+    pattern = SORT_PATTERNS.get(connection.vendor)
+    return bool(pattern and pattern.search(plan))
+
+
+class QueryPlanTestCase(TestCase, metaclass=ABCMeta):
+    """
+    Abstract base class for query plan tests: subclasses implement seed() with bulk inserts of seed_size rows,
+    the planner statistics are refreshed afterwards so it sees a realistic table size.
+    The assertions are checked on SQLite in the regular test run; PostgreSQL's cost based planner only
+    prefers the indexes over sequential scans from a larger table size on, so it is seeded with more rows.
+    """
+
+    # large enough for the planner to prefer the indexes, small enough to seed quickly
+    seed_size = 1_000
+    seed_sizes = {"postgresql": 20_000}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.seed_size = cls.seed_sizes.get(connection.vendor, cls.seed_size)
+        cls.seed()
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    @classmethod
+    @abstractmethod
+    def seed(cls):
+        """
+        Bulk inserts the rows the plans are checked against.
+        """
+
+    def assertIndexScan(self, queryset, ordered=False):
+        """
+        Fails when the plan scans a table of the query sequentially, or sorts although ordered=True
+        states the index already returns the rows in the requested order.
+        """
+        plan = explain(queryset)
+        tables = {join.table_name for join in queryset.query.alias_map.values()} | {queryset.model._meta.db_table}
+
+        scans = sequential_scans(plan, tables)
+        self.assertFalse(scans, f"Sequential scan on {', '.join(scans)}:\n{plan}")
+        if ordered:
+            self.assertFalse(sorts_rows(plan), f"Rows are sorted instead of read in index order:\n{plan}")
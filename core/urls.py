@@ -17,7 +17,7 @@ Including another URLconf
 
 from django.contrib import admin
 from django.urls import path, include
-from orders_app.api.views import OrderCountView, CompletedOrderCountView
+from orders_app.api.views import OrderCountView, CompletedOrderCountView, OrderStatsBatchView, OrderSLAView
 from info_app.views import base_infoView
 from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 
@@ -35,6 +35,8 @@ urlpatterns = [
         CompletedOrderCountView.as_view(),
         name="completed-order-count",
     ),
+    path("api/order-stats/", OrderStatsBatchView.as_view(), name="order-stats"),
+    path("api/order-sla/", OrderSLAView.as_view(), name="order-sla"),
     path("api/reviews/", include("reviews_app.api.urls")),
     path("api/base-info/", base_infoView.as_view(), name="base-info-view"),
 ] + staticfiles_urlpatterns()
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from info_app.models import PlatformStats
+from info_app.stats import STATS_COLUMNS, STATS_PK, compute_stats, rebuild_stats
+
+
+class Command(BaseCommand):
+    """
+    Recounts the PlatformStats row from users, offers and reviews, or verifies it with --check.
+    Meant to run periodically (e.g. nightly cron) to repair drift from bulk writes that bypass the signals.
+    """
+
+    help = "Recount the platform stats behind base-info, or verify them with --check."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report stats that differ from the tables, do not write.",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            return self.check_stats()
+
+        rebuild_stats()
+        self.stdout.write(self.style.SUCCESS("Rebuilt the platform stats."))
+
+    def check_stats(self):
+        """
+        Compares the stored and computed stats, raises CommandError when any column differs.
+        """
+        expected = compute_stats()
+        stored = PlatformStats.objects.filter(pk=STATS_PK).values(*STATS_COLUMNS).first() or {}
+
+        stale = [column for column in STATS_COLUMNS if stored.get(column) != expected[column]]
+        if stale:
+            raise CommandError(f"Platform stats out of sync: {', '.join(stale)}")
+
+        self.stdout.write(self.style.SUCCESS("The platform stats are in sync."))
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.4 on 2026-10-18 10:41
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_platform_stats(apps, schema_editor):
+    UserProfile = apps.get_model("auth_app", "UserProfile")
+    Offer = apps.get_model("offers_app", "Offer")
+    Review = apps.get_model("reviews_app", "Review")
+    PlatformStats = apps.get_model("info_app", "PlatformStats")
+
+    PlatformStats.objects.create(
+        pk=1,
+        business_profile_count=UserProfile.objects.filter(type="business").count(),
+        offer_count=Offer.objects.count(),
+        **Review.objects.aggregate(review_count=Count("id"), rating_sum=Coalesce(Sum("rating"), 0)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("auth_app", "0002_userprofile_type_index"),
+        ("offers_app", "0006_composite_indexes"),
+        ("reviews_app", "0005_review_ordering_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PlatformStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("business_profile_count", models.IntegerField(default=0)),
+                ("offer_count", models.IntegerField(default=0)),
+                ("review_count", models.IntegerField(default=0)),
+                ("rating_sum", models.IntegerField(default=0)),
+            ],
+            options={
+                "verbose_name_plural": "Platform stats",
+            },
+        ),
+        migrations.RunPython(backfill_platform_stats, migrations.RunPython.noop),
+    ]
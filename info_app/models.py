@@ -1,3 +1,23 @@
 from django.db import models
 
-# Create your models here.
+
+class PlatformStats(models.Model):
+    """
+    Single row of platform wide counters behind the base-info endpoint,
+    maintained by info_app.signals and reconciled by the reconcile_platform_stats command.
+    """
+
+    business_profile_count = models.IntegerField(default=0)
+    offer_count = models.IntegerField(default=0)
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = "Platform stats"
+
+    def __str__(self):
+        return "Platform stats"
+
+    @property
+    def average_rating(self):
+        return round(self.rating_sum / self.review_count, 2) if self.review_count else 0
@@ -0,0 +1,61 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from info_app.stats import change_stats
+from offers_app.models import Offer
+from reviews_app.models import Review
+
+"""
+Signals keeping the PlatformStats row in sync with business user, offer and review creates,
+changes and deletes. Queryset update() / bulk_create() bypass them: the offers bulk import
+adds its count explicitly, run the reconcile_platform_stats command after other bulk writes.
+"""
+
+User = get_user_model()
+
+
+@receiver(post_init, sender=User)
+def remember_saved_type(sender, instance, **kwargs):
+    instance._stats_type = instance.__dict__.get("type")
+
+
+@receiver(post_save, sender=User)
+def count_business_user_on_save(sender, instance, created, **kwargs):
+    was_business = not created and instance._stats_type == "business"
+    change_stats(business_profile_count=(instance.type == "business") - was_business)
+    instance._stats_type = instance.type
+
+
+@receiver(post_delete, sender=User)
+def count_business_user_on_delete(sender, instance, **kwargs):
+    change_stats(business_profile_count=-(instance._stats_type == "business"))
+
+
+@receiver(post_save, sender=Offer)
+def count_offer_on_save(sender, instance, created, **kwargs):
+    change_stats(offer_count=int(created))
+
+
+@receiver(post_delete, sender=Offer)
+def count_offer_on_delete(sender, instance, **kwargs):
+    change_stats(offer_count=-1)
+
+
+@receiver(post_init, sender=Review)
+def remember_stats_rating(sender, instance, **kwargs):
+    instance._stats_rating = instance.__dict__.get("rating")
+
+
+@receiver(post_save, sender=Review)
+def count_review_on_save(sender, instance, created, **kwargs):
+    if created:
+        change_stats(review_count=1, rating_sum=instance.rating)
+    else:
+        change_stats(rating_sum=instance.rating - (instance._stats_rating or instance.rating))
+    instance._stats_rating = instance.rating
+
+
+@receiver(post_delete, sender=Review)
+def count_review_on_delete(sender, instance, **kwargs):
+    change_stats(review_count=-1, rating_sum=-(instance._stats_rating or instance.rating))
@@ -0,0 +1,75 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce
+
+from info_app.models import PlatformStats
+from offers_app.models import Offer
+from reviews_app.models import Review
+
+"""
+Platform stats for base-info: one PlatformStats row updated incrementally on user, offer and review writes,
+read through a short lived in-process cache so the landing page costs at most one primary key lookup.
+"""
+
+User = get_user_model()
+
+STATS_PK = 1
+STATS_COLUMNS = ["business_profile_count", "offer_count", "review_count", "rating_sum"]
+
+_cached = {"data": None, "expires_at": 0.0}
+
+
+def compute_stats():
+    """
+    Counts all stats from the source tables (reconciliation only, scans them).
+    """
+    reviews = Review.objects.aggregate(review_count=Count("id"), rating_sum=Coalesce(Sum("rating"), 0))
+    return {
+        "business_profile_count": User.objects.filter(type="business").count(),
+        "offer_count": Offer.objects.count(),
+        **reviews,
+    }
+
+
+def rebuild_stats():
+    stats, _ = PlatformStats.objects.update_or_create(pk=STATS_PK, defaults=compute_stats())
+    return stats
+
+
+def change_stats(**deltas):
+    """
+    Adds the given column deltas to the stats row in one UPDATE, a missing row is rebuilt from the tables.
+    """
+    deltas = {column: delta for column, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    updates = {column: F(column) + delta for column, delta in deltas.items()}
+    if not PlatformStats.objects.filter(pk=STATS_PK).update(**updates):
+        rebuild_stats()
+
+
+def clear_stats_cache():
+    _cached.update(data=None, expires_at=0.0)
+
+
+def get_platform_stats():
+    """
+    Returns the base-info payload, cached in process for PLATFORM_STATS_CACHE_TTL seconds.
+    """
+    now = time.monotonic()
+    if _cached["data"] is not None and now < _cached["expires_at"]:
+        return _cached["data"]
+
+    stats = PlatformStats.objects.filter(pk=STATS_PK).first() or rebuild_stats()
+    data = {
+        "review_count": stats.review_count,
+        "average_rating": stats.average_rating,
+        "business_profile_count": stats.business_profile_count,
+        "offer_count": stats.offer_count,
+    }
+    _cached.update(data=data, expires_at=now + settings.PLATFORM_STATS_CACHE_TTL)
+    return data
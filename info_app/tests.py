@@ -1,3 +1,100 @@
-from django.test import TestCase
+from decimal import Decimal
+from io import StringIO
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from info_app.models import PlatformStats
+from info_app.stats import clear_stats_cache
+from offers_app.bulk import import_offers
+from offers_app.models import Offer
+from reviews_app.models import Review
+
+User = get_user_model()
+
+
+class PlatformStatsTestCase(APITestCase):
+
+    def setUp(self):
+        clear_stats_cache()
+        self.business_user = User.objects.create_user(username="business_test", password="testpass123", type="business")
+        self.customer_user = User.objects.create_user(username="customer_test", password="testpass123", type="customer")
+        self.offer = Offer.objects.create(user=self.business_user, title="Logo", description="Logo design")
+        self.review = Review.objects.create(business_user=self.business_user, reviewer=self.customer_user, rating=4)
+
+    def get_stats(self):
+        clear_stats_cache()
+        return self.client.get(reverse("base-info-view")).data
+
+    def test_base_info_single_lookup(self):
+        """Test if base-info reads one stats row and is then served from the in-process cache."""
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("base-info-view"))
+        with self.assertNumQueries(0):
+            self.client.get(reverse("base-info-view"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            {"review_count": 1, "average_rating": 4.0, "business_profile_count": 1, "offer_count": 1},
+        )
+
+    @override_settings(PLATFORM_STATS_CACHE_TTL=0)
+    def test_stats_follow_writes(self):
+        """Test if updates and deletes of users, offers and reviews move the counters."""
+        self.review.rating = 2
+        self.review.save()
+        self.assertEqual(self.get_stats()["average_rating"], 2.0)
+
+        self.customer_user.type = "business"
+        self.customer_user.save()
+        self.assertEqual(self.get_stats()["business_profile_count"], 2)
+
+        self.business_user.delete()
+        self.assertEqual(
+            self.get_stats(),
+            {"review_count": 0, "average_rating": 0, "business_profile_count": 1, "offer_count": 0},
+        )
+
+    def test_rating_figures_follow_new_reviews(self):
+        """Test if a new review moves the base-info review count and average rating."""
+        other_customer = User.objects.create_user(username="customer_2", password="testpass123", type="customer")
+        Review.objects.create(business_user=self.business_user, reviewer=other_customer, rating=1)
+
+        stats = self.get_stats()
+        self.assertEqual(stats["review_count"], 2)
+        self.assertEqual(stats["average_rating"], 2.5)
+
+    def test_bulk_import_counts_offers(self):
+        """Test if the offers bulk import, which skips the signals, adds its offers."""
+        details = [
+            {
+                "title": offer_type,
+                "revisions": 1,
+                "delivery_time_in_days": 1,
+                "price": Decimal("10"),
+                "features": [],
+                "offer_type": offer_type,
+            }
+            for offer_type in ["basic", "standard", "premium"]
+        ]
+        import_offers(self.business_user, [{"title": "Bulk", "description": "Bulk", "details": details}] * 2)
+
+        self.assertEqual(self.get_stats()["offer_count"], 3)
+
+    def test_reconcile_command(self):
+        """Test if the reconcile command detects and repairs drift from writes that bypass the signals."""
+        Review.objects.update(rating=1)
+        PlatformStats.objects.all().delete()
+
+        with self.assertRaises(CommandError):
+            call_command("reconcile_platform_stats", "--check", stdout=StringIO())
+
+        call_command("reconcile_platform_stats", stdout=StringIO())
+        call_command("reconcile_platform_stats", "--check", stdout=StringIO())
+        self.assertEqual(self.get_stats()["average_rating"], 1.0)
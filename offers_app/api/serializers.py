@@ -1,10 +1,29 @@
+from functools import cache
+from django.urls import reverse
 from rest_framework import serializers
 from offers_app.models import Offer, OfferDetail
 from rest_framework.response import Response
+from django.db import transaction
 from django.contrib.auth import get_user_model
+from core.images import VariantImageField, validate_image_header
+from core.sparse import SparseFieldsetMixin
 
 User = get_user_model()
 
+PK_PLACEHOLDER = "__pk__"
+REQUIRED_OFFER_TYPES = {"basic", "standard", "premium"}
+
+
+def has_required_offer_types(details):
+    """
+    Checks the offer rule: exactly three details, one each of basic, standard and premium.
+    """
+    if not isinstance(details, list) or len(details) != 3:
+        return False
+
+    provided_types = {str(detail.get("offer_type", "")).lower() for detail in details if isinstance(detail, dict)}
+    return provided_types == REQUIRED_OFFER_TYPES
+
 
 class OfferDetailSerializer(serializers.ModelSerializer):
     """
@@ -52,9 +71,20 @@ class UserDetailsSerializer(serializers.ModelSerializer):
         fields = ["first_name", "last_name", "username"]
 
 
+@cache
+def offerdetail_path_parts():
+    """
+    Returns (prefix, suffix) of the offerdetail detail path, reversed once per process.
+    """
+    path = reverse("offerdetails:offerdetails-detail", kwargs={"pk": PK_PLACEHOLDER})
+    prefix, suffix = path.split(PK_PLACEHOLDER)
+    return prefix, suffix
+
+
 class OfferDetailLinkSerializer(serializers.HyperlinkedModelSerializer):
     """
     Serializer for linking to OfferDetail instances via URLs.
+    The URL template is built once per serializer (one per response) and filled with the pk per object.
     """
 
     url = serializers.SerializerMethodField()
@@ -64,6 +94,13 @@ class OfferDetailLinkSerializer(serializers.HyperlinkedModelSerializer):
         fields = ["id", "url"]
 
     def get_url(self, obj):
+        if not hasattr(self, "_url_parts"):
+            self._url_parts = self.build_url_parts()
+
+        prefix, suffix = self._url_parts
+        return f"{prefix}{obj.pk}{suffix}"
+
+    def build_url_parts(self):
         request = self.context.get("request")
         if request and hasattr(request, "resolver_match"):
             if (
@@ -71,20 +108,20 @@ class OfferDetailLinkSerializer(serializers.HyperlinkedModelSerializer):
                 or request.method == "GET"
                 and not request.resolver_match.kwargs
             ):
-                return f"/offerdetails/{obj.pk}/"
+                return "/offerdetails/", "/"
 
-        from django.urls import reverse
+        prefix, suffix = offerdetail_path_parts()
+        return request.build_absolute_uri(prefix), suffix
 
-        return request.build_absolute_uri(reverse("offerdetails:offerdetails-detail", kwargs={"pk": obj.pk}))
 
-
-class OfferListSerializer(serializers.ModelSerializer):
+class OfferListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
-    Serializer for listing offers with related details and user info.
+    Serializer for listing offers with related details and user info, supports ?fields= / ?omit=.
     """
 
     user_details = UserDetailsSerializer(source="user", read_only=True)
     details = OfferDetailLinkSerializer(many=True, read_only=True)
+    image = VariantImageField(read_only=True)
     min_price = serializers.FloatField(read_only=True)
     min_delivery_time = serializers.IntegerField(read_only=True)
 
@@ -111,12 +148,14 @@ class OfferCreateSerializer(serializers.ModelSerializer):
     """
 
     details = OfferDetailSerializer(many=True)
+    image = serializers.FileField(required=False, allow_null=True, validators=[validate_image_header])
 
     class Meta:
         model = Offer
         fields = ["id", "title", "image", "description", "details"]
         read_only_fields = ["id"]
 
+    @transaction.atomic
     def create(self, validated_data):
         details_data = validated_data.pop("details")
 
@@ -134,12 +173,30 @@ class OfferCreateSerializer(serializers.ModelSerializer):
         return offer
 
 
+class OfferBulkItemSerializer(serializers.ModelSerializer):
+    """
+    Validates one offer of a bulk import, the rows are written by offers_app.bulk.import_offers.
+    """
+
+    details = OfferDetailSerializer(many=True)
+
+    class Meta:
+        model = Offer
+        fields = ["title", "description", "details"]
+
+    def validate_details(self, value):
+        if not has_required_offer_types(value):
+            raise serializers.ValidationError("An offer needs exactly one basic, standard and premium detail.")
+        return value
+
+
 class OfferUpdateSerializer(serializers.ModelSerializer):
     """
     Serializer for updating offers and their details.
     """
 
     details = OfferDetailSerializer(many=True, required=False)
+    image = serializers.FileField(required=False, allow_null=True, validators=[validate_image_header])
 
     class Meta:
         model = Offer
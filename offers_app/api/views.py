@@ -1,17 +1,30 @@
 from rest_framework import viewsets, status, permissions, mixins
+from rest_framework.decorators import action
 from django_filters.rest_framework import DjangoFilterBackend, FilterSet, NumberFilter
 from rest_framework.response import Response
 from rest_framework import filters
 from offers_app.models import Offer, OfferDetail
-from django.db.models import Min
+from django.db import transaction
 from offers_app.api.serializers import (
     OfferListSerializer,
     OfferCreateSerializer,
     OfferUpdateSerializer,
     OfferDetailSerializer,
+    OfferBulkItemSerializer,
+    has_required_offer_types,
 )
+from rest_framework.parsers import JSONParser
+from core.parsers import NDJSONParser
 from rest_framework.pagination import PageNumberPagination
+from core.pagination import CursorPaginationMixin, KeysetPagination
+from core.sparse import SparseQuerysetMixin
+from core.idempotency import idempotent
 from offers_app.api.permissions import OffersPermission
+from offers_app.pricing import summarize_details
+from offers_app.search import OfferSearchFilter
+from offers_app.cache import list_cache_key, get_cached_list, store_list, get_cache_stats, facets_cache_key, get_or_set
+from offers_app.facets import get_requested_facets, compute_facets
+from offers_app.bulk import import_offers, BULK_MAX_ITEMS
 
 
 class CustomPagination(PageNumberPagination):
@@ -24,6 +37,16 @@ class CustomPagination(PageNumberPagination):
     max_page_size = 100
 
 
+class OfferCursorPagination(KeysetPagination):
+    """
+    Opt-in keyset pagination for Offer endpoints (?cursor=), pages by the active ordering without counting.
+    """
+
+    page_size = 5
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
 class OfferFilter(FilterSet):
     """
     FilterSet for filtering offers by creator, delivery time, and price.
@@ -38,7 +61,7 @@ class OfferFilter(FilterSet):
         fields = ["min_price", "max_delivery_time", "creator_id"]
 
 
-class OfferViewSet(viewsets.ModelViewSet):
+class OfferViewSet(SparseQuerysetMixin, CursorPaginationMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Offer objects: list, create, update, delete.
     Handles filtering, searching, ordering, and custom validation for offer details.
@@ -48,6 +71,7 @@ class OfferViewSet(viewsets.ModelViewSet):
     serializer_class = OfferListSerializer
     permission_classes = [OffersPermission]
     pagination_class = CustomPagination
+    cursor_pagination_class = OfferCursorPagination
 
     serializer_action_classes = {
         "list": OfferListSerializer,
@@ -59,73 +83,147 @@ class OfferViewSet(viewsets.ModelViewSet):
 
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        OfferSearchFilter,
         filters.OrderingFilter,
     ]
 
     filterset_class = OfferFilter
     search_fields = ["title", "description"]
     ordering_fields = ["updated_at", "min_price"]
+    sparse_keep_columns = ordering_fields
 
     def get_queryset(self):
         return (
-            Offer.objects.select_related()
+            Offer.objects.select_related("user")
             .prefetch_related("details")
-            .annotate(
-                min_price=Min("details__price"),
-                min_delivery_time=Min("details__delivery_time_in_days"),
-            )
             .order_by("id")  # Ensure consistent ordering
         )
 
     def get_serializer_class(self):
         return self.serializer_action_classes.get(self.action, self.serializer_class)
 
+    def list(self, request, *args, **kwargs):
+        """
+        Anonymous list responses are served from the versioned offers cache.
+        """
+        if request.user.is_authenticated:
+            return super().list(request, *args, **kwargs)
+
+        key = list_cache_key(request)
+        data = get_cached_list(key)
+        if data is not None:
+            return Response(data, headers={"X-Cache": "HIT"})
+
+        response = super().list(request, *args, **kwargs)
+        store_list(key, response.data)
+        response["X-Cache"] = "MISS"
+        return response
+
+    def get_paginated_response(self, data):
+        """
+        Adds the ?facets= bucket counts of the filtered (unpaginated) queryset next to the page.
+        """
+        names = get_requested_facets(self.request)
+        response = super().get_paginated_response(data)
+
+        if names:
+            queryset = self.filter_queryset(self.get_queryset())
+            key = facets_cache_key(self.request, names)
+            response.data["facets"] = get_or_set(key, lambda: compute_facets(queryset, names))
+
+        return response
+
+    @action(detail=False, methods=["get"], url_path="cache-stats", permission_classes=[permissions.IsAdminUser])
+    def cache_stats(self, request):
+        """
+        Hit ratio and bytes served by the offers list cache, for sizing it.
+        """
+        return Response(get_cache_stats(), status=status.HTTP_200_OK)
+
+    @idempotent
     def create(self, request, *args, **kwargs):
-        details = request.data.get("details", [])
-
-        if len(details) != 3:
+        if not has_required_offer_types(request.data.get("details", [])):
             return Response(
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        required_types = {"basic", "standard", "premium"}
-        provided_types = {detail.get("offer_type", "").lower() for detail in details}
+        return super().create(request, *args, **kwargs)
 
-        if provided_types != required_types:
+    @action(detail=False, methods=["post"], url_path="bulk", parser_classes=[JSONParser, NDJSONParser])
+    @idempotent
+    def bulk(self, request):
+        """
+        Imports a JSON array or NDJSON stream of offers, all or nothing.
+        Invalid items are reported as {"index", "errors"} and nothing is written.
+        """
+        items = request.data
+        if not isinstance(items, list) or not 0 < len(items) <= BULK_MAX_ITEMS:
             return Response(
-                status=status.HTTP_400_BAD_REQUEST,
+                {"error": f"Expected a list of 1 to {BULK_MAX_ITEMS} offers."}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        return super().create(request, *args, **kwargs)
+        serializer = OfferBulkItemSerializer(data=items, many=True, context={"request": request})
+        if not serializer.is_valid():
+            errors = [{"index": index, "errors": error} for index, error in enumerate(serializer.errors) if error]
+            return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        offers = import_offers(request.user, serializer.validated_data)
+        return Response({"created": len(offers), "ids": [offer.pk for offer in offers]}, status=status.HTTP_201_CREATED)
 
+    @transaction.atomic
     def partial_update(self, request, *args, **kwargs):
+        """
+        Updates the offer and its details with the prefetched detail rows,
+        one bulk_update and one offer save, and answers from the in-memory objects, details ordered by price.
+        """
         instance = self.get_object()
+        details = {detail.offer_type: detail for detail in instance.details.all()}
 
         details_data = request.data.pop("details", [])
-        for detail_data in details_data:
-            offer_type = detail_data.get("offer_type")
-            if offer_type is None:
-                return Response({"error": "offer_type is required in details"}, status=status.HTTP_400_BAD_REQUEST)
-
-            detail_obj = instance.details.get(offer_type=detail_data["offer_type"])
-            detail_serializer = OfferDetailSerializer(
-                detail_obj,
-                data=detail_data,
-                partial=True,
-                context={"request": request},
-            )
-            detail_serializer.is_valid(raise_exception=True)
-            detail_serializer.save()
+        changed_details, changed_fields, error = self.apply_details(details, details_data, request)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
 
         offer_serializer = self.get_serializer(instance, data=request.data, partial=True)
         offer_serializer.is_valid(raise_exception=True)
+
+        if changed_details:
+            OfferDetail.objects.bulk_update(changed_details, changed_fields)
+
+        for attr, value in summarize_details(list(details.values())).items():
+            setattr(instance, attr, value)
         offer_serializer.save()
 
-        instance.refresh_from_db()
-        instance._prefetched_objects_cache = {}
+        data = self.get_serializer(instance).data
+        ordered_details = sorted(details.values(), key=lambda detail: detail.price)
+        data["details"] = OfferDetailSerializer(ordered_details, many=True, context=self.get_serializer_context()).data
+        return Response(data, status=status.HTTP_200_OK)
+
+    def apply_details(self, details, details_data, request):
+        """
+        Validates all detail payloads against the loaded rows and applies them in memory.
+        Returns (changed details, changed field names, error message).
+        """
+        changed_details, changed_fields = {}, set()
+
+        for detail_data in details_data:
+            offer_type = detail_data.get("offer_type")
+            if offer_type is None:
+                return None, None, "offer_type is required in details"
+            if offer_type not in details:
+                return None, None, f"offer has no detail of type {offer_type}"
 
-        return Response(self.get_serializer(instance).data, status=status.HTTP_200_OK)
+            serializer = OfferDetailSerializer(
+                details[offer_type], data=detail_data, partial=True, context={"request": request}
+            )
+            serializer.is_valid(raise_exception=True)
+
+            for attr, value in serializer.validated_data.items():
+                setattr(details[offer_type], attr, value)
+                changed_fields.add(attr)
+            changed_details[offer_type] = details[offer_type]
+
+        return list(changed_details.values()), sorted(changed_fields), None
 
 
 class OfferDetailsView(mixins.RetrieveModelMixin, mixins.UpdateModelMixin, viewsets.GenericViewSet):
@@ -141,3 +239,7 @@ class OfferDetailsView(mixins.RetrieveModelMixin, mixins.UpdateModelMixin, views
 
     def list(self, request):
         return Response(status=404)
+
+    @transaction.atomic
+    def perform_update(self, serializer):
+        serializer.save()
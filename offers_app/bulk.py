@@ -0,0 +1,47 @@
+from django.db import transaction
+
+from info_app.stats import change_stats
+from offers_app.cache import invalidate_offers
+from offers_app.models import Offer, OfferDetail
+from offers_app.pricing import summarize_details
+from offers_app.search import batched, get_search_backend
+
+"""
+Bulk import of offers with their details.
+bulk_create skips the model signals, so pricing columns are computed in memory
+and the search index, list cache and platform offer count are refreshed explicitly once per import.
+"""
+
+BULK_CHUNK_SIZE = 500
+BULK_MAX_ITEMS = 5_000
+
+
+@transaction.atomic
+def import_offers(user, items, chunk_size=BULK_CHUNK_SIZE):
+    """
+    Writes validated offer payloads (title, description, details) in chunks,
+    two INSERTs per chunk. Returns the created offers in input order.
+    """
+    offers = []
+    for chunk in batched(items, chunk_size):
+        offers.extend(create_chunk(user, chunk))
+
+    get_search_backend().index([offer.pk for offer in offers])
+    invalidate_offers()
+    change_stats(offer_count=len(offers))
+    return offers
+
+
+def create_chunk(user, items):
+    details_per_offer = [[OfferDetail(**detail) for detail in item["details"]] for item in items]
+    offers = [
+        Offer(user=user, title=item["title"], description=item["description"], **summarize_details(details))
+        for item, details in zip(items, details_per_offer)
+    ]
+    Offer.objects.bulk_create(offers)
+
+    for offer, details in zip(offers, details_per_offer):
+        for detail in details:
+            detail.offer = offer
+    OfferDetail.objects.bulk_create([detail for details in details_per_offer for detail in details])
+    return offers
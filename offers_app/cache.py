@@ -0,0 +1,152 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+"""
+Versioned response cache for the anonymous offers list.
+Every key contains the current "offers generation", bumping it on any Offer / OfferDetail / user name write
+invalidates all cached pages at once, old generations simply expire.
+"""
+
+CACHE_ALIAS = "offers"
+GENERATION_KEY = "offers:generation"
+STATS_KEYS = {
+    "hits": "offers:stats:hits",
+    "misses": "offers:stats:misses",
+    "bytes_served": "offers:stats:bytes_served",
+}
+CACHED_QUERY_PARAMS = (
+    "creator_id",
+    "min_price",
+    "max_delivery_time",
+    "search",
+    "ordering",
+    "page",
+    "page_size",
+    "cursor",
+    "image_variant",
+    "facets",
+    "fields",
+    "omit",
+)
+FILTER_QUERY_PARAMS = ("creator_id", "min_price", "max_delivery_time", "search")
+
+
+def get_cache():
+    return caches[CACHE_ALIAS]
+
+
+def initial_generation():
+    """
+    Time based start value, so a generation lost to eviction never falls back to an older one.
+    """
+    return time.time_ns() // 1_000_000
+
+
+def get_generation():
+    cache = get_cache()
+    generation = cache.get(GENERATION_KEY)
+
+    if generation is None:
+        cache.add(GENERATION_KEY, initial_generation(), timeout=None)
+        generation = cache.get(GENERATION_KEY)
+
+    return generation
+
+
+def bump_generation():
+    cache = get_cache()
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.add(GENERATION_KEY, initial_generation(), timeout=None)
+
+
+def invalidate_offers():
+    """
+    Bumps the generation now and again after commit, so a request that read
+    the old rows while the write was still open can't keep them cached.
+    """
+    bump_generation()
+    transaction.on_commit(bump_generation)
+
+
+def query_signature(request, names, *extra):
+    """
+    Hash of the normalized (whitelisted, sorted, stripped) query parameters plus extra key parts.
+    """
+    params = sorted(
+        (name, tuple(value.strip() for value in request.query_params.getlist(name)))
+        for name in names
+        if name in request.query_params
+    )
+    return hashlib.sha256(repr((*extra, params)).encode()).hexdigest()
+
+
+def list_cache_key(request):
+    """
+    Builds the cache key from the host and the normalized query string.
+    """
+    return f"offers:list:{get_generation()}:{query_signature(request, CACHED_QUERY_PARAMS, request.get_host())}"
+
+
+def facets_cache_key(request, names):
+    """
+    Facet counts only depend on the filter parameters, not on page, ordering or host.
+    """
+    return f"offers:facets:{get_generation()}:{query_signature(request, FILTER_QUERY_PARAMS, names)}"
+
+
+def get_cached_list(key):
+    """
+    Returns the cached response data or None, recording the hit / miss.
+    """
+    cache = get_cache()
+    entry = cache.get(key)
+
+    if entry is None:
+        increment_stat("misses")
+        return None
+
+    size, data = entry
+    increment_stat("hits")
+    increment_stat("bytes_served", size)
+    return data
+
+
+def store_list(key, data):
+    size = len(JSONRenderer().render(data))
+    get_cache().set(key, (size, data), timeout=settings.OFFERS_CACHE_TIMEOUT)
+
+
+def get_or_set(key, compute):
+    cache = get_cache()
+    value = cache.get(key)
+
+    if value is None:
+        value = compute()
+        cache.set(key, value, timeout=settings.OFFERS_CACHE_TIMEOUT)
+
+    return value
+
+
+def increment_stat(name, delta=1):
+    cache = get_cache()
+    try:
+        cache.incr(STATS_KEYS[name], delta)
+    except ValueError:
+        cache.add(STATS_KEYS[name], delta, timeout=None)
+
+
+def get_cache_stats():
+    values = get_cache().get_many(STATS_KEYS.values())
+    stats = {name: values.get(key, 0) for name, key in STATS_KEYS.items()}
+    lookups = stats["hits"] + stats["misses"]
+
+    stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0
+    stats["generation"] = get_generation()
+    return stats
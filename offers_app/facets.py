@@ -0,0 +1,58 @@
+from django.db.models import Count, Q
+from rest_framework.exceptions import ValidationError
+
+"""
+Bucket counts for the offers list (?facets=price,delivery).
+Buckets are half open ranges [from, to), a missing "to" is open ended.
+All requested facets are counted in one aggregate query over the filtered queryset.
+"""
+
+FACETS = {
+    "price": (
+        "min_price",
+        [(0, 50), (50, 100), (100, 250), (250, 500), (500, None)],
+    ),
+    "delivery": (
+        "min_delivery_time",
+        [(1, 2), (2, 4), (4, 8), (8, 15), (15, None)],
+    ),
+}
+FACETS_QUERY_PARAM = "facets"
+
+
+def get_requested_facets(request):
+    """
+    Returns the sorted facet names of ?facets=, raises a 400 for unknown names.
+    """
+    value = request.query_params.get(FACETS_QUERY_PARAM, "")
+    names = sorted({name.strip() for name in value.split(",") if name.strip()})
+
+    unknown = [name for name in names if name not in FACETS]
+    if unknown:
+        raise ValidationError({FACETS_QUERY_PARAM: f"Unknown facets: {', '.join(unknown)}."})
+
+    return names
+
+
+def bucket_filter(field, lower, upper):
+    condition = Q(**{f"{field}__gte": lower})
+    if upper is not None:
+        condition &= Q(**{f"{field}__lt": upper})
+    return condition
+
+
+def compute_facets(queryset, names):
+    aggregates = {
+        f"{name}_{index}": Count("pk", filter=bucket_filter(FACETS[name][0], lower, upper))
+        for name in names
+        for index, (lower, upper) in enumerate(FACETS[name][1])
+    }
+    counts = queryset.order_by().aggregate(**aggregates)
+
+    return {
+        name: [
+            {"from": lower, "to": upper, "count": counts[f"{name}_{index}"]}
+            for index, (lower, upper) in enumerate(FACETS[name][1])
+        ]
+        for name in names
+    }
@@ -0,0 +1,82 @@
+import random
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from offers_app.models import Offer
+from offers_app.search import OfferSearchBackend, get_search_backend
+
+User = get_user_model()
+
+WORDS = (
+    "logo design website landing page shop app mobile backend api "
+    "django angular react seo audit copywriting video editing branding social "
+    "media marketing newsletter database migration hosting security testing ui ux"
+).split()
+VOCABULARY = WORDS + [f"{word}{number}" for word in WORDS for number in range(100)]
+
+
+class Command(BaseCommand):
+    """
+    Compares p50/p99 latency of ?search= between the legacy icontains filter and the configured
+    search backend on seeded catalogs. All seeded rows are rolled back at the end.
+    """
+
+    help = "Benchmark offer search latency (icontains vs. full-text backend) on seeded catalogs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", nargs="+", type=int, default=[10_000, 100_000, 1_000_000])
+        parser.add_argument("--queries", type=int, default=200)
+        parser.add_argument("--batch-size", type=int, default=5_000)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        random.seed(options["seed"])
+
+        with transaction.atomic():
+            user = User.objects.create_user(username="benchmark_offer_search", type="business")
+            seeded = 0
+
+            for size in sorted(options["sizes"]):
+                self.seed_offers(user, size - seeded, options["batch_size"])
+                seeded = size
+                self.report(size, options["queries"])
+
+            transaction.set_rollback(True)
+
+    def seed_offers(self, user, amount, batch_size):
+        backend = get_search_backend()
+
+        while amount > 0:
+            batch = min(amount, batch_size)
+            offers = Offer.objects.bulk_create(
+                [Offer(user=user, title=self.sentence(4), description=self.sentence(40)) for _ in range(batch)]
+            )
+            backend.index([offer.pk for offer in offers])
+            amount -= batch
+
+    def report(self, size, queries):
+        terms = [random.choice(VOCABULARY) for _ in range(queries)]
+
+        for label, backend in (("icontains", OfferSearchBackend()), ("full-text", get_search_backend())):
+            timings = sorted(self.time_query(backend, term) for term in terms)
+            p50 = timings[int(len(timings) * 0.50)]
+            p99 = timings[min(int(len(timings) * 0.99), len(timings) - 1)]
+            self.stdout.write(f"{size:>10} offers  {label:<10} p50 {p50:8.2f} ms  p99 {p99:8.2f} ms")
+
+    @staticmethod
+    def time_query(backend, term):
+        """
+        Times what the paginated list does: a count plus the first page.
+        """
+        start = time.perf_counter()
+        queryset = backend.search(Offer.objects.order_by("id"), [term])
+        queryset.count()
+        list(queryset[:5])
+        return (time.perf_counter() - start) * 1000
+
+    @staticmethod
+    def sentence(length):
+        return " ".join(random.choices(VOCABULARY, k=length))
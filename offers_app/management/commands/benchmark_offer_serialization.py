@@ -0,0 +1,100 @@
+import statistics
+import time
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+from rest_framework.request import Request
+
+from offers_app.api.serializers import OfferListSerializer
+from offers_app.models import Offer, OfferDetail
+
+User = get_user_model()
+
+OFFER_TYPES = ["basic", "standard", "premium"]
+
+
+class Command(BaseCommand):
+    """
+    Micro-benchmark of OfferListSerializer(many=True) on seeded offers with three details each.
+    The offers are loaded once like the offers list does, so only serialization is timed,
+    and reports the time per 100 serialized offers. All seeded rows are rolled back at the end.
+    """
+
+    help = "Benchmark OfferListSerializer(many=True) serialization time per 100 offers."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--offers", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=200)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            offers = self.load_offers(self.seed_offers(options["offers"]))
+
+            paths = {
+                "list": reverse("offers:offers-list"),
+                "detail": reverse("offers:offers-detail", kwargs={"pk": offers[0].pk}),
+            }
+            for label, path in paths.items():
+                timings = self.time_serialization(offers, self.build_request(path), options["repeat"])
+                per_hundred = statistics.median(timings) * 100 / len(offers)
+                self.stdout.write(
+                    f"{label:<7} {per_hundred:8.3f} ms per 100 offers (median of {options['repeat']} runs)"
+                )
+
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def build_request(path):
+        request = RequestFactory().get(path, HTTP_HOST=settings.ALLOWED_HOSTS[0])
+        request.resolver_match = resolve(path)
+        return Request(request)
+
+    @staticmethod
+    def time_serialization(offers, request, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            OfferListSerializer(offers, many=True, context={"request": request}).data
+            timings.append((time.perf_counter() - start) * 1000)
+        return timings
+
+    @staticmethod
+    def seed_offers(amount):
+        user = User.objects.create_user(
+            username="benchmark_offer_serialization", first_name="Bench", last_name="Mark", type="business"
+        )
+        offers = Offer.objects.bulk_create(
+            Offer(
+                user=user,
+                title=f"Offer {number}",
+                description="Benchmark offer " * 20,
+                min_price=Decimal("100.00"),
+                min_delivery_time=3,
+            )
+            for number in range(1, amount + 1)
+        )
+        OfferDetail.objects.bulk_create(
+            OfferDetail(
+                offer=offer,
+                title=offer_type,
+                revisions=1,
+                delivery_time_in_days=3 + index,
+                price=Decimal(100 * (index + 1)),
+                offer_type=offer_type,
+            )
+            for offer in offers
+            for index, offer_type in enumerate(OFFER_TYPES)
+        )
+        return [offer.pk for offer in offers]
+
+    @staticmethod
+    def load_offers(ids):
+        """
+        Loads the offers with the user and details queries of the offers list.
+        """
+        return list(Offer.objects.filter(pk__in=ids).select_related("user").prefetch_related("details").order_by("id"))
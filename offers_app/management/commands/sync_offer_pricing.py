@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import F, Q
+
+from offers_app.models import Offer
+from offers_app.pricing import pricing_subqueries
+
+
+class Command(BaseCommand):
+    """
+    Backfills or verifies the stored min_price / min_delivery_time columns of all offers.
+    """
+
+    help = "Backfill Offer.min_price / Offer.min_delivery_time from the offer details, or verify them with --check."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report offers whose stored values differ from their details, do not write.",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            return self.check_pricing()
+
+        with transaction.atomic():
+            updated = Offer.objects.update(**pricing_subqueries())
+
+        self.stdout.write(self.style.SUCCESS(f"Updated pricing of {updated} offers."))
+
+    def check_pricing(self):
+        """
+        Compares stored and computed values, raises CommandError when any offer is out of sync.
+        """
+        stale = (
+            Offer.objects.annotate(**{f"computed_{name}": value for name, value in pricing_subqueries().items()})
+            .exclude(self.in_sync("min_price") & self.in_sync("min_delivery_time"))
+            .values_list("id", flat=True)
+        )
+        stale_ids = list(stale)
+
+        if stale_ids:
+            raise CommandError(f"{len(stale_ids)} offers out of sync: {stale_ids[:20]}")
+
+        self.stdout.write(self.style.SUCCESS("All offers are in sync."))
+
+    @staticmethod
+    def in_sync(field):
+        computed = f"computed_{field}"
+        return Q(**{field: F(computed)}) | Q(**{f"{field}__isnull": True, f"{computed}__isnull": True})
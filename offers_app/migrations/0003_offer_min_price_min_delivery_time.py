@@ -0,0 +1,38 @@
+# Generated by Django 5.2.4 on 2026-10-18 10:04
+
+from django.db import migrations, models
+from django.db.models import Min, OuterRef, Subquery
+
+
+def backfill_offer_pricing(apps, schema_editor):
+    Offer = apps.get_model("offers_app", "Offer")
+    OfferDetail = apps.get_model("offers_app", "OfferDetail")
+
+    details = OfferDetail.objects.filter(offer=OuterRef("pk")).order_by().values("offer")
+    Offer.objects.update(
+        min_price=Subquery(details.annotate(value=Min("price")).values("value")),
+        min_delivery_time=Subquery(details.annotate(value=Min("delivery_time_in_days")).values("value")),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("offers_app", "0002_offer_offerdetail_delete_offerdetails"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="offer",
+            name="min_delivery_time",
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="offer",
+            name="min_price",
+            field=models.DecimalField(
+                blank=True, db_index=True, decimal_places=2, max_digits=10, null=True
+            ),
+        ),
+        migrations.RunPython(backfill_offer_pricing, migrations.RunPython.noop),
+    ]
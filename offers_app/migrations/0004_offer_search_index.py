@@ -0,0 +1,51 @@
+from django.db import migrations
+
+"""
+Creates the full-text search structures used by offers_app.search:
+- PostgreSQL: stored tsvector column search_vector with a GIN index
+- SQLite: FTS5 shadow table offers_app_offer_fts (rowid = offer id)
+Other database vendors fall back to icontains matching and need no schema.
+"""
+
+POSTGRES_VECTOR = "setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', description), 'B')"
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "postgresql":
+        schema_editor.execute("ALTER TABLE offers_app_offer ADD COLUMN search_vector tsvector")
+        schema_editor.execute(f"UPDATE offers_app_offer SET search_vector = {POSTGRES_VECTOR}")
+        schema_editor.execute(
+            "CREATE INDEX offers_app_offer_search_vector_gin ON offers_app_offer USING GIN (search_vector)"
+        )
+    elif vendor == "sqlite":
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE offers_app_offer_fts USING fts5("
+            "title, description, tokenize = 'unicode61 remove_diacritics 2')"
+        )
+        schema_editor.execute(
+            "INSERT INTO offers_app_offer_fts (rowid, title, description) "
+            "SELECT id, title, description FROM offers_app_offer"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS offers_app_offer_search_vector_gin")
+        schema_editor.execute("ALTER TABLE offers_app_offer DROP COLUMN IF EXISTS search_vector")
+    elif vendor == "sqlite":
+        schema_editor.execute("DROP TABLE IF EXISTS offers_app_offer_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("offers_app", "0003_offer_min_price_min_delivery_time"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.4 on 2026-10-18 10:25
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("offers_app", "0005_offer_image_variants"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="offer",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="offers",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="offerdetail",
+            name="offer",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="details",
+                to="offers_app.offer",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="offer",
+            index=models.Index(
+                fields=["user", "updated_at"], name="offer_user_updated_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="offerdetail",
+            index=models.Index(
+                fields=["offer", "price"], name="offerdetail_offer_price_idx"
+            ),
+        ),
+    ]
@@ -10,13 +10,24 @@ class Offer(models.Model):
     Model representing an offer created by a user.
     """
 
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="offers")
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="offers", db_index=False)
     title = models.CharField(max_length=100)
     image = models.ImageField(upload_to="offers/images/", null=True, blank=True)
+    image_width = models.PositiveIntegerField(null=True, blank=True)
+    image_height = models.PositiveIntegerField(null=True, blank=True)
+    image_variants = models.JSONField(default=dict, blank=True)
     description = models.TextField()
+    min_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, db_index=True)
+    min_delivery_time = models.PositiveIntegerField(null=True, blank=True, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # ?creator_id= filtered lists ordered by updated_at, also serves plain user lookups
+            models.Index(fields=["user", "updated_at"], name="offer_user_updated_idx"),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -32,15 +43,11 @@ class OfferDetail(models.Model):
         ("premium", "Premium"),
     ]
 
-    offer = models.ForeignKey(Offer, on_delete=models.CASCADE, related_name="details")
+    offer = models.ForeignKey(Offer, on_delete=models.CASCADE, related_name="details", db_index=False)
     title = models.CharField(max_length=100)
     revisions = models.PositiveIntegerField(validators=[MinValueValidator(0)])
-    delivery_time_in_days = models.PositiveIntegerField(
-        validators=[MinValueValidator(1)]
-    )
-    price = models.DecimalField(
-        max_digits=10, decimal_places=2, validators=[MinValueValidator(0)]
-    )
+    delivery_time_in_days = models.PositiveIntegerField(validators=[MinValueValidator(1)])
+    price = models.DecimalField(max_digits=10, decimal_places=2, validators=[MinValueValidator(0)])
     offer_type = models.CharField(max_length=20, choices=OFFER_TYPE_CHOICES)
     features = models.JSONField(default=list, blank=True)
 
@@ -50,6 +57,10 @@ class OfferDetail(models.Model):
             "offer",
             "offer_type",
         ]
+        indexes = [
+            # details prefetch ordered by price and the min_price / min_delivery_time subqueries
+            models.Index(fields=["offer", "price"], name="offerdetail_offer_price_idx"),
+        ]
 
     def __str__(self):
         return f"{self.offer.title} - {self.get_offer_type_display()}"
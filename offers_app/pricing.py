@@ -0,0 +1,36 @@
+from django.db.models import Min, OuterRef, Subquery
+
+from offers_app.models import Offer, OfferDetail
+
+
+def pricing_subqueries():
+    """
+    Returns the correlated subqueries computing min_price and min_delivery_time
+    of an offer from its details, usable in Offer.objects.update().
+    """
+    details = OfferDetail.objects.filter(offer=OuterRef("pk")).order_by().values("offer")
+
+    return {
+        "min_price": Subquery(details.annotate(value=Min("price")).values("value")),
+        "min_delivery_time": Subquery(details.annotate(value=Min("delivery_time_in_days")).values("value")),
+    }
+
+
+def refresh_offer_pricing(offer_id):
+    """
+    Recomputes the stored min_price / min_delivery_time of one offer in a single UPDATE.
+    """
+    Offer.objects.filter(pk=offer_id).update(**pricing_subqueries())
+
+
+def summarize_details(details):
+    """
+    Returns min_price / min_delivery_time computed from in-memory OfferDetail objects.
+    """
+    if not details:
+        return {"min_price": None, "min_delivery_time": None}
+
+    return {
+        "min_price": min(detail.price for detail in details),
+        "min_delivery_time": min(detail.delivery_time_in_days for detail in details),
+    }
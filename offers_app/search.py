@@ -0,0 +1,151 @@
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+from rest_framework import filters
+
+from offers_app.models import Offer
+
+"""
+Pluggable full-text search for offers.
+PostgreSQL uses a stored tsvector column with a GIN index, SQLite an FTS5 shadow table.
+Both structures are created by migration 0004 and kept up to date by offers_app.signals.
+"""
+
+INDEX_BATCH_SIZE = 500
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(terms):
+    """
+    Splits the search terms into plain word tokens, dropping every character
+    that has a meaning in the tsquery / FTS5 query syntax.
+    """
+    return [token.lower() for term in terms for token in TOKEN_PATTERN.findall(term)]
+
+
+def batched(ids, size=INDEX_BATCH_SIZE):
+    ids = list(ids)
+    for start in range(0, len(ids), size):
+        end = start + size
+        yield ids[start:end]
+
+
+class OfferSearchBackend:
+    """
+    Fallback backend without a search index: case-insensitive substring match on title and description.
+    """
+
+    def index(self, offer_ids):
+        pass
+
+    def remove(self, offer_ids):
+        pass
+
+    def search(self, queryset, terms):
+        for term in terms:
+            queryset = queryset.filter(Q(title__icontains=term) | Q(description__icontains=term))
+        return queryset
+
+
+class PostgresOfferSearchBackend(OfferSearchBackend):
+    """
+    Matches against the GIN indexed search_vector column, ranked by ts_rank.
+    """
+
+    table = Offer._meta.db_table
+    vector_sql = "setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', description), 'B')"
+
+    def index(self, offer_ids):
+        with connection.cursor() as cursor:
+            for batch in batched(offer_ids):
+                cursor.execute(f"UPDATE {self.table} SET search_vector = {self.vector_sql} WHERE id = ANY(%s)", [batch])
+
+    def search(self, queryset, terms):
+        tokens = tokenize(terms)
+        if not tokens:
+            return queryset
+
+        query = " & ".join(f"{token}:*" for token in tokens)
+        column = f'"{self.table}"."search_vector"'
+        matches = RawSQL(f"{column} @@ to_tsquery('simple', %s)", [query], output_field=BooleanField())
+        rank = RawSQL(f"ts_rank({column}, to_tsquery('simple', %s))", [query], output_field=FloatField())
+
+        return queryset.filter(matches).annotate(search_rank=rank).order_by("-search_rank", "id")
+
+
+class SQLiteOfferSearchBackend(OfferSearchBackend):
+    """
+    Matches against the FTS5 shadow table (rowid = offer id), ranked by bm25.
+    """
+
+    table = Offer._meta.db_table
+    fts_table = f"{Offer._meta.db_table}_fts"
+
+    def index(self, offer_ids):
+        with connection.cursor() as cursor:
+            for batch in batched(offer_ids):
+                placeholders = ", ".join(["%s"] * len(batch))
+                cursor.execute(f"DELETE FROM {self.fts_table} WHERE rowid IN ({placeholders})", batch)
+                cursor.execute(
+                    f"INSERT INTO {self.fts_table} (rowid, title, description) "
+                    f"SELECT id, title, description FROM {self.table} WHERE id IN ({placeholders})",
+                    batch,
+                )
+
+    def remove(self, offer_ids):
+        with connection.cursor() as cursor:
+            for batch in batched(offer_ids):
+                placeholders = ", ".join(["%s"] * len(batch))
+                cursor.execute(f"DELETE FROM {self.fts_table} WHERE rowid IN ({placeholders})", batch)
+
+    def search(self, queryset, terms):
+        tokens = tokenize(terms)
+        if not tokens:
+            return queryset
+
+        query = " ".join(f'"{token}"*' for token in tokens)
+        matches = RawSQL(f"SELECT rowid FROM {self.fts_table} WHERE {self.fts_table} MATCH %s", [query])
+
+        # The rank subquery is bound to one rowid, so FTS5 seeks that row in the doclists
+        # instead of re-running the full MATCH for every matching offer.
+        rank = RawSQL(
+            f"SELECT -bm25({self.fts_table}, 2.0, 1.0) FROM {self.fts_table} "
+            f'WHERE {self.fts_table} MATCH %s AND rowid = "{self.table}"."id"',
+            [query],
+            output_field=FloatField(),
+        )
+        return queryset.filter(pk__in=matches).annotate(search_rank=rank).order_by("-search_rank", "id")
+
+
+VENDOR_BACKENDS = {
+    "postgresql": PostgresOfferSearchBackend,
+    "sqlite": SQLiteOfferSearchBackend,
+}
+
+
+def get_search_backend():
+    """
+    Returns the backend configured in settings.OFFER_SEARCH_BACKEND, or the one matching the database vendor.
+    """
+    backend_path = getattr(settings, "OFFER_SEARCH_BACKEND", None)
+    if backend_path:
+        return import_string(backend_path)()
+
+    return VENDOR_BACKENDS.get(connection.vendor, OfferSearchBackend)()
+
+
+class OfferSearchFilter(filters.SearchFilter):
+    """
+    SearchFilter delegating ?search= to the configured offer search backend.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        return get_search_backend().search(queryset, terms)
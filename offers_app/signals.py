@@ -0,0 +1,55 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from core.images import enqueue_image_processing, image_processed
+from offers_app.cache import invalidate_offers
+from offers_app.models import Offer, OfferDetail
+from offers_app.pricing import refresh_offer_pricing
+from offers_app.search import get_search_backend
+
+"""
+Signals keeping the denormalized pricing columns, the search index,
+the image variants and the offers list cache of Offer in sync
+"""
+
+
+User = get_user_model()
+
+USER_NAME_FIELDS = {"username", "first_name", "last_name"}
+
+
+@receiver(post_save, sender=OfferDetail)
+def update_offer_pricing_on_save(sender, instance, **kwargs):
+    refresh_offer_pricing(instance.offer_id)
+    invalidate_offers()
+
+
+@receiver(post_delete, sender=OfferDetail)
+def update_offer_pricing_on_delete(sender, instance, **kwargs):
+    refresh_offer_pricing(instance.offer_id)
+    invalidate_offers()
+
+
+@receiver(post_save, sender=Offer)
+def index_offer(sender, instance, **kwargs):
+    get_search_backend().index([instance.pk])
+    enqueue_image_processing(instance, "image")
+    invalidate_offers()
+
+
+@receiver(post_delete, sender=Offer)
+def remove_offer_from_index(sender, instance, **kwargs):
+    get_search_backend().remove([instance.pk])
+    invalidate_offers()
+
+
+@receiver(post_save, sender=User)
+def invalidate_offers_on_user_name_change(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or USER_NAME_FIELDS & set(update_fields):
+        invalidate_offers()
+
+
+@receiver(image_processed, sender=Offer)
+def invalidate_offers_on_image_processed(sender, **kwargs):
+    # the variants are stored with QuerySet.update(), which sends no post_save
+    invalidate_offers()
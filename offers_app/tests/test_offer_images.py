@@ -0,0 +1,124 @@
+import shutil
+import tempfile
+from io import BytesIO
+
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse
+from PIL import Image
+
+from core.images import process_image, validate_image_header
+from offers_app.models import Offer
+from offers_app.tests.test_offers_get_post import OfferTestSetup
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def make_upload(name="photo.jpg", size=(1200, 800), image_format="JPEG"):
+    buffer = BytesIO()
+    exif = Image.Exif()
+    exif[0x010F] = "Test Camera"
+    Image.new("RGB", size, "red").save(buffer, image_format, exif=exif)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type=f"image/{image_format.lower()}")
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, IMAGE_PROCESSING_EAGER=True)
+class OfferImageProcessingTestCase(OfferTestSetup):
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def save_image(self, offer, upload):
+        with self.captureOnCommitCallbacks(execute=True):
+            offer.image = upload
+            offer.save()
+        offer.refresh_from_db()
+
+    def test_variants_are_recorded(self):
+        """
+        Test if saving an image records its size and WebP thumbnail / full variants without metadata.
+        """
+        offer = Offer.objects.get(title="Test Offer 1")
+        self.save_image(offer, make_upload())
+
+        self.assertEqual((offer.image_width, offer.image_height), (1200, 800))
+        self.assertEqual(offer.image_variants["source"], offer.image.name)
+
+        with offer.image.storage.open(offer.image_variants["thumbnail"]) as file, Image.open(file) as thumbnail:
+            self.assertEqual(thumbnail.format, "WEBP")
+            self.assertEqual(thumbnail.size, (320, 213))
+            self.assertFalse(thumbnail.getexif())
+
+    def test_list_returns_requested_variant(self):
+        """
+        Test if ?image_variant=thumbnail swaps the image URL, the original is returned by default.
+        """
+        offer = Offer.objects.get(title="Test Offer 1")
+        self.save_image(offer, make_upload())
+
+        original = self.client.get(reverse("offers:offers-list")).data["results"][0]["image"]
+        response = self.client.get(reverse("offers:offers-list"), {"image_variant": "thumbnail"})
+
+        self.assertTrue(original.endswith(offer.image.name))
+        self.assertTrue(response.data["results"][0]["image"].endswith(offer.image_variants["thumbnail"]))
+
+    def test_processing_invalidates_cached_list(self):
+        """
+        Test if recording the variants invalidates an anonymous list cached before processing finished.
+        """
+        offer = Offer.objects.get(title="Test Offer 1")
+        offer.image = make_upload()
+        offer.save()
+        params = {"image_variant": "thumbnail"}
+        self.client.get(reverse("offers:offers-list"), params)
+
+        process_image("offers_app.Offer", offer.pk, "image")
+        offer.refresh_from_db()
+
+        response = self.client.get(reverse("offers:offers-list"), params)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertTrue(response.data["results"][0]["image"].endswith(offer.image_variants["thumbnail"]))
+
+    def test_replaced_image_is_reprocessed(self):
+        """
+        Test if a new upload replaces the variants and removes the old variant files.
+        """
+        offer = Offer.objects.get(title="Test Offer 1")
+        self.save_image(offer, make_upload())
+        old_thumbnail = offer.image_variants["thumbnail"]
+
+        self.save_image(offer, make_upload(name="second.png", size=(400, 400), image_format="PNG"))
+
+        self.assertEqual((offer.image_width, offer.image_height), (400, 400))
+        self.assertNotEqual(offer.image_variants["thumbnail"], old_thumbnail)
+        self.assertFalse(offer.image.storage.exists(old_thumbnail))
+
+    def test_broken_image_records_error(self):
+        """
+        Test if an undecodable file is recorded as failed instead of raising in the worker.
+        """
+        offer = Offer.objects.get(title="Test Offer 1")
+        self.save_image(offer, SimpleUploadedFile("broken.jpg", b"not an image"))
+
+        self.assertIn("error", offer.image_variants)
+        self.assertIsNone(offer.image_width)
+
+    def test_upload_header_check(self):
+        """
+        Test if the upload check accepts an image without decoding it and rejects other files.
+        """
+        upload = make_upload()
+        validate_image_header(upload)
+        self.assertEqual(upload.tell(), 0)
+
+        with self.assertRaises(ValidationError):
+            validate_image_header(SimpleUploadedFile("a.jpg", b"text"))
+
+    def test_process_image_skips_deleted_offer(self):
+        """
+        Test if a job for an offer deleted before processing is a no-op.
+        """
+        process_image("offers_app.Offer", 999999, "image")
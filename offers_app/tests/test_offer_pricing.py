@@ -0,0 +1,105 @@
+from io import StringIO
+from decimal import Decimal
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+from rest_framework import status
+
+from offers_app.models import Offer, OfferDetail
+from offers_app.tests.test_offers_get_post import OfferTestSetup
+
+
+class OfferPricingTestCase(OfferTestSetup):
+
+    def test_pricing_stored_on_create(self):
+        """
+        Test if min_price and min_delivery_time are stored when an offer is created.
+        """
+        self.authenticate_user(user_type="business", custom_user_number="1")
+
+        response = self.client.post(reverse("offers:offers-list"), self.post_data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        offer = Offer.objects.get(id=response.data["id"])
+        self.assertEqual(offer.min_price, Decimal("100.00"))
+        self.assertEqual(offer.min_delivery_time, 3)
+
+    def test_pricing_updated_on_offer_patch(self):
+        """
+        Test if the stored pricing follows detail changes made through the offer PATCH.
+        """
+        self.authenticate_user(user_type="business", custom_user_number="1")
+
+        offer = Offer.objects.get(title="Test Offer 1")
+        patch_data = {"details": [{"offer_type": "basic", "price": 50, "delivery_time_in_days": 1}]}
+        response = self.client.patch(reverse("offers:offers-detail", args=[offer.id]), patch_data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        offer.refresh_from_db()
+        self.assertEqual(offer.min_price, Decimal("50.00"))
+        self.assertEqual(offer.min_delivery_time, 1)
+
+    def test_pricing_updated_on_offerdetail_patch(self):
+        """
+        Test if the stored pricing follows changes made through the offerdetails PATCH.
+        """
+        self.authenticate_user(user_type="business", custom_user_number="1")
+
+        detail = OfferDetail.objects.get(offer__title="Test Offer 1", offer_type="standard")
+        response = self.client.patch(
+            reverse("offerdetails:offerdetails-detail", args=[detail.id]), {"price": 10}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        detail.offer.refresh_from_db()
+        self.assertEqual(detail.offer.min_price, Decimal("10.00"))
+
+    def test_pricing_updated_on_detail_delete(self):
+        """
+        Test if deleting the cheapest detail moves the stored pricing to the next one.
+        """
+        OfferDetail.objects.get(offer__title="Test Offer 1", offer_type="basic").delete()
+
+        offer = Offer.objects.get(title="Test Offer 1")
+        self.assertEqual(offer.min_price, Decimal("200.00"))
+        self.assertEqual(offer.min_delivery_time, 5)
+
+    def test_ordering_by_min_price(self):
+        """
+        Test if the offer list can be ordered by the stored min_price.
+        """
+        cheap = Offer.objects.create(user=self.first_business_user, title="Cheap", description="Cheap offer")
+        OfferDetail.objects.create(
+            offer=cheap, title="Basic", revisions=1, delivery_time_in_days=1, price=5, offer_type="basic"
+        )
+
+        response = self.client.get(reverse("offers:offers-list"), {"ordering": "min_price"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["title"], "Cheap")
+        self.assertEqual(response.data["results"][0]["min_price"], 5.0)
+
+
+class SyncOfferPricingCommandTestCase(OfferTestSetup):
+
+    def test_check_reports_drift(self):
+        """
+        Test if --check fails for offers whose stored pricing is out of sync.
+        """
+        Offer.objects.update(min_price=None, min_delivery_time=None)
+
+        with self.assertRaises(CommandError):
+            call_command("sync_offer_pricing", "--check", stdout=StringIO())
+
+    def test_backfill_repairs_drift(self):
+        """
+        Test if the command restores the stored pricing from the offer details.
+        """
+        Offer.objects.update(min_price=None, min_delivery_time=None)
+
+        call_command("sync_offer_pricing", stdout=StringIO())
+        call_command("sync_offer_pricing", "--check", stdout=StringIO())
+
+        offer = Offer.objects.get(title="Test Offer 1")
+        self.assertEqual(offer.min_price, Decimal("100.00"))
+        self.assertEqual(offer.min_delivery_time, 3)
@@ -0,0 +1,79 @@
+import json
+
+from django.urls import reverse
+from rest_framework import status
+
+from offers_app.models import Offer, OfferDetail
+from offers_app.tests.test_offers_get_post import OfferTestSetup
+
+
+class OfferBulkImportTestCase(OfferTestSetup):
+
+    def build_items(self, amount):
+        return [dict(self.post_data, title=f"Bulk Offer {number}") for number in range(amount)]
+
+    def test_bulk_import_json(self):
+        """
+        Test if a JSON array of offers is created with details and pricing columns.
+        """
+        self.authenticate_user(user_type="business", custom_user_number="1")
+        response = self.client.post(reverse("offers:offers-bulk"), self.build_items(3), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 3)
+
+        offers = Offer.objects.filter(pk__in=response.data["ids"])
+        self.assertEqual(offers.count(), 3)
+        self.assertEqual(OfferDetail.objects.filter(offer__in=offers).count(), 9)
+        self.assertTrue(all(offer.min_price == 100 and offer.min_delivery_time == 3 for offer in offers))
+        self.assertTrue(all(offer.user == self.first_business_user for offer in offers))
+
+    def test_bulk_import_ndjson(self):
+        """
+        Test if an NDJSON stream is accepted and the new offers are searchable.
+        """
+        self.authenticate_user(user_type="business", custom_user_number="1")
+        body = "\n".join(json.dumps(item) for item in self.build_items(2)) + "\n"
+        response = self.client.post(reverse("offers:offers-bulk"), body, content_type="application/x-ndjson")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 2)
+
+        response = self.client.get(reverse("offers:offers-list"), {"search": "Bulk"})
+        self.assertEqual(response.data["count"], 2)
+
+    def test_bulk_import_reports_item_errors(self):
+        """
+        Test if invalid items are reported by index and nothing is written.
+        """
+        self.authenticate_user(user_type="business", custom_user_number="1")
+        items = self.build_items(3)
+        items[1] = dict(items[1], details=items[1]["details"][:2])
+        items[2] = dict(items[2], title="")
+        offer_count = Offer.objects.count()
+
+        response = self.client.post(reverse("offers:offers-bulk"), items, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([error["index"] for error in response.data["errors"]], [1, 2])
+        self.assertIn("details", response.data["errors"][0]["errors"])
+        self.assertIn("title", response.data["errors"][1]["errors"])
+        self.assertEqual(Offer.objects.count(), offer_count)
+
+    def test_bulk_import_rejects_non_list(self):
+        """
+        Test if a body that is not a list of offers returns a 400 status code.
+        """
+        self.authenticate_user(user_type="business", custom_user_number="1")
+        response = self.client.post(reverse("offers:offers-bulk"), self.post_data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_import_customer_forbidden(self):
+        """
+        Test if a customer user cannot import offers.
+        """
+        self.authenticate_user(user_type="customer", custom_user_number="1")
+        response = self.client.post(reverse("offers:offers-bulk"), self.build_items(1), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,91 @@
+from django.urls import reverse
+from rest_framework import status
+
+from offers_app.cache import get_cache_stats
+from offers_app.models import Offer, OfferDetail
+from offers_app.tests.test_offers_get_post import OfferTestSetup
+
+
+class OfferListCacheTestCase(OfferTestSetup):
+
+    def test_anonymous_list_is_cached(self):
+        """
+        Test if a repeated anonymous list request is served from the cache.
+        """
+        first = self.client.get(reverse("offers:offers-list"), {"page_size": 3})
+        second = self.client.get(reverse("offers:offers-list"), {"page_size": 3})
+
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(first.data, second.data)
+
+    def test_query_string_is_normalized(self):
+        """
+        Test if unknown parameters and parameter order do not split the cache.
+        """
+        self.client.get(reverse("offers:offers-list") + "?page_size=3&ordering=min_price")
+        response = self.client.get(reverse("offers:offers-list") + "?ordering=min_price&utm=x&page_size=3")
+
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_offer_write_invalidates_cache(self):
+        """
+        Test if changing an offer detail invalidates the cached list.
+        """
+        self.client.get(reverse("offers:offers-list"))
+
+        detail = OfferDetail.objects.get(offer__title="Test Offer 1", offer_type="basic")
+        detail.price = 10
+        detail.save()
+
+        response = self.client.get(reverse("offers:offers-list"))
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["results"][0]["min_price"], 10.0)
+
+    def test_user_name_change_invalidates_cache(self):
+        """
+        Test if renaming the offer owner invalidates the cached list, a last_login update does not.
+        """
+        self.client.get(reverse("offers:offers-list"))
+
+        self.first_business_user.save(update_fields=["last_login"])
+        self.assertEqual(self.client.get(reverse("offers:offers-list"))["X-Cache"], "HIT")
+
+        self.first_business_user.first_name = "Moritz"
+        self.first_business_user.save()
+
+        response = self.client.get(reverse("offers:offers-list"))
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["results"][0]["user_details"]["first_name"], "Moritz")
+
+    def test_authenticated_list_is_not_cached(self):
+        """
+        Test if authenticated list requests bypass the cache.
+        """
+        self.authenticate_user(user_type="customer", custom_user_number="1")
+        response = self.client.get(reverse("offers:offers-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("X-Cache", response)
+
+    def test_cache_stats(self):
+        """
+        Test if hits and served bytes are counted and exposed to staff only.
+        """
+        before = get_cache_stats()
+        self.client.get(reverse("offers:offers-list"))
+        self.client.get(reverse("offers:offers-list"))
+        after = get_cache_stats()
+
+        self.assertEqual(after["hits"] - before["hits"], 1)
+        self.assertGreater(after["bytes_served"], before["bytes_served"])
+
+        self.authenticate_user(user_type="business", custom_user_number="1")
+        response = self.client.get(reverse("offers:offers-cache-stats"))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.first_business_user.is_staff = True
+        self.first_business_user.save()
+        response = self.client.get(reverse("offers:offers-cache-stats"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("hit_ratio", response.data)
@@ -0,0 +1,83 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from offers_app.models import Offer, OfferDetail
+from offers_app.tests.test_offers_get_post import OfferTestSetup
+
+
+class OfferCursorPaginationTestCase(OfferTestSetup):
+
+    def setUp(self):
+        super().setUp()
+
+        for index, price in enumerate([50, 50, 50, 20, 80, 20, 300, 10, 50, 70, 90]):
+            offer = Offer.objects.create(user=self.second_business_user, title=f"Offer {index}", description="Cursor")
+            OfferDetail.objects.create(
+                offer=offer, title="Basic", revisions=1, delivery_time_in_days=2, price=price, offer_type="basic"
+            )
+
+        Offer.objects.create(user=self.second_business_user, title="Offer without details", description="Cursor")
+
+    def collect_pages(self, params):
+        """Follows the next links and returns the ids of all pages."""
+        ids = []
+        response = self.client.get(reverse("offers:offers-list"), {"cursor": "", "page_size": 5, **params})
+
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            ids.extend(offer["id"] for offer in response.data["results"])
+
+            if not response.data["next"]:
+                return ids
+            response = self.client.get(response.data["next"])
+
+    def test_cursor_pages_cover_all_offers_once(self):
+        """
+        Test if following the cursors returns every offer exactly once for every ordering.
+        """
+        total = Offer.objects.count()
+
+        for ordering in ["", "min_price", "-min_price", "updated_at", "-updated_at"]:
+            ids = self.collect_pages({"ordering": ordering} if ordering else {})
+            self.assertEqual(len(ids), total, ordering)
+            self.assertEqual(len(set(ids)), total, ordering)
+
+    def test_cursor_follows_price_ordering(self):
+        """
+        Test if cursor pages keep the min_price ordering, with offers without price last.
+        """
+        ids = self.collect_pages({"ordering": "min_price"})
+        prices = [Offer.objects.get(id=offer_id).min_price for offer_id in ids]
+
+        self.assertIsNone(prices[-1])
+        self.assertEqual(prices[:-1], sorted(prices[:-1]))
+
+    def test_cursor_combines_with_filters(self):
+        """
+        Test if cursor pagination respects OfferFilter and search parameters.
+        """
+        ids = self.collect_pages({"min_price": 50, "ordering": "-min_price"})
+        self.assertEqual(len(ids), Offer.objects.filter(min_price__gte=50).count())
+
+        ids = self.collect_pages({"search": "cursor"})
+        self.assertEqual(len(ids), Offer.objects.filter(description="Cursor").count())
+
+    def test_cursor_does_not_count(self):
+        """
+        Test if a cursor page is served without a COUNT query.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("offers:offers-list"), {"cursor": ""})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(any("COUNT(" in query["sql"].upper() for query in queries.captured_queries))
+
+    def test_invalid_cursor(self):
+        """
+        Test if a malformed cursor returns a 404 status code.
+        """
+        response = self.client.get(reverse("offers:offers-list"), {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,83 @@
+from decimal import Decimal
+
+from django.urls import reverse
+from rest_framework import status
+
+from offers_app.models import Offer
+from offers_app.tests.test_offers_get_post import OfferTestSetup
+
+
+class OfferFacetsTestCase(OfferTestSetup):
+
+    def setUp(self):
+        super().setUp()
+        Offer.objects.create(
+            user=self.second_business_user,
+            title="Cheap Logo",
+            description="Quick logo design.",
+            min_price=Decimal("30.00"),
+            min_delivery_time=1,
+        )
+        Offer.objects.create(
+            user=self.second_business_user,
+            title="Premium Website",
+            description="Large website project.",
+            min_price=Decimal("800.00"),
+            min_delivery_time=20,
+        )
+
+    def get_counts(self, response, name):
+        return [bucket["count"] for bucket in response.data["facets"][name]]
+
+    def test_facets_next_to_page(self):
+        """
+        Test if ?facets= returns price and delivery bucket counts over all matching offers.
+        """
+        response = self.client.get(reverse("offers:offers-list"), {"facets": "price,delivery", "page_size": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(self.get_counts(response, "price"), [1, 0, 1, 0, 1])
+        self.assertEqual(self.get_counts(response, "delivery"), [1, 1, 0, 0, 1])
+        self.assertEqual(response.data["facets"]["price"][0], {"from": 0, "to": 50, "count": 1})
+
+    def test_facets_respect_filters_and_search(self):
+        """
+        Test if the counts follow the active filter and search parameters.
+        """
+        response = self.client.get(
+            reverse("offers:offers-list"),
+            {"facets": "price", "creator_id": self.second_business_user.id, "search": "website"},
+        )
+
+        self.assertEqual(self.get_counts(response, "price"), [0, 0, 0, 0, 1])
+        self.assertNotIn("delivery", response.data["facets"])
+
+    def test_facets_single_aggregate_and_cached(self):
+        """
+        Test if the counts cost one aggregate query (token, count, page, details, facets)
+        and are reused for another page of the same filters.
+        """
+        self.authenticate_user(user_type="customer", custom_user_number="1")
+        params = {"facets": "price,delivery", "page_size": 1}
+
+        with self.assertNumQueries(5):
+            self.client.get(reverse("offers:offers-list"), params)
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse("offers:offers-list"), dict(params, page=2))
+
+        self.assertEqual(self.get_counts(response, "price"), [1, 0, 1, 0, 1])
+
+    def test_unknown_facet(self):
+        """
+        Test if an unknown facet name returns a 400 status code.
+        """
+        response = self.client.get(reverse("offers:offers-list"), {"facets": "rating"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_without_facets_param(self):
+        """
+        Test if the list response is unchanged without ?facets=.
+        """
+        response = self.client.get(reverse("offers:offers-list"))
+        self.assertNotIn("facets", response.data)
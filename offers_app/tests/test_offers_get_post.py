@@ -125,9 +125,7 @@ class OfferTestSetup(APITestCase):
 
         # Tokens für Authentication erstellen
         self.first_business_token = Token.objects.create(user=self.first_business_user)
-        self.second_business_token = Token.objects.create(
-            user=self.second_business_user
-        )
+        self.second_business_token = Token.objects.create(user=self.second_business_user)
         self.first_customer_token = Token.objects.create(user=self.first_customer_user)
 
         # APIClient setup
@@ -136,21 +134,13 @@ class OfferTestSetup(APITestCase):
     def authenticate_user(self, user_type="business", custom_user_number="1"):
         """Helper method for User Authentication."""
         if user_type == "business" and custom_user_number == "1":
-            self.client.credentials(
-                HTTP_AUTHORIZATION="Token " + self.first_business_token.key
-            )
+            self.client.credentials(HTTP_AUTHORIZATION="Token " + self.first_business_token.key)
         elif user_type == "business" and custom_user_number == "2":
-            self.client.credentials(
-                HTTP_AUTHORIZATION="Token " + self.second_business_token.key
-            )
+            self.client.credentials(HTTP_AUTHORIZATION="Token " + self.second_business_token.key)
         elif user_type == "customer" and custom_user_number == "1":
-            self.client.credentials(
-                HTTP_AUTHORIZATION="Token " + self.first_customer_token.key
-            )
+            self.client.credentials(HTTP_AUTHORIZATION="Token " + self.first_customer_token.key)
         elif user_type == "customer" and custom_user_number == "2":
-            self.client.credentials(
-                HTTP_AUTHORIZATION="Token " + self.second_customer_token.key
-            )
+            self.client.credentials(HTTP_AUTHORIZATION="Token " + self.second_customer_token.key)
 
     def clear_authentication(self):
         """Helper method remove Authentication."""
@@ -168,29 +158,19 @@ class OfferListTestCase(OfferTestSetup):
         response = self.client.get(reverse("offers:offers-list"))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 4)  # 3 Pagination + 1 results with offers
-        self.assertEqual(
-            len(response.data["results"]), 1
-        )  # Only one offer created in setUp
-        self.assertEqual(
-            response.data["results"][0]["details"][0]["url"], "/offerdetails/1/"
-        )
+        self.assertEqual(len(response.data["results"]), 1)  # Only one offer created in setUp
+        self.assertEqual(response.data["results"][0]["details"][0]["url"], "/offerdetails/1/")
         self.assertEqual(response.data["count"], 1)
 
     def test_filtered_offer_list_creator_id(self):
         """
         Test if the offer list can be filtered by creator_id.
         """
-        response = self.client.get(
-            reverse("offers:offers-list"), {"creator_id": self.first_business_user.id}
-        )
+        response = self.client.get(reverse("offers:offers-list"), {"creator_id": self.first_business_user.id})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(
-            response.data["count"], 1
-        )  # Only one offer created by the first business user
+        self.assertEqual(response.data["count"], 1)  # Only one offer created by the first business user
         self.assertEqual(len(response.data["results"]), 1)
-        self.assertEqual(
-            response.data["results"][0]["user"], self.first_business_user.id
-        )
+        self.assertEqual(response.data["results"][0]["user"], self.first_business_user.id)
 
     def test_filtered_offer_list_min_price(self):
         """
@@ -204,9 +184,7 @@ class OfferListTestCase(OfferTestSetup):
         """
         Test if the offer list can be filtered by min_delivery_time.
         """
-        response = self.client.get(
-            reverse("offers:offers-list"), {"min_delivery_time": 2}
-        )
+        response = self.client.get(reverse("offers:offers-list"), {"min_delivery_time": 2})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["count"], 1)
 
@@ -214,14 +192,47 @@ class OfferListTestCase(OfferTestSetup):
         """
         Test if the offer list can be filtered by search query.
         """
-        response = self.client.get(
-            reverse("offers:offers-list"), {"search": "Test Offer 1"}
-        )
+        response = self.client.get(reverse("offers:offers-list"), {"search": "Test Offer 1"})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["count"], 1)
         self.assertEqual(len(response.data["results"]), 1)
         self.assertEqual(response.data["results"][0]["title"], "Test Offer 1")
 
+    def test_search_ranks_title_matches_first(self):
+        """
+        Test if search results are ranked by relevance, title matches before description matches.
+        """
+        Offer.objects.create(
+            user=self.first_business_user,
+            title="Logo Design",
+            description="Logo design for your brand.",
+        )
+        Offer.objects.create(
+            user=self.first_business_user,
+            title="Website",
+            description="A website, optionally with a logo.",
+        )
+
+        response = self.client.get(reverse("offers:offers-list"), {"search": "logo"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(response.data["results"][0]["title"], "Logo Design")
+
+    def test_search_index_follows_updates_and_deletes(self):
+        """
+        Test if the search index is updated when an offer is renamed or deleted.
+        """
+        offer = Offer.objects.get(title="Test Offer 1")
+        offer.title = "Renamed"
+        offer.save()
+
+        response = self.client.get(reverse("offers:offers-list"), {"search": "renamed"})
+        self.assertEqual(response.data["count"], 1)
+
+        offer.delete()
+        response = self.client.get(reverse("offers:offers-list"), {"search": "renamed"})
+        self.assertEqual(response.data["count"], 0)
+
 
 class OfferDetailTestCase(OfferTestSetup):
 
@@ -299,9 +310,7 @@ class OfferCreateTestCase(OfferTestSetup):
         """
         self.authenticate_user(user_type="business", custom_user_number="1")
 
-        response = self.client.post(
-            reverse("offers:offers-list"), self.post_data, format="json"
-        )
+        response = self.client.post(reverse("offers:offers-list"), self.post_data, format="json")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data["title"], self.post_data["title"])
         self.assertEqual(len(response.data["details"]), 3)
@@ -326,18 +335,14 @@ class OfferCreateTestCase(OfferTestSetup):
         """
         self.authenticate_user(user_type="business", custom_user_number="1")
 
-        response = self.client.post(
-            reverse("offers:offers-list"), self.post_data_less_details, format="json"
-        )
+        response = self.client.post(reverse("offers:offers-list"), self.post_data_less_details, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_create_without_authentication(self):
         """
         Test if an offer cannot be created without authentication.
         """
-        response = self.client.post(
-            reverse("offers:offers-list"), self.post_data, format="json"
-        )
+        response = self.client.post(reverse("offers:offers-list"), self.post_data, format="json")
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
     def test_create_offer_user_not_business(self):
@@ -346,7 +351,5 @@ class OfferCreateTestCase(OfferTestSetup):
         """
         self.authenticate_user(user_type="customer", custom_user_number="1")
 
-        response = self.client.post(
-            reverse("offers:offers-list"), self.post_data, format="json"
-        )
+        response = self.client.post(reverse("offers:offers-list"), self.post_data, format="json")
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
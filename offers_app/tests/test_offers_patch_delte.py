@@ -27,9 +27,7 @@ class OfferUpdateTestCase(OfferTestSetup):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["title"], self.patch_data["title"])
         self.assertEqual(len(response.data["details"]), 3)
-        self.assertEqual(
-            response.data["details"][0]["title"], self.patch_data["details"][0]["title"]
-        )
+        self.assertEqual(response.data["details"][0]["title"], self.patch_data["details"][0]["title"])
         self.assertEqual(
             response.data["details"][0]["delivery_time_in_days"],
             self.patch_data["details"][0]["delivery_time_in_days"],
@@ -147,3 +145,71 @@ class OfferDeleteTestCase(OfferTestSetup):
         # Check if the offer is actually deleted
         with self.assertRaises(Offer.DoesNotExist):
             Offer.objects.get(id=offer.id)
+
+
+class OfferPatchQueryCountTestCase(OfferTestSetup):
+
+    def setUp(self):
+        super().setUp()
+        self.three_tier_patch = {
+            "title": "Updated Offer",
+            "details": [
+                {"offer_type": "basic", "price": 120, "delivery_time_in_days": 2},
+                {"offer_type": "standard", "title": "Standard Patched"},
+                {"offer_type": "premium", "features": ["Everything"]},
+            ],
+        }
+
+    def test_patch_offer_query_count(self):
+        """
+        Test if a three-tier PATCH runs a fixed number of queries:
+        token, savepoint, offer, prefetched details, one bulk_update, offer update,
+        search index refresh (2 on SQLite), release savepoint.
+        """
+        self.authenticate_user(user_type="business", custom_user_number="1")
+        offer = Offer.objects.get(title="Test Offer 1")
+
+        with self.assertNumQueries(9):
+            response = self.client.patch(
+                reverse("offers:offers-detail", args=[offer.id]),
+                self.three_tier_patch,
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        offer.refresh_from_db()
+        self.assertEqual(offer.min_price, 120)
+        self.assertEqual(offer.min_delivery_time, 2)
+        self.assertEqual(response.data["details"][1]["title"], "Standard Patched")
+        self.assertEqual(response.data["details"][2]["features"], ["Everything"])
+
+    def test_patch_unknown_offer_type(self):
+        """
+        Test if patching a detail type the offer does not have returns a 400 status code.
+        """
+        self.authenticate_user(user_type="business", custom_user_number="1")
+        offer = Offer.objects.get(title="Test Offer 1")
+
+        response = self.client.patch(
+            reverse("offers:offers-detail", args=[offer.id]),
+            {"details": [{"offer_type": "gold", "price": 1}]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_patch_response_orders_details_by_price(self):
+        """
+        Test if the response lists the details by their new prices.
+        """
+        self.authenticate_user(user_type="business", custom_user_number="1")
+        offer = Offer.objects.get(title="Test Offer 1")
+
+        response = self.client.patch(
+            reverse("offers:offers-detail", args=[offer.id]),
+            {"details": [{"offer_type": "basic", "price": 500}]},
+            format="json",
+        )
+
+        prices = [detail["price"] for detail in response.data["details"]]
+        self.assertEqual(prices, [200, 300, 500])
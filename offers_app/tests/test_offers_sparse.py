@@ -0,0 +1,52 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from offers_app.tests.test_offers_get_post import OfferTestSetup
+
+
+class OfferSparseFieldsetTestCase(OfferTestSetup):
+
+    def test_fields_param(self):
+        """
+        Test if ?fields= returns only the requested fields and skips the details prefetch and unused columns.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("offers:offers-list"), {"fields": "id,title,min_price"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data["results"][0]), {"id", "title", "min_price"})
+
+        self.assertEqual(len(queries), 2)
+        page_query = queries[-1]["sql"]
+        self.assertNotIn('"description"', page_query)
+        self.assertNotIn("auth_app_userprofile", page_query)
+
+    def test_omit_param(self):
+        """
+        Test if ?omit= drops the named fields and keeps the others.
+        """
+        response = self.client.get(reverse("offers:offers-list"), {"omit": "description,details,user_details"})
+        offer = response.data["results"][0]
+
+        self.assertNotIn("description", offer)
+        self.assertNotIn("details", offer)
+        self.assertEqual(offer["title"], "Test Offer 1")
+        self.assertEqual(offer["min_price"], 100.0)
+
+    def test_sparse_retrieve_and_cursor(self):
+        """
+        Test if sparse fieldsets work on retrieve and with cursor pagination on a deferred ordering field.
+        """
+        self.authenticate_user(user_type="customer", custom_user_number="1")
+        response = self.client.get(
+            reverse("offers:offers-list"), {"fields": "id", "cursor": "", "ordering": "min_price"}
+        )
+
+        self.assertEqual(response.data["results"], [{"id": 1}])
+
+        offer_id = response.data["results"][0]["id"]
+        response = self.client.get(reverse("offers:offers-detail", args=[offer_id]), {"fields": "title,details"})
+        self.assertEqual(set(response.data), {"title", "details"})
+        self.assertEqual(len(response.data["details"]), 3)
@@ -0,0 +1,54 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+
+from core.testing import QueryPlanTestCase
+from offers_app.models import Offer, OfferDetail
+
+User = get_user_model()
+
+
+class OfferQueryPlanTestCase(QueryPlanTestCase):
+
+    @classmethod
+    def seed(cls):
+        users = User.objects.bulk_create(
+            User(username=f"business_{number}", type="business") for number in range(cls.seed_size // 10)
+        )
+        offers = Offer.objects.bulk_create(
+            Offer(user=users[number % len(users)], title=f"Offer {number}", description="Seeded offer")
+            for number in range(cls.seed_size)
+        )
+        OfferDetail.objects.bulk_create(
+            OfferDetail(
+                offer=offer,
+                title=offer_type,
+                revisions=1,
+                delivery_time_in_days=index + 1,
+                price=Decimal(100 * (index + 1)),
+                offer_type=offer_type,
+            )
+            for offer in offers
+            for index, offer_type in enumerate(["basic", "standard", "premium"])
+        )
+        cls.user = users[0]
+        cls.offer = offers[0]
+
+    def test_offers_of_creator_by_updated_at(self):
+        """
+        Test if ?creator_id= with ?ordering=-updated_at reads offer_user_updated_idx in order.
+        """
+        self.assertIndexScan(Offer.objects.filter(user=self.user).order_by("-updated_at")[:5], ordered=True)
+
+    def test_details_of_offer_by_price(self):
+        """
+        Test if the details of an offer are read in price order from offerdetail_offer_price_idx.
+        """
+        self.assertIndexScan(OfferDetail.objects.filter(offer=self.offer).order_by("price"), ordered=True)
+
+    def test_details_prefetch(self):
+        """
+        Test if the details prefetch of a page of offers does not scan the detail table.
+        """
+        offer_ids = Offer.objects.order_by("id").values_list("id", flat=True)[:5]
+        self.assertIndexScan(OfferDetail.objects.filter(offer_id__in=list(offer_ids)).order_by("price"))
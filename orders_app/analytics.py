@@ -0,0 +1,84 @@
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db.models import F
+from django.utils import timezone
+
+from orders_app.models import OrderStatusEvent
+
+"""
+Aggregated order SLA figures per business user, read from the OrderStatusEvent log:
+completion latency (order creation until "completed") and time spent in each status before leaving it.
+Both queries are range reads on the (business_user, ...) indexes of the events within a time window,
+their cost grows with the events in the window, not with the table.
+"""
+
+PERCENTILES = (50, 90, 99)
+DEFAULT_WINDOW = timedelta(days=30)
+
+
+def percentile(sorted_values, rank):
+    """
+    Nearest rank percentile of an ascending list.
+    """
+    index = max(0, -(-rank * len(sorted_values) // 100) - 1)
+    return sorted_values[index]
+
+
+def summarize(durations):
+    """
+    Count, average and percentiles in seconds of a list of timedeltas.
+    """
+    if not durations:
+        return {"count": 0, "avg": None, **{f"p{rank}": None for rank in PERCENTILES}}
+
+    seconds = sorted(duration.total_seconds() for duration in durations)
+    summary = {"count": len(seconds), "avg": round(sum(seconds) / len(seconds), 3)}
+    summary.update({f"p{rank}": percentile(seconds, rank) for rank in PERCENTILES})
+    return summary
+
+
+def events_in_window(business_user_ids, since, until):
+    return OrderStatusEvent.objects.filter(
+        business_user_id__in=business_user_ids, created_at__gte=since, created_at__lt=until
+    ).order_by()
+
+
+def completion_latencies(business_user_ids, since, until):
+    events = events_in_window(business_user_ids, since, until).filter(to_status="completed")
+    rows = events.values_list("business_user_id", F("created_at") - F("order_created_at"))
+
+    latencies = defaultdict(list)
+    for business_user_id, duration in rows:
+        latencies[business_user_id].append(duration)
+    return latencies
+
+
+def time_in_status(business_user_ids, since, until):
+    events = events_in_window(business_user_ids, since, until).filter(from_status__isnull=False)
+    rows = events.values_list("business_user_id", "from_status", F("created_at") - F("previous_at"))
+
+    durations = defaultdict(lambda: defaultdict(list))
+    for business_user_id, from_status, duration in rows:
+        durations[business_user_id][from_status].append(duration)
+    return durations
+
+
+def order_sla_stats(business_user_ids, since=None, until=None):
+    """
+    Returns {business_user_id: {"completion_latency": summary, "time_in_status": {status: summary}}}
+    for the status changes between since (default: 30 days before until) and until (default: now).
+    """
+    until = until or timezone.now()
+    since = since or until - DEFAULT_WINDOW
+
+    latencies = completion_latencies(business_user_ids, since, until)
+    durations = time_in_status(business_user_ids, since, until)
+
+    return {
+        business_user_id: {
+            "completion_latency": summarize(latencies.get(business_user_id, [])),
+            "time_in_status": {status: summarize(values) for status, values in durations[business_user_id].items()},
+        }
+        for business_user_id in business_user_ids
+    }
@@ -1,15 +1,18 @@
+from django.core.exceptions import ObjectDoesNotExist
 from rest_framework import serializers
+from rest_framework.exceptions import NotFound
 from django.contrib.auth import get_user_model
 from orders_app.models import Order
 from offers_app.models import OfferDetail
+from core.sparse import SparseFieldsetMixin
 
 
 User = get_user_model()
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
-    Serializer for Order model, handles serialization and validation for orders.
+    Serializer for Order model, handles serialization and validation for orders, supports ?fields= / ?omit=.
     """
 
     title = serializers.CharField(source="offer_detail.title", read_only=True)
@@ -44,12 +47,26 @@ class OrderSerializer(serializers.ModelSerializer):
         read_only_fields = ["created_at", "updated_at"]
 
 
+class OfferDetailField(serializers.PrimaryKeyRelatedField):
+    """
+    Loads the offer detail joined to its offer in one query, an unknown id is a 404.
+    """
+
+    def to_internal_value(self, data):
+        try:
+            return self.get_queryset().get(pk=data)
+        except ObjectDoesNotExist:
+            raise NotFound(f"OfferDetail with ID {data} does not exist.")
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+
 class OrderCreateUpdateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating new orders, handles validation and creation of orders.
     """
 
-    offer_detail_id = serializers.PrimaryKeyRelatedField(queryset=OfferDetail.objects.all(), write_only=True)
+    offer_detail_id = OfferDetailField(queryset=OfferDetail.objects.select_related("offer"), write_only=True)
 
     class Meta:
         model = Order
@@ -63,12 +80,14 @@ class OrderCreateUpdateSerializer(serializers.ModelSerializer):
         read_only_fields = ["created_at", "updated_at", "business_user", "offer_detail", "customer_user"]
 
     def create(self, validated_data):
+        """
+        Inserts the order from the already joined detail / offer, the response reuses the same objects.
+        """
         customer_user = self.context["request"].user
         detail = validated_data.pop("offer_detail_id")
-        business_user = detail.offer.user
 
         order = Order.objects.create(
-            customer_user=customer_user, offer_detail=detail, business_user=business_user, **validated_data
+            customer_user=customer_user, offer_detail=detail, business_user_id=detail.offer.user_id, **validated_data
         )
 
         return order
@@ -1,19 +1,66 @@
 from rest_framework import viewsets, status, permissions, mixins
+from rest_framework.decorators import action
+from django.http import StreamingHttpResponse
+from django_filters.rest_framework import ChoiceFilter, FilterSet, IsoDateTimeFilter
 from rest_framework.response import Response
 from orders_app.api.serializers import OrderSerializer, OrderCreateUpdateSerializer
-from orders_app.models import Order
-from offers_app.models import OfferDetail
+from orders_app.models import ArchivedOrder, Order, BusinessOrderCounter
+from orders_app.archive import load_in_id_order, wants_archived
+from orders_app.counters import STATUS_COLUMNS, count_orders_by_status
+from orders_app.analytics import order_sla_stats
+from orders_app.export import EXPORT_FORMATS, export_rows
 from orders_app.api.permissions import OrdersPermissions
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from django.shortcuts import get_object_or_404
 from rest_framework.views import APIView
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from core.pagination import CursorPaginationMixin, KeysetPagination, OptionalPageNumberPagination
+from core.sparse import SparseQuerysetMixin
+from core.idempotency import idempotent
 
 
 User = get_user_model()
 
 
+class OrderPagination(OptionalPageNumberPagination):
+    """
+    Opt-in page number pagination for the orders list (?page= / ?page_size=).
+    """
+
+    page_size = 10
+    max_page_size = 100
+
+
+class OrderCursorPagination(KeysetPagination):
+    """
+    Opt-in keyset pagination for the orders list (?cursor=), pages by id without counting.
+    """
+
+    page_size = 10
+    max_page_size = 100
+
+
+class OrderExportFilter(FilterSet):
+    """
+    FilterSet for the order export: creation date range and status.
+    """
+
+    created_after = IsoDateTimeFilter(field_name="created_at", lookup_expr="gte")
+    created_before = IsoDateTimeFilter(field_name="created_at", lookup_expr="lt")
+    status = ChoiceFilter(choices=Order.status_choices)
+
+    class Meta:
+        model = Order
+        fields = ["created_after", "created_before", "status"]
+
+
 class OrderViewSet(
+    SparseQuerysetMixin,
+    CursorPaginationMixin,
     mixins.ListModelMixin,
     mixins.CreateModelMixin,
     mixins.UpdateModelMixin,
@@ -33,21 +80,87 @@ class OrderViewSet(
         "partial_update": OrderCreateUpdateSerializer,
     }
     permission_classes = [OrdersPermissions]
+    pagination_class = OrderPagination
+    cursor_pagination_class = OrderCursorPagination
 
-    def create(self, request, *args, **kwargs):
+    def get_queryset(self):
+        """
+        Orders joined to their offer detail, the list only holds orders of the requesting user.
+        """
+        queryset = Order.objects.select_related("offer_detail")
 
+        if self.action in ("list", "export"):
+            queryset = self.scope_to_user(queryset)
+
+        return queryset.order_by("id")
+
+    def get_archived_queryset(self):
+        return self.scope_to_user(ArchivedOrder.objects.select_related("offer_detail")).order_by("id")
+
+    def scope_to_user(self, queryset):
+        user = self.request.user
+        return queryset.filter(Q(customer_user=user) | Q(business_user=user))
+
+    def list(self, request, *args, **kwargs):
+        if wants_archived(request):
+            return self.list_with_archive(request)
+        return super().list(request, *args, **kwargs)
+
+    def list_with_archive(self, request):
+        """
+        Pages over the ids of live and archived orders (UNION ALL in id order),
+        then loads the orders of the page from both tables.
+        """
+        if self.cursor_pagination_class.cursor_query_param in request.query_params:
+            raise ValidationError({"include_archived": "Cannot be combined with cursor pagination."})
+
+        hot, archived = self.filter_queryset(self.get_queryset()), self.get_archived_queryset()
+        hot_ids = hot.order_by().values_list("id", flat=True)
+        archived_ids = archived.order_by().values_list("id", flat=True)
+        ids = hot_ids.union(archived_ids, all=True).order_by("id")
+
+        page = self.paginate_queryset(ids)
+        serializer = self.get_serializer(load_in_id_order(ids if page is None else page, hot, archived), many=True)
+        return Response(serializer.data) if page is None else self.get_paginated_response(serializer.data)
+
+    @idempotent
+    def create(self, request, *args, **kwargs):
+        """
+        The offer detail is loaded (joined to its offer, 404 if missing) once by the serializer field.
+        Retries carrying the same Idempotency-Key header replay the first response.
+        """
         offer_detail_id = request.data.get("offer_detail_id")
         if offer_detail_id is not None:
             try:
-                offer_detail_id = int(offer_detail_id)
+                int(offer_detail_id)
             except (ValueError, TypeError):
                 return Response({"error": "offer_detail_id must be a number"}, status=status.HTTP_400_BAD_REQUEST)
 
-        if offer_detail_id and not OfferDetail.objects.filter(id=offer_detail_id).exists():
-            raise NotFound(f"OfferDetail with ID {offer_detail_id} does not exist.")
-
         return super().create(request, *args, **kwargs)
 
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """
+        Streams the orders of the requesting user as CSV (default) or NDJSON (?file_format=ndjson),
+        filtered by ?created_after= / ?created_before= / ?status=, archived orders with ?include_archived=true.
+        """
+        file_format = request.query_params.get("file_format", "csv")
+        if file_format not in EXPORT_FORMATS:
+            raise ValidationError({"file_format": f"Expected one of: {', '.join(EXPORT_FORMATS)}."})
+
+        filterset = OrderExportFilter(request.query_params, queryset=self.get_queryset())
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+
+        archived = None
+        if wants_archived(request):
+            archived = OrderExportFilter(request.query_params, queryset=self.get_archived_queryset()).qs
+
+        content_type, stream = EXPORT_FORMATS[file_format]
+        response = StreamingHttpResponse(stream(export_rows(filterset.qs, archived)), content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="orders.{file_format}"'
+        return response
+
     def get_serializer_class(self):
         return self.serializer_action_classes.get(self.action, self.serializer_class)
 
@@ -56,6 +169,36 @@ class OrderViewSet(
         self.perform_destroy(instance)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    # the order row, its BusinessOrderCounter update and OrderStatusEvent (orders_app.signals) commit together
+
+    @transaction.atomic
+    def perform_create(self, serializer):
+        serializer.save()
+
+    @transaction.atomic
+    def perform_update(self, serializer):
+        serializer.save()
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        instance.delete()
+
+
+def get_business_order_count(business_user_id, status_column, include_archived=False):
+    """
+    Reads one status count of the live orders from the counter row (primary key lookup),
+    include_archived adds the archived orders, like every other count path only on request.
+    Without a row the business user has no live orders, or does not exist (404).
+    """
+    count = BusinessOrderCounter.objects.filter(pk=business_user_id).values_list(status_column, flat=True).first()
+    if count is None:
+        get_object_or_404(User, id=business_user_id, type="business")
+        count = 0
+
+    if include_archived:
+        count += ArchivedOrder.objects.filter(business_user_id=business_user_id, status=status_column).count()
+    return count
+
 
 class OrderCountView(APIView):
     """
@@ -65,9 +208,7 @@ class OrderCountView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, business_user_id):
-        business_user = get_object_or_404(User, id=business_user_id, type="business")
-
-        order_count = Order.objects.filter(business_user=business_user, status="in_progress").count()
+        order_count = get_business_order_count(business_user_id, "in_progress", wants_archived(request))
 
         return Response({"order_count": order_count}, status=status.HTTP_200_OK)
 
@@ -80,9 +221,78 @@ class CompletedOrderCountView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, business_user_id):
+        completed_order_count = get_business_order_count(business_user_id, "completed", wants_archived(request))
 
-        business_user = get_object_or_404(User, id=business_user_id, type="business")
+        return Response({"completed_order_count": completed_order_count}, status=status.HTTP_200_OK)
 
-        completed_order_count = Order.objects.filter(business_user=business_user, status="completed").count()
 
-        return Response({"completed_order_count": completed_order_count}, status=status.HTTP_200_OK)
+class BusinessUserIdsMixin:
+    """
+    Parses the ?business_user_ids=1,2,3 parameter of the batch views.
+    """
+
+    max_ids = 100
+
+    def parse_ids(self, value):
+        """
+        Returns the unique ids in request order, raises a 400 for non numeric or too many ids.
+        """
+        try:
+            ids = list(dict.fromkeys(int(part) for part in value.split(",") if part.strip()))
+        except ValueError:
+            raise ValidationError({"business_user_ids": "Expected a comma separated list of ids."})
+
+        if not 0 < len(ids) <= self.max_ids:
+            raise ValidationError({"business_user_ids": f"Expected 1 to {self.max_ids} ids."})
+        return ids
+
+
+class OrderStatsBatchView(BusinessUserIdsMixin, APIView):
+    """
+    View to get the in progress / completed / cancelled order counts of many business users at once:
+    GET /api/order-stats/?business_user_ids=1,2,3 (&include_archived=true to count archived orders)
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        ids = self.parse_ids(request.query_params.get("business_user_ids", ""))
+        business_user_ids = set(User.objects.filter(id__in=ids, type="business").values_list("id", flat=True))
+        counts = count_orders_by_status(business_user_ids, include_archived=wants_archived(request))
+
+        empty = dict.fromkeys(STATUS_COLUMNS, 0)
+        stats = [{"business_user": pk, **counts.get(pk, empty)} for pk in ids if pk in business_user_ids]
+        return Response(stats, status=status.HTTP_200_OK)
+
+
+class OrderSLAView(BusinessUserIdsMixin, APIView):
+    """
+    View to get completion latency and time in status percentiles (seconds) of business users:
+    GET /api/order-sla/?business_user_ids=1,2&since=2025-01-01T00:00:00Z&until=2025-02-01T00:00:00Z
+    Business users only see their own figures, staff users any.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        ids = self.parse_ids(request.query_params.get("business_user_ids", ""))
+        if not request.user.is_staff and ids != [request.user.id]:
+            raise PermissionDenied("You can only view the order statistics of your own business.")
+
+        since, until = self.parse_datetime_param("since"), self.parse_datetime_param("until")
+        stats = order_sla_stats(ids, since=since, until=until)
+
+        return Response([{"business_user": pk, **stats[pk]} for pk in ids], status=status.HTTP_200_OK)
+
+    def parse_datetime_param(self, name):
+        value = self.request.query_params.get(name)
+        if not value:
+            return None
+
+        try:
+            parsed = parse_datetime(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValidationError({name: "Expected an ISO 8601 date time."})
+        return parsed if timezone.is_aware(parsed) else timezone.make_aware(parsed)
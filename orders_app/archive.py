@@ -0,0 +1,92 @@
+from collections import Counter
+
+from django.db import connection, transaction
+
+from orders_app.counters import change_counts
+from orders_app.models import ArchivedOrder, Order
+
+"""
+Cold storage for finished orders: completed / cancelled orders are moved from Order into ArchivedOrder
+in batches, keeping the live table and its indexes small. Reads only include the archive when the
+request asks for it with ?include_archived=true, this also holds for the count endpoints:
+BusinessOrderCounter only counts live orders, archiving moves the counts out of it.
+"""
+
+ARCHIVE_STATUSES = ("completed", "cancelled")
+ARCHIVED_FIELDS = (
+    "id",
+    "business_user_id",
+    "customer_user_id",
+    "offer_detail_id",
+    "status",
+    "created_at",
+    "updated_at",
+)
+INCLUDE_ARCHIVED_PARAM = "include_archived"
+
+
+def wants_archived(request):
+    return request.query_params.get(INCLUDE_ARCHIVED_PARAM, "").lower() in ("1", "true", "yes")
+
+
+def archive_orders(before, batch_size=1000):
+    """
+    Moves completed / cancelled orders last updated before the given time into ArchivedOrder,
+    one transaction per batch. Returns the number of moved orders.
+    """
+    moved = 0
+    while True:
+        count = archive_batch(before, batch_size)
+        moved += count
+        if count < batch_size:
+            return moved
+
+
+@transaction.atomic
+def archive_batch(before, batch_size):
+    orders = Order.objects.filter(status__in=ARCHIVE_STATUSES, updated_at__lt=before).order_by("id")
+    rows = list(orders.select_for_update().values(*ARCHIVED_FIELDS)[:batch_size])
+    if not rows:
+        return 0
+
+    ArchivedOrder.objects.bulk_create(ArchivedOrder(**row) for row in rows)
+    delete_moved_orders([row["id"] for row in rows])
+    remove_from_counters(rows)
+    return len(rows)
+
+
+def remove_from_counters(rows):
+    """
+    Subtracts the moved orders from the live counters, one UPDATE per business user of the batch.
+    """
+    moved = Counter((row["business_user_id"], row["status"]) for row in rows)
+    deltas = {}
+    for (business_user_id, order_status), count in moved.items():
+        deltas.setdefault(business_user_id, {})[order_status] = -count
+
+    for business_user_id, statuses in deltas.items():
+        change_counts(business_user_id, statuses)
+
+
+def delete_moved_orders(ids):
+    """
+    Deletes the moved rows with a plain DELETE instead of QuerySet.delete(): no post_delete signals
+    are sent, so the OrderStatusEvent log keeps covering archived orders and the counters are only
+    adjusted once per batch by remove_from_counters().
+    Nothing cascades from Order (OrderStatusEvent.order is DO_NOTHING without a constraint).
+    """
+    table = connection.ops.quote_name(Order._meta.db_table)
+    placeholders = ", ".join(["%s"] * len(ids))
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {table} WHERE id IN ({placeholders})", ids)
+
+
+def load_in_id_order(ids, *querysets):
+    """
+    Fetches the orders of the given ids from the hot and archive querysets, in the order of ids.
+    """
+    ids = list(ids)
+    found = {}
+    for queryset in querysets:
+        found.update(queryset.in_bulk(ids))
+    return [found[pk] for pk in ids if pk in found]
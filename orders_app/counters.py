@@ -0,0 +1,63 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+
+from orders_app.models import ArchivedOrder, BusinessOrderCounter, Order
+
+STATUS_COLUMNS = [status for status, _ in Order.status_choices]
+
+
+def change_counts(business_user_id, deltas):
+    """
+    Adds {status: delta} to the counter row of a business user in one UPDATE,
+    creating the row on the first order. Without a row there is nothing to remove
+    (e.g. orders deleted along with their business user and its counter).
+    """
+    deltas = {status: delta for status, delta in deltas.items() if delta and status in STATUS_COLUMNS}
+    if not deltas:
+        return
+
+    counters = BusinessOrderCounter.objects.filter(pk=business_user_id)
+    if counters.update(**{status: F(status) + delta for status, delta in deltas.items()}):
+        return
+    if sum(deltas.values()) <= 0:
+        return
+
+    try:
+        with transaction.atomic():
+            BusinessOrderCounter.objects.create(business_user_id=business_user_id, **deltas)
+    except IntegrityError:
+        # created concurrently between our UPDATE and INSERT
+        counters.update(**{status: F(status) + delta for status, delta in deltas.items()})
+
+
+def count_orders_by_status(business_user_ids=None, include_archived=False):
+    """
+    Returns {business_user_id: {status: count}} computed from Order in one grouped query,
+    ArchivedOrder adds a second one with include_archived.
+    """
+    models = [Order, ArchivedOrder] if include_archived else [Order]
+    counts = {}
+
+    for model in models:
+        orders = model.objects.order_by()
+        if business_user_ids is not None:
+            orders = orders.filter(business_user_id__in=business_user_ids)
+
+        for row in orders.values("business_user_id", "status").annotate(total=Count("id")):
+            statuses = counts.setdefault(row["business_user_id"], dict.fromkeys(STATUS_COLUMNS, 0))
+            statuses[row["status"]] += row["total"]
+    return counts
+
+
+@transaction.atomic
+def rebuild_counters():
+    """
+    Replaces all counter rows with the counts from Order, returns the number of rows written.
+    """
+    counts = count_orders_by_status()
+    BusinessOrderCounter.objects.all().delete()
+    BusinessOrderCounter.objects.bulk_create(
+        BusinessOrderCounter(business_user_id=business_user_id, **statuses)
+        for business_user_id, statuses in counts.items()
+    )
+    return len(counts)
@@ -0,0 +1,30 @@
+from orders_app.models import OrderStatusEvent
+
+"""
+Writes the OrderStatusEvent log. Called from the Order post_save signal, so the event row
+commits or rolls back together with the status change it records.
+"""
+
+
+def record_status_event(order, from_status):
+    """
+    Appends the event of an order entering its current status, from_status is None on creation.
+    previous_at is when the order entered from_status: its latest event, else its creation.
+    """
+    previous_at = None
+    if from_status is not None:
+        previous_at = (
+            OrderStatusEvent.objects.filter(order_id=order.pk)
+            .order_by("-created_at")
+            .values_list("created_at", flat=True)
+            .first()
+        ) or order.created_at
+
+    return OrderStatusEvent.objects.create(
+        order_id=order.pk,
+        business_user_id=order.business_user_id,
+        from_status=from_status,
+        to_status=order.status,
+        previous_at=previous_at,
+        order_created_at=order.created_at,
+    )
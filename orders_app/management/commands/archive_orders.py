@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from orders_app.archive import ARCHIVE_STATUSES, archive_orders
+from orders_app.models import Order
+
+
+class Command(BaseCommand):
+    """
+    Moves completed / cancelled orders untouched for --days into the ArchivedOrder table in batches.
+    """
+
+    help = "Move old completed / cancelled orders into the archive table in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=365, help="Archive orders last updated before this many days.")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Orders moved per transaction.")
+        parser.add_argument("--dry-run", action="store_true", help="Only report how many orders would be moved.")
+
+    def handle(self, *args, **options):
+        before = timezone.now() - timedelta(days=options["days"])
+
+        if options["dry_run"]:
+            count = Order.objects.filter(status__in=ARCHIVE_STATUSES, updated_at__lt=before).count()
+            self.stdout.write(f"{count} orders would be archived.")
+            return
+
+        moved = archive_orders(before, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Archived {moved} orders."))
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from orders_app.counters import STATUS_COLUMNS, count_orders_by_status, rebuild_counters
+from orders_app.models import BusinessOrderCounter
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds the BusinessOrderCounter table from the live orders, or verifies it with --check.
+    """
+
+    help = "Rebuild the per-business order counters from the orders, or verify them with --check."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report business users whose counters differ from their orders, do not write.",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            return self.check_counters()
+
+        rows = rebuild_counters()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt order counters of {rows} business users."))
+
+    def check_counters(self):
+        """
+        Compares stored and computed counts, raises CommandError when any business user is out of sync.
+        """
+        expected = count_orders_by_status()
+        stored = {
+            row.pop("business_user_id"): row
+            for row in BusinessOrderCounter.objects.values("business_user_id", *STATUS_COLUMNS)
+        }
+        empty = dict.fromkeys(STATUS_COLUMNS, 0)
+
+        stale_ids = sorted(
+            user_id
+            for user_id in expected.keys() | stored.keys()
+            if expected.get(user_id, empty) != stored.get(user_id, empty)
+        )
+        if stale_ids:
+            raise CommandError(f"{len(stale_ids)} business users out of sync: {stale_ids[:20]}")
+
+        self.stdout.write(self.style.SUCCESS("All order counters are in sync."))
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.4 on 2026-10-18 10:24
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_order_counters(apps, schema_editor):
+    Order = apps.get_model("orders_app", "Order")
+    BusinessOrderCounter = apps.get_model("orders_app", "BusinessOrderCounter")
+
+    counters = {}
+    for row in Order.objects.order_by().values("business_user_id", "status").annotate(total=Count("id")):
+        counter = counters.setdefault(
+            row["business_user_id"], BusinessOrderCounter(business_user_id=row["business_user_id"])
+        )
+        setattr(counter, row["status"], row["total"])
+
+    BusinessOrderCounter.objects.bulk_create(counters.values())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth_app", "0001_initial"),
+        ("orders_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BusinessOrderCounter",
+            fields=[
+                (
+                    "business_user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="order_counter",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("in_progress", models.IntegerField(default=0)),
+                ("completed", models.IntegerField(default=0)),
+                ("cancelled", models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_order_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,125 @@
+# Generated by Django 5.2.4 on 2026-10-18 10:31
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+BACKFILL_CHUNK_SIZE = 2000
+
+
+def backfill_status_events(apps, schema_editor):
+    """
+    Existing orders get their creation event, finished orders also a transition at their last update.
+    The events are written per chunk, so memory stays bounded by the chunk size.
+    """
+    Order = apps.get_model("orders_app", "Order")
+    OrderStatusEvent = apps.get_model("orders_app", "OrderStatusEvent")
+
+    events = []
+    for order in Order.objects.order_by("id").iterator(chunk_size=BACKFILL_CHUNK_SIZE):
+        common = {"order_id": order.id, "business_user_id": order.business_user_id, "order_created_at": order.created_at}
+        events.append(OrderStatusEvent(to_status="in_progress", created_at=order.created_at, **common))
+        if order.status != "in_progress":
+            events.append(
+                OrderStatusEvent(
+                    from_status="in_progress",
+                    to_status=order.status,
+                    previous_at=order.created_at,
+                    created_at=order.updated_at,
+                    **common,
+                )
+            )
+        if len(events) >= BACKFILL_CHUNK_SIZE:
+            OrderStatusEvent.objects.bulk_create(events)
+            events = []
+
+    OrderStatusEvent.objects.bulk_create(events)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders_app", "0003_composite_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrderStatusEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "from_status",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("in_progress", "In Progress"),
+                            ("completed", "Completed"),
+                            ("cancelled", "Cancelled"),
+                        ],
+                        max_length=20,
+                        null=True,
+                    ),
+                ),
+                (
+                    "to_status",
+                    models.CharField(
+                        choices=[
+                            ("in_progress", "In Progress"),
+                            ("completed", "Completed"),
+                            ("cancelled", "Cancelled"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("previous_at", models.DateTimeField(blank=True, null=True)),
+                ("order_created_at", models.DateTimeField()),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "business_user",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        db_index=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "order",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        db_index=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="status_events",
+                        to="orders_app.order",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["business_user", "to_status", "created_at"],
+                        name="orderevent_business_to_idx",
+                    ),
+                    models.Index(
+                        fields=["business_user", "created_at"],
+                        name="orderevent_business_at_idx",
+                    ),
+                    models.Index(
+                        fields=["order", "created_at"], name="orderevent_order_at_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_status_events, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations
+from django.db.models import Count, F
+
+
+def shift_archived_counts(apps, sign):
+    ArchivedOrder = apps.get_model("orders_app", "ArchivedOrder")
+    BusinessOrderCounter = apps.get_model("orders_app", "BusinessOrderCounter")
+
+    for row in ArchivedOrder.objects.order_by().values("business_user_id", "status").annotate(total=Count("id")):
+        BusinessOrderCounter.objects.filter(business_user_id=row["business_user_id"]).update(
+            **{row["status"]: F(row["status"]) + sign * row["total"]}
+        )
+
+
+def remove_archived_from_counters(apps, schema_editor):
+    shift_archived_counts(apps, -1)
+
+
+def add_archived_to_counters(apps, schema_editor):
+    shift_archived_counts(apps, 1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders_app", "0005_archivedorder"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_archived_from_counters, add_archived_to_counters),
+    ]
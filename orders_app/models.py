@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 from offers_app.models import Offer
 
 User = get_user_model()
@@ -16,12 +17,125 @@ class Order(models.Model):
         ("cancelled", "Cancelled"),
     ]
 
-    business_user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="business_user_orders")
-    customer_user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name="customer_user_orders")
+    business_user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="business_user_orders", db_index=False
+    )
+    customer_user = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, related_name="customer_user_orders", db_index=False
+    )
     offer_detail = models.ForeignKey("offers_app.OfferDetail", on_delete=models.CASCADE, related_name="order")
     status = models.CharField(max_length=20, choices=status_choices, default="in_progress")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # grouped status counts per business user (order stats, counter reconcile) and the orders list
+            models.Index(fields=["business_user", "status"], name="order_business_status_idx"),
+            # orders list of a customer, orders of deleted customers are never looked up by customer
+            models.Index(
+                fields=["customer_user"],
+                condition=models.Q(customer_user__isnull=False),
+                name="order_customer_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"Order {self.id} by {self.customer_user.username}"
+
+
+class BusinessOrderCounter(models.Model):
+    """
+    Materialized number of live orders per status for one business user (archived orders are moved out
+    by orders_app.archive), maintained by orders_app.signals and rebuilt by the reconcile_order_counters command.
+    """
+
+    business_user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        related_name="order_counter",
+        primary_key=True,
+    )
+    in_progress = models.IntegerField(default=0)
+    completed = models.IntegerField(default=0)
+    cancelled = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"Order counter of {self.business_user_id}"
+
+
+class ArchivedOrder(models.Model):
+    """
+    Cold storage for completed / cancelled orders moved out of Order by the archive_orders command.
+    Rows keep their order id, so ids are unique across both tables and can be merged in id order.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    business_user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="archived_business_user_orders", db_index=False
+    )
+    customer_user = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, related_name="archived_customer_user_orders", db_index=False
+    )
+    offer_detail = models.ForeignKey("offers_app.OfferDetail", on_delete=models.CASCADE, related_name="archived_order")
+    status = models.CharField(max_length=20, choices=Order.status_choices)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            # grouped status counts with ?include_archived= and the counter reconcile
+            models.Index(fields=["business_user", "status"], name="archived_business_status_idx"),
+            # archived orders of a customer in the orders list / export
+            models.Index(
+                fields=["customer_user"],
+                condition=models.Q(customer_user__isnull=False),
+                name="archived_customer_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Archived order {self.id}"
+
+
+class OrderStatusEvent(models.Model):
+    """
+    Append-only log of order status changes, one row per creation (from_status empty) and transition.
+    previous_at is when the order entered from_status, order_created_at is copied from the order,
+    so time-in-status and completion latency are plain column differences. No database constraint
+    ties the rows to Order, the history outlives deleted orders.
+    """
+
+    order = models.ForeignKey(
+        Order, on_delete=models.DO_NOTHING, db_constraint=False, related_name="status_events", db_index=False
+    )
+    business_user = models.ForeignKey(
+        User, on_delete=models.DO_NOTHING, db_constraint=False, related_name="+", db_index=False
+    )
+    from_status = models.CharField(max_length=20, choices=Order.status_choices, null=True, blank=True)
+    to_status = models.CharField(max_length=20, choices=Order.status_choices)
+    previous_at = models.DateTimeField(null=True, blank=True)
+    order_created_at = models.DateTimeField()
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            # completion latency per business user and period
+            models.Index(fields=["business_user", "to_status", "created_at"], name="orderevent_business_to_idx"),
+            # time in status per business user and period
+            models.Index(fields=["business_user", "created_at"], name="orderevent_business_at_idx"),
+            # latest event of an order when logging the next transition
+            models.Index(fields=["order", "created_at"], name="orderevent_order_at_idx"),
+        ]
+
+    def __str__(self):
+        return f"Order {self.order_id}: {self.from_status} -> {self.to_status}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("Order status events are append-only.")
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValueError("Order status events are append-only.")
@@ -0,0 +1,38 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from orders_app.counters import change_counts
+from orders_app.events import record_status_event
+from orders_app.models import Order
+
+"""
+Signals keeping BusinessOrderCounter and the OrderStatusEvent log in sync with every Order create,
+status change and delete. The status as last saved is remembered on the instance, so a save only
+counts and logs when it changed. Queryset update() / bulk_create() bypass them,
+use the reconcile_order_counters command after those.
+"""
+
+
+@receiver(post_init, sender=Order)
+def remember_saved_status(sender, instance, **kwargs):
+    instance._saved_status = instance.__dict__.get("status")
+
+
+@receiver(post_save, sender=Order)
+def track_order_status_on_save(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is not None and "status" not in update_fields:
+        return
+
+    if created:
+        change_counts(instance.business_user_id, {instance.status: 1})
+        record_status_event(instance, None)
+    elif instance._saved_status is not None and instance._saved_status != instance.status:
+        change_counts(instance.business_user_id, {instance._saved_status: -1, instance.status: 1})
+        record_status_event(instance, instance._saved_status)
+
+    instance._saved_status = instance.status
+
+
+@receiver(post_delete, sender=Order)
+def count_order_on_delete(sender, instance, **kwargs):
+    change_counts(instance.business_user_id, {instance._saved_status or instance.status: -1})
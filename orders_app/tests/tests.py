@@ -1,14 +1,24 @@
 from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth import get_user_model
-from orders_app.models import Order
+from orders_app.models import ArchivedOrder, Order, BusinessOrderCounter, OrderStatusEvent
+from orders_app.analytics import completion_latencies, time_in_status
 from offers_app.models import OfferDetail, Offer
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from django.contrib.auth import get_user_model
 from rest_framework.authtoken.models import Token
+import json
 import re
 from urllib.parse import urlparse
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Count, Q
+from django.utils import timezone
+from datetime import timedelta
+from core.testing import QueryPlanTestCase
+from core.idempotency import get_cache as get_idempotency_cache, idempotency_cache_key
 
 
 User = get_user_model()
@@ -293,3 +303,538 @@ class Order_count_completeTestCase(OrderTestSetup):
         self.authenticate_user(user_type="business", custom_user_number="1")
         response = self.client.get(reverse("completed-order-count", kwargs={"business_user_id": 999}))
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class OrdersSparseFieldsetTestCase(OrderTestSetup):
+
+    def test_order_list_fields(self):
+        """Test if ?fields= trims the order list to the requested fields."""
+        self.authenticate_user(user_type="business", custom_user_number="1")
+        response = self.client.get(reverse("orders:orders-list"), {"fields": "id,status,price"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0], {"id": 1, "status": "completed", "price": 300.0})
+
+
+class OrdersListQueryTestCase(OrderTestSetup):
+
+    def setUp(self):
+        super().setUp()
+        detail = OfferDetail.objects.get(id=2)
+        Order.objects.bulk_create(
+            Order(business_user=self.first_business_user, customer_user=self.first_customer_user, offer_detail=detail)
+            for _ in range(24)
+        )
+        Order.objects.create(
+            business_user=self.second_business_user,
+            customer_user=self.first_customer_user,
+            offer_detail=detail,
+        )
+
+    def test_order_list_query_count(self):
+        """Test if the order list needs the same number of queries for any number of orders."""
+        self.authenticate_user(user_type="business", custom_user_number="1")
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("orders:orders-list"))
+        self.assertEqual(len(response.data), 25)
+
+        detail = OfferDetail.objects.get(id=1)
+        Order.objects.bulk_create(Order(business_user=self.first_business_user, offer_detail=detail) for _ in range(25))
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("orders:orders-list"))
+        self.assertEqual(len(response.data), 50)
+
+    def test_order_list_scoped_to_user(self):
+        """Test if users only list orders they are customer or business user of."""
+        self.authenticate_user(user_type="business", custom_user_number="2")
+        response = self.client.get(reverse("orders:orders-list"))
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["business_user"], self.second_business_user.id)
+
+        self.authenticate_user(user_type="customer", custom_user_number="1")
+        response = self.client.get(reverse("orders:orders-list"))
+        self.assertEqual(len(response.data), 26)
+
+    def test_order_list_page_number(self):
+        """Test if ?page= / ?page_size= paginate the order list."""
+        self.authenticate_user(user_type="customer", custom_user_number="1")
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("orders:orders-list"), {"page": 2, "page_size": 10})
+
+        self.assertEqual(response.data["count"], 26)
+        self.assertEqual(len(response.data["results"]), 10)
+        self.assertEqual(response.data["results"][0]["id"], 11)
+
+    def test_order_list_cursor(self):
+        """Test if ?cursor= walks the order list without gaps."""
+        self.authenticate_user(user_type="customer", custom_user_number="1")
+        ids, url, params = [], reverse("orders:orders-list"), {"cursor": "", "page_size": 10}
+
+        while url:
+            response = self.client.get(url, params)
+            ids.extend(order["id"] for order in response.data["results"])
+            url, params = response.data["next"], None
+
+        self.assertEqual(ids, list(Order.objects.order_by("id").values_list("id", flat=True)))
+
+
+class OrderCounterTestCase(OrderTestSetup):
+
+    def get_counts(self):
+        self.authenticate_user(user_type="business", custom_user_number="1")
+        in_progress = self.client.get(reverse("order-count", kwargs={"business_user_id": 1})).data["order_count"]
+        completed = self.client.get(reverse("completed-order-count", kwargs={"business_user_id": 1}))
+        return in_progress, completed.data["completed_order_count"]
+
+    def test_counters_follow_create_patch_delete(self):
+        """Test if the counters follow order creation, status changes and deletion."""
+        self.authenticate_user(user_type="customer", custom_user_number="1")
+        order_id = self.client.post(reverse("orders:orders-list"), self.post_data, format="json").data["id"]
+        self.assertEqual(self.get_counts(), (1, 1))
+
+        self.client.patch(reverse("orders:orders-detail", kwargs={"pk": order_id}), self.patch_data_one, format="json")
+        self.assertEqual(self.get_counts(), (0, 2))
+
+        self.client.delete(reverse("orders:orders-detail", kwargs={"pk": order_id}))
+        self.assertEqual(self.get_counts(), (0, 1))
+
+    def test_count_endpoint_is_single_lookup(self):
+        """Test if the count endpoints read one counter row (token + counter query)."""
+        self.authenticate_user(user_type="business", custom_user_number="1")
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("completed-order-count", kwargs={"business_user_id": 1}))
+        self.assertEqual(response.data["completed_order_count"], 1)
+
+    def test_count_for_business_user_without_orders(self):
+        """Test if a business user without orders gets 0 and a customer user a 404."""
+        self.authenticate_user(user_type="business", custom_user_number="1")
+        response = self.client.get(reverse("order-count", kwargs={"business_user_id": 2}))
+        self.assertEqual(response.data["order_count"], 0)
+
+        response = self.client.get(reverse("order-count", kwargs={"business_user_id": 3}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_deleting_business_user_leaves_no_counter(self):
+        """Test if orders deleted along with their business user do not recreate its counter row."""
+        business_user_id = self.first_business_user.id
+        self.first_business_user.delete()
+
+        self.assertFalse(BusinessOrderCounter.objects.filter(business_user_id=business_user_id).exists())
+        call_command("reconcile_order_counters", "--check", stdout=StringIO())
+
+        self.second_business_user.delete()
+        self.assertFalse(BusinessOrderCounter.objects.exists())
+
+    def test_reconcile_command(self):
+        """Test if the reconcile command detects and repairs counters after bulk updates."""
+        Order.objects.update(status="cancelled")
+
+        with self.assertRaises(CommandError):
+            call_command("reconcile_order_counters", "--check", stdout=StringIO())
+
+        call_command("reconcile_order_counters", stdout=StringIO())
+        call_command("reconcile_order_counters", "--check", stdout=StringIO())
+
+        counter = BusinessOrderCounter.objects.get(pk=self.first_business_user.pk)
+        self.assertEqual((counter.in_progress, counter.completed, counter.cancelled), (0, 0, 1))
+
+
+class OrderStatsBatchTestCase(OrderTestSetup):
+
+    def setUp(self):
+        super().setUp()
+        Order.objects.create(
+            business_user=self.second_business_user,
+            customer_user=self.first_customer_user,
+            offer_detail=OfferDetail.objects.get(id=1),
+        )
+
+    def test_order_stats_batch(self):
+        """Test if the counts of several business users come back in request order (token, users, one grouped count)."""
+        self.authenticate_user(user_type="customer", custom_user_number="1")
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("order-stats"), {"business_user_ids": "2,1,3,999"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            [
+                {"business_user": 2, "in_progress": 1, "completed": 0, "cancelled": 0},
+                {"business_user": 1, "in_progress": 0, "completed": 1, "cancelled": 0},
+            ],
+        )
+
+    def test_order_stats_batch_invalid_ids(self):
+        """Test if missing, non numeric or too many ids return a 400 status code."""
+        self.authenticate_user(user_type="customer", custom_user_number="1")
+        for value in ["", "1,a", ",".join(str(number) for number in range(101))]:
+            response = self.client.get(reverse("order-stats"), {"business_user_ids": value})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_order_stats_batch_without_authentication(self):
+        """Test if the batch counts cannot be accessed without authentication."""
+        response = self.client.get(reverse("order-stats"), {"business_user_ids": "1"})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class OrderQueryPlanTestCase(QueryPlanTestCase):
+
+    @classmethod
+    def seed(cls):
+        businesses = User.objects.bulk_create(
+            User(username=f"business_{number}", type="business") for number in range(cls.seed_size // 50)
+        )
+        customers = User.objects.bulk_create(
+            User(username=f"customer_{number}", type="customer") for number in range(cls.seed_size // 10)
+        )
+        offer = Offer.objects.create(user=businesses[0], title="Seeded", description="Seeded offer")
+        detail = OfferDetail.objects.create(
+            offer=offer, title="Basic", revisions=1, delivery_time_in_days=1, price=10, offer_type="basic"
+        )
+        statuses = ["in_progress", "completed", "cancelled"]
+        Order.objects.bulk_create(
+            Order(
+                business_user=businesses[number % len(businesses)],
+                customer_user=customers[number % len(customers)],
+                offer_detail=detail,
+                status=statuses[number % 3],
+            )
+            for number in range(cls.seed_size)
+        )
+        cls.business_user, cls.customer_user = businesses[1], customers[1]
+
+    def test_grouped_status_counts(self):
+        """Test if the grouped status counts of some business users read order_business_status_idx."""
+        ids = [self.business_user.id, self.business_user.id + 1]
+        queryset = (
+            Order.objects.order_by().filter(business_user_id__in=ids).values("business_user", "status")
+        ).annotate(total=Count("id"))
+        self.assertIndexScan(queryset)
+
+    def test_orders_list_of_user(self):
+        """Test if the customer / business scoped orders list is served by indexes on both columns."""
+        user = self.customer_user
+        self.assertIndexScan(Order.objects.filter(Q(customer_user=user) | Q(business_user=user)).order_by("id"))
+
+
+class OrderCreateQueryTestCase(OrderTestSetup):
+
+    def test_order_create_query_count(self):
+        """
+        Test if creating an order reads the offer detail and its offer once:
+        token, joined detail, savepoint, insert, counter update, status event insert, release savepoint.
+        """
+        self.authenticate_user(user_type="customer", custom_user_number="1")
+        BusinessOrderCounter.objects.get_or_create(business_user=self.first_business_user)
+
+        with self.assertNumQueries(7):
+            response = self.client.post(reverse("orders:orders-list"), self.post_data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["business_user"], self.first_business_user.id)
+        self.assertEqual(response.data["title"], "Standard Package")
+        self.assertEqual(response.data["price"], 200.0)
+
+
+class OrderStatusEventTestCase(OrderTestSetup):
+
+    def create_and_complete_order(self):
+        self.authenticate_user(user_type="customer", custom_user_number="1")
+        order_id = self.client.post(reverse("orders:orders-list"), self.post_data, format="json").data["id"]
+
+        self.authenticate_user(user_type="business", custom_user_number="1")
+        self.client.patch(reverse("orders:orders-detail", kwargs={"pk": order_id}), self.patch_data_one, format="json")
+        return order_id
+
+    def test_events_follow_create_and_status_changes(self):
+        """Test if creating an order and changing its status append one event each."""
+        order_id = self.create_and_complete_order()
+        self.client.patch(
+            reverse("orders:orders-detail", kwargs={"pk": order_id}), {"status": "completed"}, format="json"
+        )
+
+        events = list(OrderStatusEvent.objects.filter(order_id=order_id).order_by("created_at"))
+        self.assertEqual(
+            [(event.from_status, event.to_status) for event in events],
+            [(None, "in_progress"), ("in_progress", "completed")],
+        )
+        self.assertEqual(events[1].previous_at, events[0].created_at)
+        self.assertEqual(events[1].business_user_id, self.first_business_user.id)
+
+    def test_events_are_append_only(self):
+        """Test if stored events can neither be changed nor deleted through the model."""
+        event = OrderStatusEvent.objects.get(order__status="completed")
+        event.to_status = "cancelled"
+
+        with self.assertRaises(ValueError):
+            event.save()
+        with self.assertRaises(ValueError):
+            event.delete()
+
+    def test_order_sla(self):
+        """Test if the SLA endpoint returns completion latency and time in status of the window."""
+        order_id = self.create_and_complete_order()
+        OrderStatusEvent.objects.filter(order_id=order_id, from_status="in_progress").update(
+            order_created_at=timezone.now() - timedelta(hours=2), previous_at=timezone.now() - timedelta(hours=2)
+        )
+
+        self.authenticate_user(user_type="business", custom_user_number="1")
+        response = self.client.get(reverse("order-sla"), {"business_user_ids": "1"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        latency = response.data[0]["completion_latency"]
+        self.assertEqual(latency["count"], 2)  # the setup order was created as completed
+        self.assertAlmostEqual(latency["p50"], 0, delta=5)
+        self.assertAlmostEqual(latency["p90"], 7200, delta=5)
+        self.assertEqual(response.data[0]["time_in_status"]["in_progress"]["count"], 1)
+
+    def test_order_sla_window(self):
+        """Test if events outside since / until are left out and invalid dates return a 400 status code."""
+        self.create_and_complete_order()
+        self.authenticate_user(user_type="business", custom_user_number="1")
+
+        since = (timezone.now() + timedelta(days=1)).isoformat()
+        response = self.client.get(reverse("order-sla"), {"business_user_ids": "1", "since": since})
+        self.assertEqual(response.data[0]["completion_latency"]["count"], 0)
+
+        for value in ["yesterday", "2025-13-45T00:00:00"]:
+            response = self.client.get(reverse("order-sla"), {"business_user_ids": "1", "until": value})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_order_sla_of_other_business_user(self):
+        """Test if a non staff business user cannot read the figures of another business user."""
+        self.authenticate_user(user_type="business", custom_user_number="2")
+        response = self.client.get(reverse("order-sla"), {"business_user_ids": "1"})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.client.get(reverse("order-sla"), {"business_user_ids": "2"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class OrderStatusEventQueryPlanTestCase(QueryPlanTestCase):
+
+    @classmethod
+    def seed(cls):
+        businesses = User.objects.bulk_create(
+            User(username=f"business_{number}", type="business") for number in range(cls.seed_size // 50)
+        )
+        now = timezone.now()
+        OrderStatusEvent.objects.bulk_create(
+            OrderStatusEvent(
+                order_id=number // 2,
+                business_user=businesses[number % len(businesses)],
+                from_status=None if number % 2 == 0 else "in_progress",
+                to_status="in_progress" if number % 2 == 0 else "completed",
+                previous_at=None if number % 2 == 0 else now - timedelta(hours=number),
+                order_created_at=now - timedelta(hours=number),
+                created_at=now - timedelta(minutes=number),
+            )
+            for number in range(cls.seed_size)
+        )
+        cls.business_user_ids = [businesses[1].id, businesses[2].id]
+        cls.until, cls.since = now, now - timedelta(days=30)
+
+    def test_completion_latency_query(self):
+        """Test if the completion latencies of some business users are read by index."""
+        with self.assertNumQueries(1):
+            completion_latencies(self.business_user_ids, self.since, self.until)
+        queryset = OrderStatusEvent.objects.filter(
+            business_user_id__in=self.business_user_ids, to_status="completed", created_at__gte=self.since
+        )
+        self.assertIndexScan(queryset)
+
+    def test_time_in_status_query(self):
+        """Test if the time in status rows of some business users are read by index."""
+        with self.assertNumQueries(1):
+            time_in_status(self.business_user_ids, self.since, self.until)
+        queryset = OrderStatusEvent.objects.filter(
+            business_user_id__in=self.business_user_ids, created_at__gte=self.since, from_status__isnull=False
+        )
+        self.assertIndexScan(queryset)
+
+
+class OrderExportTestCase(OrderTestSetup):
+
+    def setUp(self):
+        super().setUp()
+        Order.objects.create(
+            business_user=self.first_business_user,
+            customer_user=self.first_customer_user,
+            offer_detail=OfferDetail.objects.get(id=1),
+        )
+        Order.objects.create(
+            business_user=self.second_business_user,
+            customer_user=self.first_customer_user,
+            offer_detail=OfferDetail.objects.get(id=2),
+        )
+
+    def export(self, **params):
+        self.authenticate_user(user_type="business", custom_user_number="1")
+        response = self.client.get(reverse("orders:orders-export"), params)
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_export_csv(self):
+        """Test if the CSV export streams a header and the orders of the user with joined detail columns."""
+        response, content = self.export()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        lines = content.splitlines()
+        self.assertEqual(lines[0].split(",")[:4], ["id", "created_at", "updated_at", "status"])
+        self.assertEqual(len(lines), 3)
+        self.assertIn("Premium Package", lines[1])
+        self.assertIn("Basic Package", lines[2])
+
+    def test_export_ndjson_with_filters(self):
+        """Test if the NDJSON export honours the status and date filters."""
+        response, content = self.export(file_format="ndjson", status="completed")
+        rows = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual([(row["status"], row["offer_type"]) for row in rows], [("completed", "premium")])
+
+        tomorrow = (timezone.now() + timedelta(days=1)).isoformat()
+        _, content = self.export(file_format="ndjson", created_after=tomorrow)
+        self.assertEqual(content, "")
+
+    def test_export_invalid_params(self):
+        """Test if an unknown format, status or date returns a 400 status code."""
+        self.authenticate_user(user_type="business", custom_user_number="1")
+        for params in [{"file_format": "xml"}, {"status": "open"}, {"created_after": "yesterday"}]:
+            response = self.client.get(reverse("orders:orders-export"), params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_single_joined_query(self):
+        """Test if the rows are fetched in one joined query (token + export) while the response is consumed."""
+        with self.assertNumQueries(2):
+            self.export()
+
+    def test_export_without_authentication(self):
+        """Test if the export cannot be accessed without authentication."""
+        response = self.client.get(reverse("orders:orders-export"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class OrderArchiveTestCase(OrderTestSetup):
+
+    def setUp(self):
+        super().setUp()
+        Order.objects.create(
+            business_user=self.first_business_user,
+            customer_user=self.first_customer_user,
+            offer_detail=OfferDetail.objects.get(id=1),
+        )
+        Order.objects.filter(status="completed").update(updated_at=timezone.now() - timedelta(days=400))
+
+    def archive(self, *args):
+        out = StringIO()
+        call_command("archive_orders", *args, stdout=out)
+        return out.getvalue()
+
+    def test_archive_moves_old_finished_orders(self):
+        """Test if only old completed / cancelled orders move and the counters stay in sync."""
+        self.assertIn("1 orders would be archived", self.archive("--dry-run"))
+        self.assertEqual(ArchivedOrder.objects.count(), 0)
+
+        self.assertIn("Archived 1 orders", self.archive("--batch-size", "1"))
+        self.assertEqual(list(Order.objects.values_list("status", flat=True)), ["in_progress"])
+        self.assertEqual(ArchivedOrder.objects.get().status, "completed")
+        call_command("reconcile_order_counters", "--check", stdout=StringIO())
+
+    def test_list_includes_archive_only_when_asked(self):
+        """Test if the orders list merges archived orders in id order with ?include_archived=true."""
+        self.archive()
+        self.authenticate_user(user_type="customer", custom_user_number="1")
+
+        response = self.client.get(reverse("orders:orders-list"))
+        self.assertEqual([order["status"] for order in response.data], ["in_progress"])
+
+        response = self.client.get(reverse("orders:orders-list"), {"include_archived": "true"})
+        self.assertEqual([order["title"] for order in response.data], ["Premium Package", "Basic Package"])
+
+        response = self.client.get(reverse("orders:orders-list"), {"include_archived": "true", "page_size": 1})
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(response.data["results"][0]["status"], "completed")
+
+    def test_export_and_stats_include_archive_when_asked(self):
+        """Test if the export and the batch counts read the archive with ?include_archived=true."""
+        self.archive()
+        self.authenticate_user(user_type="business", custom_user_number="1")
+
+        response = self.client.get(reverse("orders:orders-export"), {"include_archived": "true"})
+        self.assertEqual(len(b"".join(response.streaming_content).decode().splitlines()), 3)
+
+        response = self.client.get(reverse("order-stats"), {"business_user_ids": "1"})
+        self.assertEqual(response.data[0]["completed"], 0)
+        response = self.client.get(reverse("order-stats"), {"business_user_ids": "1", "include_archived": "1"})
+        self.assertEqual(response.data[0]["completed"], 1)
+
+        response = self.client.get(reverse("completed-order-count", kwargs={"business_user_id": 1}))
+        self.assertEqual(response.data["completed_order_count"], 0)
+        response = self.client.get(
+            reverse("completed-order-count", kwargs={"business_user_id": 1}), {"include_archived": "true"}
+        )
+        self.assertEqual(response.data["completed_order_count"], 1)
+
+    def test_deleting_offer_after_archive_keeps_counters_in_sync(self):
+        """Test if archived orders removed by a cascade leave the counters consistent."""
+        self.archive()
+        self.assertEqual(BusinessOrderCounter.objects.get(pk=self.first_business_user.id).completed, 0)
+
+        OfferDetail.objects.get(id=1).offer.delete()
+        self.assertFalse(ArchivedOrder.objects.exists())
+        call_command("reconcile_order_counters", "--check", stdout=StringIO())
+
+    def test_include_archived_with_cursor(self):
+        """Test if ?include_archived= together with ?cursor= returns a 400 status code."""
+        self.authenticate_user(user_type="customer", custom_user_number="1")
+        response = self.client.get(reverse("orders:orders-list"), {"include_archived": "true", "cursor": ""})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class OrderIdempotencyTestCase(OrderTestSetup):
+
+    def setUp(self):
+        super().setUp()
+        get_idempotency_cache().clear()
+        self.authenticate_user(user_type="customer", custom_user_number="1")
+
+    def post(self, data, key="order-1"):
+        return self.client.post(reverse("orders:orders-list"), data, format="json", HTTP_IDEMPOTENCY_KEY=key)
+
+    def test_retry_replays_response(self):
+        """Test if a retry with the same key returns the first response without creating another order."""
+        first = self.post(self.post_data)
+
+        with self.assertNumQueries(1):
+            retry = self.post(self.post_data)
+
+        self.assertEqual(retry.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.data, first.data)
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+        self.assertEqual(Order.objects.count(), 2)
+
+    def test_other_key_or_no_key_creates(self):
+        """Test if another key or a request without key creates a new order."""
+        self.post(self.post_data)
+        self.post(self.post_data, key="order-2")
+        self.client.post(reverse("orders:orders-list"), self.post_data, format="json")
+        self.assertEqual(Order.objects.count(), 4)
+
+    def test_key_with_other_payload(self):
+        """Test if reusing a key with a different body returns a 422 status code."""
+        self.post(self.post_data)
+        response = self.post({"offer_detail_id": 1})
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+    def test_concurrent_duplicate(self):
+        """Test if a request whose key is locked by a running request returns a 409 status code."""
+        cache_key = idempotency_cache_key(self.first_customer_user.pk, reverse("orders:orders-list"), "order-1")
+        get_idempotency_cache().add(f"{cache_key}:lock", True)
+
+        response = self.post(self.post_data)
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_failed_request_not_stored(self):
+        """Test if a failed request can be retried with the same key."""
+        self.assertEqual(self.post({"offer_detail_id": 999}).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.post({"offer_detail_id": 999}).status_code, status.HTTP_404_NOT_FOUND)
@@ -1,24 +1,36 @@
+from django.db import transaction
 from rest_framework import serializers
 from profiles_app.models import Profile
 from django.contrib.auth import get_user_model
+from core.images import VariantImageField
+from core.sparse import SparseFieldsetMixin
 
 User = get_user_model()
 
 
-class ProfileSerializer(serializers.ModelSerializer):
+def save_changed_fields(instance, data):
+    changed = [attr for attr, value in data.items() if getattr(instance, attr) != value]
+    for attr in changed:
+        setattr(instance, attr, data[attr])
+
+    if changed:
+        instance.save(update_fields=changed)
+
+
+class ProfileSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
-    Serializer for profile list / patch when pk is current user
+    Serializer for profile list / patch when pk is current user, GET supports ?fields= / ?omit=
     """
+
     user = serializers.IntegerField(source="user.id", read_only=True)
     username = serializers.CharField(source="user.username", read_only=True)
     type = serializers.CharField(source="user.type", read_only=True)
-    created_at = serializers.DateTimeField(
-        source="user.date_joined", read_only=True
-    )
+    created_at = serializers.DateTimeField(source="user.date_joined", read_only=True)
 
     first_name = serializers.CharField(source="user.first_name", max_length=150)
     last_name = serializers.CharField(source="user.last_name", max_length=150)
     email = serializers.EmailField(source="user.email")
+    file = VariantImageField(read_only=True)
 
     class Meta:
         model = Profile
@@ -38,26 +50,37 @@ class ProfileSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["user", "username", "type", "created_at", "file"]
 
+    @transaction.atomic
     def update(self, instance, validated_data):
+        """
+        Saves the user and the profile only when one of their fields changed, and only the changed columns.
+        """
         user_data = validated_data.pop("user", {})
-        user = instance.user
-
-        for attr, value in user_data.items():
-            setattr(user, attr, value)
-        user.save()
 
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
+        save_changed_fields(instance.user, user_data)
+        save_changed_fields(instance, validated_data)
 
         return instance
 
 
+class RatingSummaryField(serializers.ReadOnlyField):
+    """
+    Read only figure of the user's BusinessRatingSummary, 0 for a business user without one.
+    """
+
+    def get_attribute(self, instance):
+        value = super().get_attribute(instance)
+        return 0 if value is None else value
+
+
 class BusinessProfileListSerializer(ProfileSerializer):
     """
-    Serializer for business profiles list.
+    Serializer for business profiles list, rating figures come from the user's BusinessRatingSummary.
     """
 
+    average_rating = RatingSummaryField(source="user.rating_summary.average_rating")
+    review_count = RatingSummaryField(source="user.rating_summary.review_count")
+
     class Meta:
         model = Profile
         fields = [
@@ -71,6 +94,8 @@ class BusinessProfileListSerializer(ProfileSerializer):
             "description",
             "working_hours",
             "type",
+            "average_rating",
+            "review_count",
         ]
 
 
@@ -2,6 +2,9 @@ from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.exceptions import NotFound
 from profiles_app.models import Profile
+from core.sparse import SparseQuerysetMixin
+from core.pagination import CursorPaginationMixin, KeysetPagination, OptionalPageNumberPagination
+from profiles_app.search import ProfileSearchFilter
 from .serializers import (
     ProfileSerializer,
     BusinessProfileListSerializer,
@@ -26,7 +29,7 @@ class ProfileDetailView(generics.RetrieveUpdateAPIView):
         """
         pk = self.kwargs.get("pk")
         try:
-            return Profile.objects.get(pk=pk)
+            return Profile.objects.select_related("user").get(pk=pk)
         except Profile.DoesNotExist:
             raise NotFound("Profile with this id not found.")
 
@@ -57,26 +60,42 @@ class ProfileDetailView(generics.RetrieveUpdateAPIView):
             return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class FilteredTypeProfileListView(generics.ListAPIView):
+class ProfilePagination(OptionalPageNumberPagination):
+    """
+    Opt-in page number pagination for the profile lists (?page= / ?page_size=),
+    without it the plain list stops after unpaginated_limit profiles.
+    """
+
+    page_size = 10
+    max_page_size = 100
+    unpaginated_limit = 100
+
+
+class ProfileCursorPagination(KeysetPagination):
+    """
+    Opt-in keyset pagination for the profile lists (?cursor=), pages by user id without counting.
+    """
+
+    page_size = 10
+    max_page_size = 100
+    default_ordering = "user"
+    tiebreaker = "user"
+
+
+class FilteredTypeProfileListView(SparseQuerysetMixin, CursorPaginationMixin, generics.ListAPIView):
     """
     Base view for profile lists - shared functionality.
     Get profiles filtered by user type with optimized queries.
-    Return list of profiles filtered by type.
+    Return list of profiles filtered by type, paginated with ?page= / ?cursor=, searchable with ?search=.
     """
 
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ProfilePagination
+    cursor_pagination_class = ProfileCursorPagination
+    filter_backends = [ProfileSearchFilter]
 
     def get_queryset(self):
-        return Profile.objects.filter(user__type=self.user_type).select_related("user")
-
-    def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-
-        return Response(
-            serializer.data,
-            status=status.HTTP_200_OK,
-        )
+        return Profile.objects.filter(user__type=self.user_type).select_related("user").order_by("user")
 
 
 class BusinessProfileListView(FilteredTypeProfileListView):
@@ -87,6 +106,9 @@ class BusinessProfileListView(FilteredTypeProfileListView):
     serializer_class = BusinessProfileListSerializer
     user_type = "business"
 
+    def get_queryset(self):
+        return super().get_queryset().select_related("user__rating_summary")
+
 
 class CustomerProfileListView(FilteredTypeProfileListView):
     """
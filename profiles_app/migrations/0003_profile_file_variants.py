@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-18 10:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles_app", "0002_alter_profile_file"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="file_height",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="profile",
+            name="file_variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name="profile",
+            name="file_width",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
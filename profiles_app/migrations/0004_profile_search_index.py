@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-18 10:43
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles_app", "0003_profile_file_variants"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="profile",
+            index=models.Index(
+                django.db.models.functions.text.Lower("location"),
+                name="profile_location_lower_idx",
+            ),
+        ),
+    ]
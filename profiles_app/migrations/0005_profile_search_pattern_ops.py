@@ -0,0 +1,35 @@
+from django.db import migrations
+
+"""
+On PostgreSQL the lower-cased location index of migration 0004 is rebuilt with varchar_pattern_ops,
+so the LIKE 'prefix%' matches of profiles_app.search can seek it under any database collation
+(a plain btree index only serves LIKE under the "C" collation).
+The index name and expression stay the same, other database vendors keep the plain expression index.
+"""
+
+
+def rebuild_location_index(schema_editor, opclass):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("DROP INDEX IF EXISTS profile_location_lower_idx")
+    schema_editor.execute(f"CREATE INDEX profile_location_lower_idx ON profiles_app_profile (LOWER(location) {opclass})")
+
+
+def use_pattern_ops(apps, schema_editor):
+    rebuild_location_index(schema_editor, "varchar_pattern_ops")
+
+
+def use_default_ops(apps, schema_editor):
+    rebuild_location_index(schema_editor, "")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles_app", "0004_profile_search_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(use_pattern_ops, use_default_ops),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -16,11 +17,21 @@ class Profile(models.Model):
         primary_key=True,  # Profile ID = User ID
     )
     file = models.ImageField(upload_to="offers/images/", null=True, blank=True)
+    file_width = models.PositiveIntegerField(null=True, blank=True)
+    file_height = models.PositiveIntegerField(null=True, blank=True)
+    file_variants = models.JSONField(default=dict, blank=True)
     location = models.CharField(max_length=50, blank=True, default="")
     tel = models.CharField(max_length=15, blank=True, default="")
     description = models.TextField(blank=True, default="")
     working_hours = models.CharField(max_length=50, blank=True, default="")
 
+    class Meta:
+        indexes = [
+            # case-insensitive prefix ?search= of the profile lists (profiles_app.search),
+            # rebuilt with varchar_pattern_ops on PostgreSQL by migration 0005
+            models.Index(Lower("location"), name="profile_location_lower_idx"),
+        ]
+
     def __str__(self):
         return f"Profile of {self.user.username}"
 
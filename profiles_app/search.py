@@ -0,0 +1,62 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models.functions import Lower
+from rest_framework import filters
+
+from profiles_app.models import Profile
+
+"""
+Case-insensitive prefix search for the profile lists (?search=) on username, first / last name and location.
+Every field is matched with LIKE 'prefix%' on its lower-cased expression, which PostgreSQL seeks in the
+varchar_pattern_ops expression index. SQLite cannot use an expression index for LIKE and gets an
+equivalent range instead. The matching user ids of all fields are combined with UNION,
+so the work depends on the number of matches, not on the number of users.
+"""
+
+User = get_user_model()
+
+USER_SEARCH_FIELDS = ("username", "first_name", "last_name")
+PROFILE_SEARCH_FIELDS = ("location",)
+PREFIX_END = "\U0010ffff"
+
+
+def prefix_match(queryset, field, prefix):
+    """
+    Rows whose lower-cased field starts with prefix. LIKE does not depend on the collation, a >= / < range
+    only matches the same rows under a byte-wise collation, which SQLite always uses for these expressions.
+    """
+    queryset = queryset.alias(match=Lower(field))
+    if connection.vendor == "sqlite":
+        return queryset.filter(match__gte=prefix, match__lt=prefix + PREFIX_END)
+    return queryset.filter(match__startswith=prefix)
+
+
+def lower_term(term):
+    """
+    Lower-cases the search term the way the database lower-cases the fields: SQLite's LOWER() only
+    folds ASCII letters, so other characters have to keep their case there to match at all.
+    """
+    if connection.vendor == "sqlite":
+        return "".join(char.lower() if char.isascii() else char for char in term)
+    return term.lower()
+
+
+def matching_user_ids(term, user_type):
+    prefix = lower_term(term)
+    users = User.objects.filter(type=user_type).order_by()
+    id_queries = [prefix_match(users, field, prefix).values("id") for field in USER_SEARCH_FIELDS]
+    id_queries += [
+        prefix_match(Profile.objects.order_by(), field, prefix).values("user_id") for field in PROFILE_SEARCH_FIELDS
+    ]
+    return id_queries[0].union(*id_queries[1:])
+
+
+class ProfileSearchFilter(filters.SearchFilter):
+    """
+    SearchFilter matching every ?search= term as a prefix of one of the profile search fields.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        for term in self.get_search_terms(request):
+            queryset = queryset.filter(pk__in=matching_user_ids(term, view.user_type))
+        return queryset
@@ -1,10 +1,13 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
+from core.images import enqueue_image_processing
 from .models import Profile
 
 """
 Signal from auth_app UserProfile , when creating a new User , creating a Profile
+(in the transaction of the registration). Later user saves leave the profile alone,
+ProfileSerializer.update writes the profile itself when one of its fields changed.
 """
 
 
@@ -17,7 +20,6 @@ def create_user_profile(sender, instance, created, **kwargs):
         Profile.objects.create(user=instance)
 
 
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    if hasattr(instance, "profile"):
-        instance.profile.save()
+@receiver(post_save, sender=Profile)
+def process_profile_file(sender, instance, **kwargs):
+    enqueue_image_processing(instance, "file")
@@ -1,10 +1,18 @@
-from django.test import TestCase
+import shutil
+import tempfile
+from io import BytesIO
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
 from django.urls import reverse
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from auth_app.models import UserProfile
 from rest_framework.authtoken.models import Token
 from profiles_app.models import Profile
+from reviews_app.models import Review
+
+MEDIA_ROOT = tempfile.mkdtemp()
 
 
 class ProfileTestSetup(APITestCase):
@@ -44,13 +52,9 @@ class ProfileTestSetup(APITestCase):
     def authenticate_user(self, user_type="business"):
         """Helper method for User Authentication."""
         if user_type == "business":
-            self.client.credentials(
-                HTTP_AUTHORIZATION="Token " + self.business_token.key
-            )
+            self.client.credentials(HTTP_AUTHORIZATION="Token " + self.business_token.key)
         elif user_type == "customer":
-            self.client.credentials(
-                HTTP_AUTHORIZATION="Token " + self.customer_token.key
-            )
+            self.client.credentials(HTTP_AUTHORIZATION="Token " + self.customer_token.key)
 
     def clear_authentication(self):
         """Helper method remove Authentication."""
@@ -145,6 +149,22 @@ class profileTest(ProfileTestSetup):
         self.business_user.refresh_from_db()
         self.assertEqual(self.business_user.first_name, update_data["first_name"])
 
+    def test_patch_profile_query_count(self):
+        self.authenticate_user("business")
+        url = reverse("profile:profile-detail", kwargs={"pk": self.business_user.pk})
+
+        # token, profile joined to user, savepoint, profile update, release savepoint
+        with self.assertNumQueries(5):
+            response = self.client.patch(url, {"location": "Köln", "first_name": "Max"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # token, profile joined to user, savepoint, user update, release savepoint
+        with self.assertNumQueries(5):
+            self.client.patch(url, {"first_name": "Moritz"}, format="json")
+
+        self.business_user.refresh_from_db()
+        self.assertEqual((self.business_user.first_name, self.business_user.profile.location), ("Moritz", "Köln"))
+
     def test_patch_other_user_profile_forbidden(self):
 
         self.authenticate_user("customer")
@@ -187,6 +207,8 @@ class ProfileListViewTests(ProfileTestSetup):
             "description": "",
             "working_hours": "",
             "type": "business",
+            "average_rating": 0,
+            "review_count": 0,
         }
         self.profile_customer_json = {
             "user": 1,
@@ -218,9 +240,68 @@ class ProfileListViewTests(ProfileTestSetup):
             self.assertEqual(response.data[0]["type"], i)
             self.clear_authentication()
 
+    def test_get_profiles_list_fields(self):
+        self.authenticate_user("business")
+        url = reverse("profiles:business-profiles-list")
+        response = self.client.get(url, {"fields": "user,username,location"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data[0].keys()), {"user", "username", "location"})
+        self.assertEqual(response.data[0]["username"], "business_test")
+
+    def test_get_business_profiles_list_without_reviews(self):
+        self.authenticate_user("customer")
+        response = self.client.get(reverse("profiles:business-profiles-list"))
+
+        self.assertEqual(response.data[0]["average_rating"], 0)
+        self.assertEqual(response.data[0]["review_count"], 0)
+
+    def test_get_business_profiles_list_ratings(self):
+        Review.objects.create(business_user=self.business_user, reviewer=self.customer_user, rating=4)
+        self.authenticate_user("customer")
+        url = reverse("profiles:business-profiles-list")
+
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        self.assertEqual(response.data[0]["average_rating"], 4.0)
+        self.assertEqual(response.data[0]["review_count"], 1)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(url, {"fields": "user,review_count"})
+        self.assertEqual(response.data[0], {"user": self.business_user.id, "review_count": 1})
+
     def test_get_profiles_list_unauthenticated(self):
         for i in self.types:
             url = reverse("profiles:" + i + "-profiles-list")
 
             response = self.client.get(url)
             self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, IMAGE_PROCESSING_EAGER=True)
+class ProfileImageVariantTests(ProfileTestSetup):
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def test_profile_list_returns_thumbnail(self):
+        """
+        Test if the business profile list returns the processed thumbnail on ?image_variant=thumbnail.
+        """
+        buffer = BytesIO()
+        Image.new("RGB", (900, 900), "blue").save(buffer, "PNG")
+        profile = self.business_user.profile
+
+        with self.captureOnCommitCallbacks(execute=True):
+            profile.file = SimpleUploadedFile("avatar.png", buffer.getvalue(), content_type="image/png")
+            profile.save()
+        profile.refresh_from_db()
+
+        self.authenticate_user("business")
+        response = self.client.get(reverse("profiles:business-profiles-list"), {"image_variant": "thumbnail"})
+
+        self.assertEqual((profile.file_width, profile.file_height), (900, 900))
+        self.assertTrue(response.data[0]["file"].endswith(profile.file_variants["thumbnail"]))
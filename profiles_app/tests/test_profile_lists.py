@@ -0,0 +1,111 @@
+from unittest.mock import patch
+
+from django.urls import reverse
+from rest_framework import status
+
+from auth_app.models import UserProfile
+from core.testing import QueryPlanTestCase, sequential_scans
+from profiles_app.api.views import ProfilePagination
+from profiles_app.models import Profile
+from profiles_app.search import matching_user_ids
+from profiles_app.tests.test_profile import ProfileTestSetup
+
+
+class ProfileListSearchAndPaginationTests(ProfileTestSetup):
+
+    def setUp(self):
+        super().setUp()
+        for username, first_name, location in [
+            ("anna_design", "Anna", "Berlin"),
+            ("bernd_web", "Bernd", "Hamburg"),
+            ("carla_seo", "Carla", "Bremen"),
+        ]:
+            user = UserProfile.objects.create_user(
+                username=username, password="testpass123", first_name=first_name, type="business"
+            )
+            Profile.objects.update_or_create(user=user, defaults={"location": location})
+        self.authenticate_user("customer")
+        self.url = reverse("profiles:business-profiles-list")
+
+    def get_usernames(self, params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [profile["username"] for profile in response.data]
+
+    def test_search_prefix_on_username_name_and_location(self):
+        self.assertEqual(self.get_usernames({"search": "ANNA"}), ["anna_design"])
+        self.assertEqual(self.get_usernames({"search": "Br"}), ["carla_seo"])
+        all_business = ["business_test", "anna_design", "bernd_web", "carla_seo"]
+        self.assertEqual(self.get_usernames({"search": "b"}), all_business)
+        self.assertEqual(self.get_usernames({"search": "b hamb"}), ["bernd_web"])
+        self.assertEqual(self.get_usernames({"search": "design"}), [])
+
+    def test_search_punctuation_and_wildcards(self):
+        self.assertEqual(self.get_usernames({"search": "anna_"}), ["anna_design"])
+        self.assertEqual(self.get_usernames({"search": "annad"}), [])
+        self.assertEqual(self.get_usernames({"search": "a%"}), [])
+
+    def test_search_non_ascii_uppercase(self):
+        user = UserProfile.objects.create_user(
+            username="oezlem_ux", password="testpass123", first_name="Özlem", type="business"
+        )
+        Profile.objects.update_or_create(user=user, defaults={"location": "Köln"})
+        self.assertEqual(self.get_usernames({"search": "ÖZ"}), ["oezlem_ux"])
+        self.assertEqual(self.get_usernames({"search": "Kö"}), ["oezlem_ux"])
+
+    def test_search_keeps_user_type(self):
+        response = self.client.get(reverse("profiles:customer-profiles-list"), {"search": "anna"})
+        self.assertEqual(response.data, [])
+
+    def test_page_number(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, {"page_size": 2, "page": 2})
+
+        self.assertEqual(response.data["count"], 4)
+        self.assertEqual([profile["username"] for profile in response.data["results"]], ["bernd_web", "carla_seo"])
+
+    def test_plain_list_is_capped(self):
+        with patch.object(ProfilePagination, "unpaginated_limit", 2):
+            self.assertEqual(self.get_usernames({}), ["business_test", "anna_design"])
+            self.assertEqual(len(self.client.get(self.url, {"page_size": 3}).data["results"]), 3)
+
+    def test_cursor(self):
+        usernames, response = [], self.client.get(self.url, {"cursor": "", "page_size": 3})
+        while True:
+            usernames.extend(profile["username"] for profile in response.data["results"])
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+
+        self.assertEqual(usernames, ["business_test", "anna_design", "bernd_web", "carla_seo"])
+
+
+class ProfileSearchQueryPlanTestCase(QueryPlanTestCase):
+
+    @classmethod
+    def seed(cls):
+        users = UserProfile.objects.bulk_create(
+            UserProfile(
+                username=f"user_{number}",
+                first_name=f"first_{number}",
+                last_name=f"last_{number}",
+                type="business" if number % 2 else "customer",
+            )
+            for number in range(cls.seed_size)
+        )
+        Profile.objects.bulk_create(Profile(user=user, location=f"city_{user.pk}") for user in users)
+
+    def test_search_subqueries(self):
+        """
+        Test if every field of ?search= seeks its lower-cased expression index.
+        """
+        for query in matching_user_ids("user_12", "business").query.combined_queries:
+            plan = query.explain(using="default")
+            self.assertFalse(sequential_scans(plan, ["auth_app_userprofile", "profiles_app_profile"]), plan)
+
+    def test_search_list(self):
+        """
+        Test if the searched profile list is driven by the matching ids, not by a scan of all profiles.
+        """
+        queryset = Profile.objects.filter(user__type="business", pk__in=matching_user_ids("first_1234", "business"))
+        self.assertIndexScan(queryset.select_related("user").order_by("user"))
@@ -13,6 +13,15 @@ from rest_framework.exceptions import ValidationError
 from reviews_app.models import Review
 from reviews_app.api.permissions import ReviewPermission
 from reviews_app.api.serializers import ReviewSerializer
+from core.sparse import SparseQuerysetMixin
+from core.pagination import (
+    CursorPaginationMixin,
+    KeysetPagination,
+    OptionalPageNumberPagination,
+    TiebreakerOrderingFilter,
+)
+from core.idempotency import idempotent
+from django.db import IntegrityError, transaction
 
 
 class ReviewModelFilterSet(django_filters.FilterSet):
@@ -29,7 +38,25 @@ class ReviewModelFilterSet(django_filters.FilterSet):
         fields = ["business_user_id", "reviewer_id"]
 
 
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewPagination(OptionalPageNumberPagination):
+    """
+    Opt-in page number pagination for the reviews list (?page= / ?page_size=).
+    """
+
+    page_size = 10
+    max_page_size = 100
+
+
+class ReviewCursorPagination(KeysetPagination):
+    """
+    Opt-in keyset pagination for the reviews list (?cursor=), pages by the active ordering and id.
+    """
+
+    page_size = 10
+    max_page_size = 100
+
+
+class ReviewViewSet(SparseQuerysetMixin, CursorPaginationMixin, viewsets.ModelViewSet):
     """
     POST: Create a new Review from current User
     PATCH: Updates an existing review (rating and description only) ,reviewer = current user
@@ -37,40 +64,45 @@ class ReviewViewSet(viewsets.ModelViewSet):
     GET Detail: Deactivated, as filters are to be used
     """
 
-    queryset = Review.objects.all()
+    queryset = Review.objects.order_by("id")
     serializer_class = ReviewSerializer
     permission_classes = [ReviewPermission]
+    pagination_class = ReviewPagination
+    cursor_pagination_class = ReviewCursorPagination
 
     filter_backends = [
         DjangoFilterBackend,
         filters.SearchFilter,
-        filters.OrderingFilter,
+        TiebreakerOrderingFilter,
     ]
 
     filterset_class = ReviewModelFilterSet
     ordering_fields = ["rating", "updated_at"]
+    sparse_keep_columns = ordering_fields
 
+    @idempotent
     def create(self, request, *args, **kwargs):
-        data = request.data.copy()
-
-        business_user_id = data.get("business_user")
-        if business_user_id:
-            existing_review = Review.objects.filter(business_user_id=business_user_id, reviewer=request.user).first()
-
-            if existing_review:
-                return Response(status=status.HTTP_403_FORBIDDEN)
-
-        serializer = self.get_serializer(data=data)
+        """
+        A second review of the same business user is rejected (403) by the unique_together constraint,
+        so concurrent submissions cannot both pass a separate existence check.
+        """
+        serializer = self.get_serializer(data=request.data)
         try:
             serializer.is_valid(raise_exception=True)
         except ValidationError:
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-        review = serializer.save(reviewer=request.user)
+        try:
+            with transaction.atomic():
+                review = serializer.save(reviewer=request.user)
+        except IntegrityError:
+            return Response(status=status.HTTP_403_FORBIDDEN)
 
         response_serializer = self.get_serializer(review)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
+    # the review row and its BusinessRatingSummary update (reviews_app.signals) commit together
+    @transaction.atomic
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
         instance = self.get_object()
@@ -89,6 +121,7 @@ class ReviewViewSet(viewsets.ModelViewSet):
 
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @transaction.atomic
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
 
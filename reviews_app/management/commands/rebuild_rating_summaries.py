@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from reviews_app.models import BusinessRatingSummary
+from reviews_app.summaries import SUMMARY_COLUMNS, rebuild_summaries, summarize_reviews
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds the BusinessRatingSummary table from Review, or verifies it with --check.
+    """
+
+    help = "Rebuild the per-business rating summaries from the reviews, or verify them with --check."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report business users whose summaries differ from their reviews, do not write.",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            return self.check_summaries()
+
+        rows = rebuild_summaries()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt rating summaries of {rows} business users."))
+
+    def check_summaries(self):
+        """
+        Compares stored and computed aggregates, raises CommandError when any business user is out of sync.
+        """
+        expected = summarize_reviews()
+        stored = {
+            row.pop("business_user_id"): row
+            for row in BusinessRatingSummary.objects.values("business_user_id", *SUMMARY_COLUMNS)
+        }
+        empty = dict.fromkeys(SUMMARY_COLUMNS, 0)
+
+        stale_ids = sorted(
+            user_id
+            for user_id in expected.keys() | stored.keys()
+            if expected.get(user_id, empty) != stored.get(user_id, empty)
+        )
+        if stale_ids:
+            raise CommandError(f"{len(stale_ids)} business users out of sync: {stale_ids[:20]}")
+
+        self.stdout.write(self.style.SUCCESS("All rating summaries are in sync."))
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.4 on 2026-10-18 10:38
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def backfill_rating_summaries(apps, schema_editor):
+    Review = apps.get_model("reviews_app", "Review")
+    BusinessRatingSummary = apps.get_model("reviews_app", "BusinessRatingSummary")
+
+    rows = Review.objects.order_by().values("business_user_id").annotate(
+        review_count=Count("id"),
+        rating_sum=Sum("rating"),
+        **{f"stars_{stars}": Count("id", filter=Q(rating=stars)) for stars in range(1, 6)},
+    )
+    BusinessRatingSummary.objects.bulk_create(BusinessRatingSummary(**row) for row in rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth_app", "0002_userprofile_type_index"),
+        ("reviews_app", "0003_composite_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BusinessRatingSummary",
+            fields=[
+                (
+                    "business_user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="rating_summary",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("review_count", models.IntegerField(default=0)),
+                ("rating_sum", models.IntegerField(default=0)),
+                ("stars_1", models.IntegerField(default=0)),
+                ("stars_2", models.IntegerField(default=0)),
+                ("stars_3", models.IntegerField(default=0)),
+                ("stars_4", models.IntegerField(default=0)),
+                ("stars_5", models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_rating_summaries, migrations.RunPython.noop),
+    ]
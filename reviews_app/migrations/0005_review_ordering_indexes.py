@@ -0,0 +1,62 @@
+# Generated by Django 5.2.4 on 2026-10-18 10:39
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews_app", "0004_businessratingsummary"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="review",
+            name="review_business_updated_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="review",
+            name="review_business_rating_idx",
+        ),
+        migrations.AlterField(
+            model_name="review",
+            name="reviewer",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="reviewer_review",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["business_user", "updated_at", "id"],
+                name="review_business_updated_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["business_user", "rating", "id"],
+                name="review_business_rating_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["reviewer", "updated_at", "id"],
+                name="review_reviewer_updated_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["reviewer", "rating", "id"],
+                name="review_reviewer_rating_id_idx",
+            ),
+        ),
+    ]
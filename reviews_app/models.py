@@ -10,8 +10,8 @@ class Review(models.Model):
     Model for customer reviews of business users, including rating and description.
     """
 
-    business_user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="business_review")
-    reviewer = models.ForeignKey(User, on_delete=models.CASCADE, related_name="reviewer_review")
+    business_user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="business_review", db_index=False)
+    reviewer = models.ForeignKey(User, on_delete=models.CASCADE, related_name="reviewer_review", db_index=False)
     rating = models.IntegerField(
         validators=[MinValueValidator(1), MaxValueValidator(5)],
     )
@@ -24,6 +24,42 @@ class Review(models.Model):
         verbose_name_plural = "Reviews"
 
         unique_together = ("business_user", "reviewer")
+        indexes = [
+            # ?business_user_id= / ?reviewer_id= filtered lists ordered by updated_at or rating,
+            # id is the tiebreaker of the ordering so pages and cursors read the index in order
+            models.Index(fields=["business_user", "updated_at", "id"], name="review_business_updated_id_idx"),
+            models.Index(fields=["business_user", "rating", "id"], name="review_business_rating_id_idx"),
+            models.Index(fields=["reviewer", "updated_at", "id"], name="review_reviewer_updated_id_idx"),
+            models.Index(fields=["reviewer", "rating", "id"], name="review_reviewer_rating_id_idx"),
+        ]
 
     def __str__(self):
         return f"Review from {self.reviewer.username} to {self.business_user.username} - {self.rating}/5"
+
+
+class BusinessRatingSummary(models.Model):
+    """
+    Materialized rating aggregates for one business user: review count, rating sum and a 1-5 star histogram,
+    maintained by reviews_app.signals and rebuilt by the rebuild_rating_summaries command.
+    """
+
+    business_user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        related_name="rating_summary",
+        primary_key=True,
+    )
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+    stars_1 = models.IntegerField(default=0)
+    stars_2 = models.IntegerField(default=0)
+    stars_3 = models.IntegerField(default=0)
+    stars_4 = models.IntegerField(default=0)
+    stars_5 = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"Rating summary of {self.business_user_id}"
+
+    @property
+    def average_rating(self):
+        return round(self.rating_sum / self.review_count, 2) if self.review_count else 0
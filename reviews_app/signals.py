@@ -0,0 +1,40 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from reviews_app.models import Review
+from reviews_app.summaries import change_summary, rating_change_deltas, rating_deltas
+
+"""
+Signals keeping BusinessRatingSummary in sync with every Review create, rating change and delete.
+The business user and rating as last saved are remembered on the instance, so a save only
+touches the summary when the rating changed. Queryset update() / bulk_create() bypass them,
+use the rebuild_rating_summaries command after those.
+"""
+
+
+@receiver(post_init, sender=Review)
+def remember_saved_rating(sender, instance, **kwargs):
+    instance._saved_rating = (instance.__dict__.get("business_user_id"), instance.__dict__.get("rating"))
+
+
+@receiver(post_save, sender=Review)
+def summarize_review_on_save(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is not None and "rating" not in update_fields:
+        return
+
+    business_user_id, rating = instance._saved_rating
+    if created or rating is None:
+        change_summary(instance.business_user_id, rating_deltas(instance.rating, 1))
+    elif business_user_id == instance.business_user_id and rating != instance.rating:
+        change_summary(business_user_id, rating_change_deltas(rating, instance.rating))
+    elif business_user_id != instance.business_user_id:
+        change_summary(business_user_id, rating_deltas(rating, -1))
+        change_summary(instance.business_user_id, rating_deltas(instance.rating, 1))
+
+    instance._saved_rating = (instance.business_user_id, instance.rating)
+
+
+@receiver(post_delete, sender=Review)
+def summarize_review_on_delete(sender, instance, **kwargs):
+    business_user_id, rating = instance._saved_rating
+    change_summary(business_user_id or instance.business_user_id, rating_deltas(rating or instance.rating, -1))
@@ -0,0 +1,75 @@
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+
+from reviews_app.models import BusinessRatingSummary, Review
+
+SUMMARY_COLUMNS = ["review_count", "rating_sum", "stars_1", "stars_2", "stars_3", "stars_4", "stars_5"]
+
+
+def rating_deltas(rating, sign):
+    """
+    Column deltas of adding (sign=1) or removing (sign=-1) one review with the given rating.
+    """
+    return {"review_count": sign, "rating_sum": sign * rating, f"stars_{rating}": sign}
+
+
+def rating_change_deltas(old_rating, new_rating):
+    deltas = Counter(rating_deltas(new_rating, 1))
+    deltas.update(rating_deltas(old_rating, -1))
+    return dict(deltas)
+
+
+def change_summary(business_user_id, deltas):
+    """
+    Adds {column: delta} to the summary row of a business user in one UPDATE,
+    creating the row on the first review. Without a row there is nothing to remove
+    (e.g. reviews deleted along with their business user and its summary).
+    """
+    deltas = {column: delta for column, delta in deltas.items() if delta and column in SUMMARY_COLUMNS}
+    if not deltas:
+        return
+
+    summaries = BusinessRatingSummary.objects.filter(pk=business_user_id)
+    if summaries.update(**{column: F(column) + delta for column, delta in deltas.items()}):
+        return
+    if deltas.get("review_count", 0) <= 0:
+        return
+
+    try:
+        with transaction.atomic():
+            BusinessRatingSummary.objects.create(business_user_id=business_user_id, **deltas)
+    except IntegrityError:
+        # created concurrently between our UPDATE and INSERT
+        summaries.update(**{column: F(column) + delta for column, delta in deltas.items()})
+
+
+def summarize_reviews(business_user_ids=None):
+    """
+    Returns {business_user_id: {column: value}} computed from Review in one grouped query.
+    """
+    reviews = Review.objects.order_by()
+    if business_user_ids is not None:
+        reviews = reviews.filter(business_user_id__in=business_user_ids)
+
+    rows = reviews.values("business_user_id").annotate(
+        review_count=Count("id"),
+        rating_sum=Sum("rating"),
+        **{f"stars_{stars}": Count("id", filter=Q(rating=stars)) for stars in range(1, 6)},
+    )
+    return {row.pop("business_user_id"): row for row in rows}
+
+
+@transaction.atomic
+def rebuild_summaries():
+    """
+    Replaces all summary rows with the aggregates from Review, returns the number of rows written.
+    """
+    summaries = summarize_reviews()
+    BusinessRatingSummary.objects.all().delete()
+    BusinessRatingSummary.objects.bulk_create(
+        BusinessRatingSummary(business_user_id=business_user_id, **columns)
+        for business_user_id, columns in summaries.items()
+    )
+    return len(summaries)
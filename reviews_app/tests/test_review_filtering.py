@@ -160,3 +160,16 @@ class ReviewFilterAndOrderingTestCase(ReviewTestSetup):
         response = self.client.get("/api/reviews/")
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data), 4)
+
+    def test_omit_description(self):
+        """
+        Test if ?omit= drops fields from the review list.
+        """
+        self.authenticate_user("customer", "1")
+
+        response = self.client.get("/api/reviews/?omit=description,updated_at&ordering=rating")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data[0]), {"id", "business_user", "reviewer", "rating", "created_at"})
+        ratings = [review["rating"] for review in response.data]
+        self.assertEqual(ratings, sorted(ratings))
@@ -0,0 +1,55 @@
+from django.urls import reverse
+from rest_framework import status
+
+from reviews_app.models import Review
+from reviews_app.tests.test_reviews import ReviewTestSetup
+
+
+class ReviewPaginationTestCase(ReviewTestSetup):
+    def setUp(self):
+        super().setUp()
+        Review.objects.create(business_user=self.first_business_user, reviewer=self.first_customer_user, rating=1)
+        Review.objects.create(business_user=self.second_business_user, reviewer=self.first_customer_user, rating=5)
+        self.authenticate_user("customer", "1")
+
+    def collect_cursor_pages(self, params):
+        ids, response = [], self.client.get(reverse("review-list"), {**params, "cursor": "", "page_size": 1})
+        while True:
+            ids.extend(review["id"] for review in response.data["results"])
+            if not response.data["next"]:
+                return ids
+            response = self.client.get(response.data["next"])
+
+    def test_list_without_pagination_params(self):
+        response = self.client.get(reverse("review-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 3)
+
+    def test_page_number_with_tiebreaker(self):
+        response = self.client.get(reverse("review-list"), {"ordering": "rating", "page_size": 2})
+
+        self.assertEqual(response.data["count"], 3)
+        first_page = [review["id"] for review in response.data["results"]]
+        self.assertEqual(first_page, sorted(first_page))
+        self.assertEqual([review["rating"] for review in response.data["results"]], [1, 1])
+
+    def test_cursor_pages_cover_each_review_once(self):
+        for ordering in ["rating", "-rating", "-updated_at"]:
+            ids = self.collect_cursor_pages({"ordering": ordering})
+            self.assertEqual(sorted(ids), sorted(Review.objects.values_list("id", flat=True)))
+
+    def test_cursor_with_filter(self):
+        ids = self.collect_cursor_pages({"business_user_id": self.first_business_user.id, "ordering": "-rating"})
+        expected = Review.objects.filter(business_user=self.first_business_user).order_by("-rating", "-id")
+        self.assertEqual(ids, list(expected.values_list("id", flat=True)))
+
+    def test_cursor_not_skipping_on_insert(self):
+        response = self.client.get(reverse("review-list"), {"ordering": "rating", "cursor": "", "page_size": 1})
+        seen = [review["id"] for review in response.data["results"]]
+        Review.objects.create(business_user=self.second_business_user, reviewer=self.second_customer_user, rating=1)
+
+        response = self.client.get(response.data["next"])
+        seen.extend(review["id"] for review in response.data["results"])
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(response.data["results"][0]["rating"], 1)
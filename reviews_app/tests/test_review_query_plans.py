@@ -0,0 +1,59 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+
+from core.testing import QueryPlanTestCase
+from reviews_app.models import Review
+
+User = get_user_model()
+
+
+class ReviewQueryPlanTestCase(QueryPlanTestCase):
+
+    @classmethod
+    def seed(cls):
+        businesses = User.objects.bulk_create(
+            User(username=f"business_{number}", type="business") for number in range(cls.seed_size // 50)
+        )
+        customers = User.objects.bulk_create(
+            User(username=f"customer_{number}", type="customer") for number in range(50)
+        )
+        Review.objects.bulk_create(
+            Review(business_user=business, reviewer=customer, rating=number % 5 + 1)
+            for number, (business, customer) in enumerate(
+                (business, customer) for business in businesses for customer in customers
+            )
+        )
+        cls.business_user = businesses[0]
+        cls.customer_user = customers[0]
+
+    def test_reviews_of_business_by_updated_at(self):
+        """
+        Test if ?business_user_id= with ?ordering=-updated_at reads review_business_updated_id_idx in order.
+        """
+        queryset = Review.objects.filter(business_user=self.business_user).order_by("-updated_at", "-id")
+        self.assertIndexScan(queryset, ordered=True)
+
+    def test_reviews_of_business_by_rating(self):
+        """
+        Test if ?business_user_id= with ?ordering=rating reads review_business_rating_id_idx in order.
+        """
+        queryset = Review.objects.filter(business_user=self.business_user).order_by("rating", "id")
+        self.assertIndexScan(queryset, ordered=True)
+
+    def test_reviews_of_reviewer_by_rating_cursor(self):
+        """
+        Test if a ?reviewer_id= cursor page with ?ordering=-rating seeks review_reviewer_rating_id_idx in order.
+        """
+        queryset = (
+            Review.objects.filter(reviewer=self.customer_user)
+            .filter(Q(rating__lt=3) | Q(rating=3, id__lt=10_000))
+            .order_by("-rating", "-id")[:11]
+        )
+        self.assertIndexScan(queryset, ordered=True)
+
+    def test_reviews_of_reviewer_by_updated_at(self):
+        """
+        Test if a ?reviewer_id= page with ?ordering=updated_at reads review_reviewer_updated_id_idx in order.
+        """
+        queryset = Review.objects.filter(reviewer=self.customer_user).order_by("updated_at", "id")[:11]
+        self.assertIndexScan(queryset, ordered=True)
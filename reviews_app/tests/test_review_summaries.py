@@ -0,0 +1,63 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+from rest_framework import status
+
+from reviews_app.models import BusinessRatingSummary, Review
+from reviews_app.tests.test_reviews import ReviewTestSetup
+
+
+class BusinessRatingSummaryTestCase(ReviewTestSetup):
+
+    def get_summary(self, user):
+        summary = BusinessRatingSummary.objects.get(pk=user.pk)
+        stars = [getattr(summary, f"stars_{stars}") for stars in range(1, 6)]
+        return summary.review_count, summary.rating_sum, stars
+
+    def test_summary_follows_create_update_delete(self):
+        """Test if the summary follows review creation, rating changes and deletion."""
+        self.authenticate_user("customer", "1")
+        response = self.client.post(reverse("review-list"), self.first_review_example_post, format="json")
+        self.assertEqual(self.get_summary(self.first_business_user), (2, 5, [1, 0, 0, 1, 0]))
+
+        review_url = reverse("review-detail", kwargs={"pk": response.data["id"]})
+        self.client.patch(review_url, self.review_example_patch, format="json")
+        self.assertEqual(self.get_summary(self.first_business_user), (2, 6, [1, 0, 0, 0, 1]))
+
+        self.client.patch(review_url, {"description": "Nur der Text"}, format="json")
+        self.assertEqual(self.get_summary(self.first_business_user), (2, 6, [1, 0, 0, 0, 1]))
+
+        self.client.delete(review_url)
+        self.assertEqual(self.get_summary(self.first_business_user), (1, 1, [1, 0, 0, 0, 0]))
+        self.assertEqual(BusinessRatingSummary.objects.get(pk=self.first_business_user.pk).average_rating, 1)
+
+    def test_invalid_rating_leaves_summary(self):
+        """Test if a rejected update does not change the summary."""
+        review = Review.objects.get(reviewer=self.second_customer_user)
+        self.authenticate_user("customer", "2")
+
+        response = self.client.patch(reverse("review-detail", kwargs={"pk": review.pk}), {"rating": 9}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.get_summary(self.first_business_user), (1, 1, [1, 0, 0, 0, 0]))
+
+    def test_deleting_business_user_leaves_no_summary(self):
+        """Test if reviews deleted along with their business user do not recreate its summary row."""
+        business_user_id = self.first_business_user.id
+        self.first_business_user.delete()
+
+        self.assertFalse(BusinessRatingSummary.objects.filter(business_user_id=business_user_id).exists())
+        call_command("rebuild_rating_summaries", "--check", stdout=StringIO())
+
+    def test_rebuild_command(self):
+        """Test if the rebuild command detects and repairs summaries after bulk updates."""
+        Review.objects.update(rating=3)
+
+        with self.assertRaises(CommandError):
+            call_command("rebuild_rating_summaries", "--check", stdout=StringIO())
+
+        call_command("rebuild_rating_summaries", stdout=StringIO())
+        call_command("rebuild_rating_summaries", "--check", stdout=StringIO())
+        self.assertEqual(self.get_summary(self.first_business_user), (1, 3, [0, 0, 1, 0, 0]))
@@ -5,6 +5,7 @@ from rest_framework import status
 from django.contrib.auth import get_user_model
 from rest_framework.authtoken.models import Token
 from reviews_app.models import Review
+from core.idempotency import get_cache as get_idempotency_cache
 
 User = get_user_model()
 
@@ -142,6 +143,18 @@ class ReviewCreateTestCase(ReviewTestSetup):
         )
         self.assertEqual(response.data["rating"], self.second_review_example_post["rating"])
 
+    def test_post_review_idempotency_key(self):
+        self.authenticate_user(self.types[1])
+        url = reverse("review-list")
+        get_idempotency_cache().clear()
+
+        first = self.client.post(url, self.second_review_example_post, format="json", HTTP_IDEMPOTENCY_KEY="review-1")
+        retry = self.client.post(url, self.second_review_example_post, format="json", HTTP_IDEMPOTENCY_KEY="review-1")
+
+        self.assertEqual(retry.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.data, first.data)
+        self.assertEqual(Review.objects.filter(reviewer=self.first_customer_user).count(), 1)
+
     def test_post_review_same_business_user(self):
         self.authenticate_user(self.types[1], "2")
         url = reverse("review-list")
@@ -149,6 +162,25 @@ class ReviewCreateTestCase(ReviewTestSetup):
         response = self.client.post(url, self.first_review_example_post, format="json")
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
+    def test_post_review_query_count(self):
+        self.authenticate_user(self.types[1])
+        url = reverse("review-list")
+
+        # token, business user, savepoint, insert, summary update, platform stats update, release savepoint
+        with self.assertNumQueries(7):
+            response = self.client.post(url, self.first_review_example_post, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_post_review_duplicate_keeps_summary(self):
+        self.authenticate_user(self.types[1], "2")
+        url = reverse("review-list")
+
+        response = self.client.post(url, self.first_review_example_post, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Review.objects.filter(reviewer=self.second_customer_user).get().rating, 1)
+        self.assertEqual(self.first_business_user.rating_summary.review_count, 1)
+
     def test_post_review_wrong_data(self):
         self.authenticate_user(self.types[1], "1")
         url = reverse("review-list")